@@ -2,9 +2,9 @@
 
 
 module Braggle exposing
-    ( Attributes, TagChildren(..), Tag, ElementElementKind(..), ElementKind(..), Element, PartialServerState, PollRequest, PollResponse, ClickEvent, TextInputEvent, InteractionKind(..), Interaction, InteractionRequest, InteractionResponse
-    , attributesDecoder, tagDecoder, elementDecoder, partialServerStateDecoder, pollRequestDecoder, pollResponseDecoder, clickEventDecoder, textInputEventDecoder, interactionDecoder, interactionRequestDecoder, interactionResponseDecoder
-    , toAttributesEncoder, toTagEncoder, toElementEncoder, toPartialServerStateEncoder, toPollRequestEncoder, toPollResponseEncoder, toClickEventEncoder, toTextInputEventEncoder, toInteractionEncoder, toInteractionRequestEncoder, toInteractionResponseEncoder
+    ( Attributes, TagChildren(..), Tag, Series, Chart, TemplateInstanceSlots(..), TemplateInstance, ElementElementKind(..), ElementKind(..), Element, PartialServerState, PollRequest, PollResponse, ClickEvent, TextInputEvent, SlideEvent, PointerMoveEvent, InteractionKind(..), Interaction, InteractionRequest, InteractionResponse, PaintReport, PaintReportRequest
+    , attributesDecoder, tagDecoder, seriesDecoder, chartDecoder, templateInstanceDecoder, elementDecoder, partialServerStateDecoder, pollRequestDecoder, pollResponseDecoder, clickEventDecoder, textInputEventDecoder, slideEventDecoder, pointerMoveEventDecoder, interactionDecoder, interactionRequestDecoder, interactionResponseDecoder, paintReportDecoder, paintReportRequestDecoder
+    , toAttributesEncoder, toTagEncoder, toSeriesEncoder, toChartEncoder, toTemplateInstanceEncoder, toElementEncoder, toPartialServerStateEncoder, toPollRequestEncoder, toPollResponseEncoder, toClickEventEncoder, toTextInputEventEncoder, toSlideEventEncoder, toPointerMoveEventEncoder, toInteractionEncoder, toInteractionRequestEncoder, toInteractionResponseEncoder, toPaintReportEncoder, toPaintReportRequestEncoder
     )
 
 {-| ProtoBuf module: `Braggle`
@@ -20,17 +20,17 @@ To run it use [`elm-protocol-buffers`](https://package.elm-lang.org/packages/eri
 
 # Model
 
-@docs Attributes, TagChildren, Tag, ElementElementKind, ElementKind, Element, PartialServerState, PollRequest, PollResponse, ClickEvent, TextInputEvent, InteractionKind, Interaction, InteractionRequest, InteractionResponse
+@docs Attributes, TagChildren, Tag, Series, Chart, TemplateInstanceSlots, TemplateInstance, ElementElementKind, ElementKind, Element, PartialServerState, PollRequest, PollResponse, ClickEvent, TextInputEvent, SlideEvent, PointerMoveEvent, InteractionKind, Interaction, InteractionRequest, InteractionResponse, PaintReport, PaintReportRequest
 
 
 # Decoder
 
-@docs attributesDecoder, tagDecoder, elementDecoder, partialServerStateDecoder, pollRequestDecoder, pollResponseDecoder, clickEventDecoder, textInputEventDecoder, interactionDecoder, interactionRequestDecoder, interactionResponseDecoder
+@docs attributesDecoder, tagDecoder, seriesDecoder, chartDecoder, templateInstanceDecoder, elementDecoder, partialServerStateDecoder, pollRequestDecoder, pollResponseDecoder, clickEventDecoder, textInputEventDecoder, slideEventDecoder, pointerMoveEventDecoder, interactionDecoder, interactionRequestDecoder, interactionResponseDecoder, paintReportDecoder, paintReportRequestDecoder
 
 
 # Encoder
 
-@docs toAttributesEncoder, toTagEncoder, toElementEncoder, toPartialServerStateEncoder, toPollRequestEncoder, toPollResponseEncoder, toClickEventEncoder, toTextInputEventEncoder, toInteractionEncoder, toInteractionRequestEncoder, toInteractionResponseEncoder
+@docs toAttributesEncoder, toTagEncoder, toSeriesEncoder, toChartEncoder, toTemplateInstanceEncoder, toElementEncoder, toPartialServerStateEncoder, toPollRequestEncoder, toPollResponseEncoder, toClickEventEncoder, toTextInputEventEncoder, toSlideEventEncoder, toPointerMoveEventEncoder, toInteractionEncoder, toInteractionRequestEncoder, toInteractionResponseEncoder, toPaintReportEncoder, toPaintReportRequestEncoder
 
 -}
 
@@ -65,6 +65,40 @@ type alias Tag =
     }
 
 
+{-| `Series` message
+-}
+type alias Series =
+    { name : String
+    , x : List Float
+    , y : List Float
+    }
+
+
+{-| `Chart` message
+-}
+type alias Chart =
+    { series : List Series
+    , isDelta : Bool
+    , retention : Int
+    , width : Int
+    , height : Int
+    }
+
+
+{-| TemplateInstanceSlots
+-}
+type TemplateInstanceSlots
+    = TemplateInstanceSlots (List Element)
+
+
+{-| `TemplateInstance` message
+-}
+type alias TemplateInstance =
+    { templateId : Int
+    , slots : TemplateInstanceSlots
+    }
+
+
 {-| ElementElementKind
 -}
 type ElementElementKind
@@ -74,9 +108,13 @@ type ElementElementKind
 {-| ElementKind
 -}
 type ElementKind
-    = ElementKindRef String
+    = ElementKindRef Int
     | ElementKindText String
     | ElementKindTag Tag
+    | ElementKindChart Chart
+    | ElementKindRawHtml String
+    | ElementKindSlot Int
+    | ElementKindInstance TemplateInstance
 
 
 {-| `Element` message
@@ -90,8 +128,9 @@ type alias Element =
 -}
 type alias PartialServerState =
     { timestep : Int
-    , rootId : String
-    , elements : Dict.Dict String (Maybe Element)
+    , rootId : Int
+    , elements : Dict.Dict Int (Maybe Element)
+    , stylesheetId : Int
     }
 
 
@@ -99,6 +138,7 @@ type alias PartialServerState =
 -}
 type alias PollRequest =
     { sinceTimestep : Int
+    , knownTemplates : Int
     }
 
 
@@ -106,29 +146,51 @@ type alias PollRequest =
 -}
 type alias PollResponse =
     { state : Maybe PartialServerState
+    , templates : Dict.Dict Int (Maybe Element)
+    , traceIds : List Int
     }
 
 
 {-| `ClickEvent` message
 -}
 type alias ClickEvent =
-    { elementId : String
+    { elementId : Int
     }
 
 
 {-| `TextInputEvent` message
 -}
 type alias TextInputEvent =
-    { elementId : String
+    { elementId : Int
     , value : String
     }
 
 
+{-| `SlideEvent` message
+-}
+type alias SlideEvent =
+    { elementId : Int
+    , value : Float
+    }
+
+
+{-| `PointerMoveEvent` message
+-}
+type alias PointerMoveEvent =
+    { elementId : Int
+    , x : Float
+    , y : Float
+    , pressed : Bool
+    }
+
+
 {-| InteractionKind
 -}
 type InteractionKind
     = InteractionKindClick ClickEvent
     | InteractionKindTextInput TextInputEvent
+    | InteractionKindSlide SlideEvent
+    | InteractionKindPointerMove PointerMoveEvent
 
 
 {-| `Interaction` message
@@ -148,7 +210,25 @@ type alias InteractionRequest =
 {-| `InteractionResponse` message
 -}
 type alias InteractionResponse =
-    {}
+    { traceId : Int
+    }
+
+
+{-| `PaintReport` message
+-}
+type alias PaintReport =
+    { traceId : Int
+    , endToEndMs : Float
+    , roundTripMs : Float
+    , renderMs : Float
+    }
+
+
+{-| `PaintReportRequest` message
+-}
+type alias PaintReportRequest =
+    { reports : List PaintReport
+    }
 
 
 
@@ -180,6 +260,45 @@ tagDecoder =
         ]
 
 
+{-| `Series` decoder
+-}
+seriesDecoder : Decode.Decoder Series
+seriesDecoder =
+    Decode.message (Series "" [] [])
+        [ Decode.optional 1 Decode.string setName
+        , Decode.repeated 2 Decode.double .x setX
+        , Decode.repeated 3 Decode.double .y setY
+        ]
+
+
+{-| `Chart` decoder
+-}
+chartDecoder : Decode.Decoder Chart
+chartDecoder =
+    Decode.message (Chart [] False 0 0 0)
+        [ Decode.repeated 1 seriesDecoder .series setSeries
+        , Decode.optional 2 Decode.bool setIsDelta
+        , Decode.optional 3 Decode.int32 setRetention
+        , Decode.optional 4 Decode.int32 setWidth
+        , Decode.optional 5 Decode.int32 setHeight
+        ]
+
+
+unwrapTemplateInstanceSlots : TemplateInstanceSlots -> List Element
+unwrapTemplateInstanceSlots (TemplateInstanceSlots value) =
+    value
+
+
+{-| `TemplateInstance` decoder
+-}
+templateInstanceDecoder : Decode.Decoder TemplateInstance
+templateInstanceDecoder =
+    Decode.message (TemplateInstance 0 (TemplateInstanceSlots []))
+        [ Decode.optional 1 Decode.int32 setTemplateId
+        , Decode.repeated 2 (Decode.lazy (\_ -> elementDecoder)) (unwrapTemplateInstanceSlots << .slots) (setSlots << TemplateInstanceSlots)
+        ]
+
+
 unwrapElementElementKind : ElementElementKind -> Maybe ElementKind
 unwrapElementElementKind (ElementElementKind value) =
     value
@@ -191,9 +310,13 @@ elementDecoder : Decode.Decoder Element
 elementDecoder =
     Decode.message (Element (ElementElementKind Nothing))
         [ Decode.oneOf
-            [ ( 1, Decode.lazy (\_ -> Decode.map ElementKindRef Decode.string) )
+            [ ( 1, Decode.lazy (\_ -> Decode.map ElementKindRef Decode.uint32) )
             , ( 2, Decode.lazy (\_ -> Decode.map ElementKindText Decode.string) )
             , ( 3, Decode.lazy (\_ -> Decode.map ElementKindTag tagDecoder) )
+            , ( 4, Decode.lazy (\_ -> Decode.map ElementKindChart chartDecoder) )
+            , ( 5, Decode.lazy (\_ -> Decode.map ElementKindRawHtml Decode.string) )
+            , ( 6, Decode.lazy (\_ -> Decode.map ElementKindSlot Decode.int32) )
+            , ( 7, Decode.lazy (\_ -> Decode.map ElementKindInstance templateInstanceDecoder) )
             ]
             (setElementKind << ElementElementKind)
         ]
@@ -203,10 +326,11 @@ elementDecoder =
 -}
 partialServerStateDecoder : Decode.Decoder PartialServerState
 partialServerStateDecoder =
-    Decode.message (PartialServerState 0 "" Dict.empty)
+    Decode.message (PartialServerState 0 0 Dict.empty 0)
         [ Decode.optional 1 Decode.int32 setTimestep
-        , Decode.optional 2 Decode.string setRootId
-        , Decode.mapped 3 ( "", Nothing ) Decode.string (Decode.map Just elementDecoder) .elements setElements
+        , Decode.optional 2 Decode.uint32 setRootId
+        , Decode.mapped 3 ( 0, Nothing ) Decode.uint32 (Decode.map Just elementDecoder) .elements setElements
+        , Decode.optional 4 Decode.uint32 setStylesheetId
         ]
 
 
@@ -214,8 +338,9 @@ partialServerStateDecoder =
 -}
 pollRequestDecoder : Decode.Decoder PollRequest
 pollRequestDecoder =
-    Decode.message (PollRequest 0)
+    Decode.message (PollRequest 0 0)
         [ Decode.optional 1 Decode.int32 setSinceTimestep
+        , Decode.optional 2 Decode.int32 setKnownTemplates
         ]
 
 
@@ -223,8 +348,10 @@ pollRequestDecoder =
 -}
 pollResponseDecoder : Decode.Decoder PollResponse
 pollResponseDecoder =
-    Decode.message (PollResponse Nothing)
+    Decode.message (PollResponse Nothing Dict.empty [])
         [ Decode.optional 1 (Decode.map Just partialServerStateDecoder) setState
+        , Decode.mapped 2 ( 0, Nothing ) Decode.int32 (Decode.map Just elementDecoder) .templates setTemplates
+        , Decode.repeated 3 Decode.uint32 .traceIds setTraceIds
         ]
 
 
@@ -232,8 +359,8 @@ pollResponseDecoder =
 -}
 clickEventDecoder : Decode.Decoder ClickEvent
 clickEventDecoder =
-    Decode.message (ClickEvent "")
-        [ Decode.optional 1 Decode.string setElementId
+    Decode.message (ClickEvent 0)
+        [ Decode.optional 1 Decode.uint32 setElementId
         ]
 
 
@@ -241,12 +368,34 @@ clickEventDecoder =
 -}
 textInputEventDecoder : Decode.Decoder TextInputEvent
 textInputEventDecoder =
-    Decode.message (TextInputEvent "" "")
-        [ Decode.optional 1 Decode.string setElementId
+    Decode.message (TextInputEvent 0 "")
+        [ Decode.optional 1 Decode.uint32 setElementId
         , Decode.optional 2 Decode.string setValue
         ]
 
 
+{-| `SlideEvent` decoder
+-}
+slideEventDecoder : Decode.Decoder SlideEvent
+slideEventDecoder =
+    Decode.message (SlideEvent 0 0)
+        [ Decode.optional 1 Decode.uint32 setElementId
+        , Decode.optional 2 Decode.double setValue
+        ]
+
+
+{-| `PointerMoveEvent` decoder
+-}
+pointerMoveEventDecoder : Decode.Decoder PointerMoveEvent
+pointerMoveEventDecoder =
+    Decode.message (PointerMoveEvent 0 0 0 False)
+        [ Decode.optional 1 Decode.uint32 setElementId
+        , Decode.optional 2 Decode.double setX
+        , Decode.optional 3 Decode.double setY
+        , Decode.optional 4 Decode.bool setPressed
+        ]
+
+
 {-| `Interaction` decoder
 -}
 interactionDecoder : Decode.Decoder Interaction
@@ -255,6 +404,8 @@ interactionDecoder =
         [ Decode.oneOf
             [ ( 1, Decode.map InteractionKindClick clickEventDecoder )
             , ( 2, Decode.map InteractionKindTextInput textInputEventDecoder )
+            , ( 3, Decode.map InteractionKindSlide slideEventDecoder )
+            , ( 4, Decode.map InteractionKindPointerMove pointerMoveEventDecoder )
             ]
             setInteractionKind
         ]
@@ -273,8 +424,30 @@ interactionRequestDecoder =
 -}
 interactionResponseDecoder : Decode.Decoder InteractionResponse
 interactionResponseDecoder =
-    Decode.message InteractionResponse
-        []
+    Decode.message (InteractionResponse 0)
+        [ Decode.optional 1 Decode.uint32 setTraceId
+        ]
+
+
+{-| `PaintReport` decoder
+-}
+paintReportDecoder : Decode.Decoder PaintReport
+paintReportDecoder =
+    Decode.message (PaintReport 0 0 0 0)
+        [ Decode.optional 1 Decode.uint32 setTraceId
+        , Decode.optional 2 Decode.double setEndToEndMs
+        , Decode.optional 3 Decode.double setRoundTripMs
+        , Decode.optional 4 Decode.double setRenderMs
+        ]
+
+
+{-| `PaintReportRequest` decoder
+-}
+paintReportRequestDecoder : Decode.Decoder PaintReportRequest
+paintReportRequestDecoder =
+    Decode.message (PaintReportRequest [])
+        [ Decode.repeated 1 paintReportDecoder .reports setReports
+        ]
 
 
 
@@ -301,11 +474,45 @@ toTagEncoder model =
         ]
 
 
+{-| `Series` encoder
+-}
+toSeriesEncoder : Series -> Encode.Encoder
+toSeriesEncoder model =
+    Encode.message
+        [ ( 1, Encode.string model.name )
+        , ( 2, Encode.list Encode.double model.x )
+        , ( 3, Encode.list Encode.double model.y )
+        ]
+
+
+{-| `Chart` encoder
+-}
+toChartEncoder : Chart -> Encode.Encoder
+toChartEncoder model =
+    Encode.message
+        [ ( 1, Encode.list toSeriesEncoder model.series )
+        , ( 2, Encode.bool model.isDelta )
+        , ( 3, Encode.int32 model.retention )
+        , ( 4, Encode.int32 model.width )
+        , ( 5, Encode.int32 model.height )
+        ]
+
+
+{-| `TemplateInstance` encoder
+-}
+toTemplateInstanceEncoder : TemplateInstance -> Encode.Encoder
+toTemplateInstanceEncoder model =
+    Encode.message
+        [ ( 1, Encode.int32 model.templateId )
+        , ( 2, Encode.list toElementEncoder (unwrapTemplateInstanceSlots model.slots) )
+        ]
+
+
 toElementKindEncoder : ElementKind -> ( Int, Encode.Encoder )
 toElementKindEncoder model =
     case model of
         ElementKindRef value ->
-            ( 1, Encode.string value )
+            ( 1, Encode.uint32 value )
 
         ElementKindText value ->
             ( 2, Encode.string value )
@@ -313,6 +520,18 @@ toElementKindEncoder model =
         ElementKindTag value ->
             ( 3, toTagEncoder value )
 
+        ElementKindChart value ->
+            ( 4, toChartEncoder value )
+
+        ElementKindRawHtml value ->
+            ( 5, Encode.string value )
+
+        ElementKindSlot value ->
+            ( 6, Encode.int32 value )
+
+        ElementKindInstance value ->
+            ( 7, toTemplateInstanceEncoder value )
+
 
 {-| `Element` encoder
 -}
@@ -329,8 +548,9 @@ toPartialServerStateEncoder : PartialServerState -> Encode.Encoder
 toPartialServerStateEncoder model =
     Encode.message
         [ ( 1, Encode.int32 model.timestep )
-        , ( 2, Encode.string model.rootId )
-        , ( 3, Encode.dict Encode.string (Maybe.withDefault Encode.none << Maybe.map toElementEncoder) model.elements )
+        , ( 2, Encode.uint32 model.rootId )
+        , ( 3, Encode.dict Encode.uint32 (Maybe.withDefault Encode.none << Maybe.map toElementEncoder) model.elements )
+        , ( 4, Encode.uint32 model.stylesheetId )
         ]
 
 
@@ -340,6 +560,7 @@ toPollRequestEncoder : PollRequest -> Encode.Encoder
 toPollRequestEncoder model =
     Encode.message
         [ ( 1, Encode.int32 model.sinceTimestep )
+        , ( 2, Encode.int32 model.knownTemplates )
         ]
 
 
@@ -349,6 +570,8 @@ toPollResponseEncoder : PollResponse -> Encode.Encoder
 toPollResponseEncoder model =
     Encode.message
         [ ( 1, (Maybe.withDefault Encode.none << Maybe.map toPartialServerStateEncoder) model.state )
+        , ( 2, Encode.dict Encode.int32 (Maybe.withDefault Encode.none << Maybe.map toElementEncoder) model.templates )
+        , ( 3, Encode.list Encode.uint32 model.traceIds )
         ]
 
 
@@ -357,7 +580,7 @@ toPollResponseEncoder model =
 toClickEventEncoder : ClickEvent -> Encode.Encoder
 toClickEventEncoder model =
     Encode.message
-        [ ( 1, Encode.string model.elementId )
+        [ ( 1, Encode.uint32 model.elementId )
         ]
 
 
@@ -366,11 +589,33 @@ toClickEventEncoder model =
 toTextInputEventEncoder : TextInputEvent -> Encode.Encoder
 toTextInputEventEncoder model =
     Encode.message
-        [ ( 1, Encode.string model.elementId )
+        [ ( 1, Encode.uint32 model.elementId )
         , ( 2, Encode.string model.value )
         ]
 
 
+{-| `SlideEvent` encoder
+-}
+toSlideEventEncoder : SlideEvent -> Encode.Encoder
+toSlideEventEncoder model =
+    Encode.message
+        [ ( 1, Encode.uint32 model.elementId )
+        , ( 2, Encode.double model.value )
+        ]
+
+
+{-| `PointerMoveEvent` encoder
+-}
+toPointerMoveEventEncoder : PointerMoveEvent -> Encode.Encoder
+toPointerMoveEventEncoder model =
+    Encode.message
+        [ ( 1, Encode.uint32 model.elementId )
+        , ( 2, Encode.double model.x )
+        , ( 3, Encode.double model.y )
+        , ( 4, Encode.bool model.pressed )
+        ]
+
+
 toInteractionKindEncoder : InteractionKind -> ( Int, Encode.Encoder )
 toInteractionKindEncoder model =
     case model of
@@ -380,6 +625,12 @@ toInteractionKindEncoder model =
         InteractionKindTextInput value ->
             ( 2, toTextInputEventEncoder value )
 
+        InteractionKindSlide value ->
+            ( 3, toSlideEventEncoder value )
+
+        InteractionKindPointerMove value ->
+            ( 4, toPointerMoveEventEncoder value )
+
 
 {-| `Interaction` encoder
 -}
@@ -404,7 +655,29 @@ toInteractionRequestEncoder model =
 toInteractionResponseEncoder : InteractionResponse -> Encode.Encoder
 toInteractionResponseEncoder model =
     Encode.message
-        []
+        [ ( 1, Encode.uint32 model.traceId )
+        ]
+
+
+{-| `PaintReport` encoder
+-}
+toPaintReportEncoder : PaintReport -> Encode.Encoder
+toPaintReportEncoder model =
+    Encode.message
+        [ ( 1, Encode.uint32 model.traceId )
+        , ( 2, Encode.double model.endToEndMs )
+        , ( 3, Encode.double model.roundTripMs )
+        , ( 4, Encode.double model.renderMs )
+        ]
+
+
+{-| `PaintReportRequest` encoder
+-}
+toPaintReportRequestEncoder : PaintReportRequest -> Encode.Encoder
+toPaintReportRequestEncoder model =
+    Encode.message
+        [ ( 1, Encode.list toPaintReportEncoder model.reports )
+        ]
 
 
 
@@ -431,6 +704,46 @@ setChildren value model =
     { model | children = value }
 
 
+setName : a -> { b | name : a } -> { b | name : a }
+setName value model =
+    { model | name = value }
+
+
+setSeries : a -> { b | series : a } -> { b | series : a }
+setSeries value model =
+    { model | series = value }
+
+
+setIsDelta : a -> { b | isDelta : a } -> { b | isDelta : a }
+setIsDelta value model =
+    { model | isDelta = value }
+
+
+setRetention : a -> { b | retention : a } -> { b | retention : a }
+setRetention value model =
+    { model | retention = value }
+
+
+setWidth : a -> { b | width : a } -> { b | width : a }
+setWidth value model =
+    { model | width = value }
+
+
+setHeight : a -> { b | height : a } -> { b | height : a }
+setHeight value model =
+    { model | height = value }
+
+
+setTemplateId : a -> { b | templateId : a } -> { b | templateId : a }
+setTemplateId value model =
+    { model | templateId = value }
+
+
+setSlots : a -> { b | slots : a } -> { b | slots : a }
+setSlots value model =
+    { model | slots = value }
+
+
 setElementKind : a -> { b | elementKind : a } -> { b | elementKind : a }
 setElementKind value model =
     { model | elementKind = value }
@@ -451,11 +764,21 @@ setElements value model =
     { model | elements = value }
 
 
+setStylesheetId : a -> { b | stylesheetId : a } -> { b | stylesheetId : a }
+setStylesheetId value model =
+    { model | stylesheetId = value }
+
+
 setSinceTimestep : a -> { b | sinceTimestep : a } -> { b | sinceTimestep : a }
 setSinceTimestep value model =
     { model | sinceTimestep = value }
 
 
+setKnownTemplates : a -> { b | knownTemplates : a } -> { b | knownTemplates : a }
+setKnownTemplates value model =
+    { model | knownTemplates = value }
+
+
 setState : a -> { b | state : a } -> { b | state : a }
 setState value model =
     { model | state = value }
@@ -471,6 +794,26 @@ setValue value model =
     { model | value = value }
 
 
+setX : a -> { b | x : a } -> { b | x : a }
+setX value model =
+    { model | x = value }
+
+
+setY : a -> { b | y : a } -> { b | y : a }
+setY value model =
+    { model | y = value }
+
+
+setPressed : a -> { b | pressed : a } -> { b | pressed : a }
+setPressed value model =
+    { model | pressed = value }
+
+
+setTemplates : a -> { b | templates : a } -> { b | templates : a }
+setTemplates value model =
+    { model | templates = value }
+
+
 setInteractionKind : a -> { b | interactionKind : a } -> { b | interactionKind : a }
 setInteractionKind value model =
     { model | interactionKind = value }
@@ -479,3 +822,33 @@ setInteractionKind value model =
 setInteraction : a -> { b | interaction : a } -> { b | interaction : a }
 setInteraction value model =
     { model | interaction = value }
+
+
+setTraceIds : a -> { b | traceIds : a } -> { b | traceIds : a }
+setTraceIds value model =
+    { model | traceIds = value }
+
+
+setTraceId : a -> { b | traceId : a } -> { b | traceId : a }
+setTraceId value model =
+    { model | traceId = value }
+
+
+setEndToEndMs : a -> { b | endToEndMs : a } -> { b | endToEndMs : a }
+setEndToEndMs value model =
+    { model | endToEndMs = value }
+
+
+setRoundTripMs : a -> { b | roundTripMs : a } -> { b | roundTripMs : a }
+setRoundTripMs value model =
+    { model | roundTripMs = value }
+
+
+setRenderMs : a -> { b | renderMs : a } -> { b | renderMs : a }
+setRenderMs value model =
+    { model | renderMs = value }
+
+
+setReports : a -> { b | reports : a } -> { b | reports : a }
+setReports value model =
+    { model | reports = value }
@@ -1,11 +1,18 @@
 import Browser
+import Browser.Events
+import Browser.Navigation
 import Dict
 import Html exposing (Attribute, Html, node, text)
-import Html.Attributes exposing (attribute)
-import Html.Events exposing (onClick, onInput)
+import Html.Attributes exposing (attribute, property)
+import Html.Events exposing (on, onClick, onInput)
 import Http
 import Json.Decode as D
 import Json.Encode as E
+import Process
+import Svg
+import Svg.Attributes as SA
+import Task
+import Time
 import Url
 import Url.Parser
 
@@ -13,119 +20,313 @@ import Braggle
 import Protobuf.Decode
 import Protobuf.Encode
 
-type alias Id = String
+type alias Id = Int
 
 type alias Timestep = Int
 
+type alias Templates = Dict.Dict Int Braggle.Element
+
 type alias Model =
-    { serverState : { timestep: Timestep , root : Id , elements : Dict.Dict Id Element}
+    { serverState : { timestep: Timestep , root : Id , stylesheet : Id , elements : Dict.Dict Id Element}
+    , throttled : Dict.Dict Id (Float, Interaction)
+    , hidden : Bool
+    , templates : Templates
+    , tracing : Tracing
+    }
+
+-- Timings (in ms since the epoch) of traced interactions, for reporting back to the
+-- server: a trace is reported once we know both when we sent it (from the server's
+-- response) and when its effects were painted (from the poll that delivered them),
+-- which can happen in either order.
+type alias Tracing =
+    { sent : Dict.Dict Int { sentAt : Float, roundTripMs : Float }
+    , unpainted : List (Float, List Int)
+    , painted : Dict.Dict Int { receivedAt : Float, paintedAt : Float }
     }
+
 type Msg
     = Interacted Interaction
-    | PollCompleted Braggle.PartialServerState
+    | Throttled Float Interaction
+    | FlushThrottled
+    | Send Interaction Time.Posix
+    | Acked Float (Result Http.Error Braggle.InteractionResponse)
+    | AckedAt Float Int Time.Posix
+    | UpdateReceived (List Int) Time.Posix
+    | Painted Time.Posix
+    | PollCompleted Braggle.PartialServerState Templates (List Int)
     | PollFailed Http.Error
+    | RetryPoll
+    | VisibilityChanged Browser.Events.Visibility
     | Ignore
 
-must : Maybe a -> a
-must mx =
-    case mx of
-        Just x -> x
-        Nothing -> Debug.todo "bad must call"
+-- Protobuf makes every message-typed field optional; the server always fills in
+-- elements, but a missing one should render as invalid rather than crash.
+orInvalid : Maybe Braggle.Element -> Braggle.Element
+orInvalid = Maybe.withDefault {elementKind = Braggle.ElementElementKind Nothing}
 
-type Interaction = Clicked Id | TextInputted Id String
+type Interaction
+    = Clicked Id
+    | TextInputted Id String
+    | Slid Id Float
+    | PointerMoved Id Float Float Bool
 interactionToProtobuf : Interaction -> Braggle.Interaction
 interactionToProtobuf interaction =
     case interaction of
         Clicked id -> Braggle.Interaction <| Just <| Braggle.InteractionKindClick {elementId = id}
         TextInputted id value -> Braggle.Interaction <| Just <| Braggle.InteractionKindTextInput {elementId = id, value = value}
+        Slid id value -> Braggle.Interaction <| Just <| Braggle.InteractionKindSlide {elementId = id, value = value}
+        PointerMoved id x y pressed -> Braggle.Interaction <| Just <| Braggle.InteractionKindPointerMove {elementId = id, x = x, y = y, pressed = pressed}
+
+interactionElementId : Interaction -> Id
+interactionElementId interaction =
+    case interaction of
+        Clicked id -> id
+        TextInputted id _ -> id
+        Slid id _ -> id
+        PointerMoved id _ _ _ -> id
 
 type Element
     = Ref Id
     | Text String
-    | Tag {tagname : String, attributes : List (Attribute Msg), children : (List Element)}
-tagFromProtobuf : Braggle.Tag -> Element
-tagFromProtobuf tag =
-    let attributes = must tag.attributes in
+    | Tag {tagname : String, rawAttributes : Dict.Dict String String, attributes : List (Attribute Msg), children : (List Element)}
+    | Chart ChartData
+    | RawHtml String
+type alias ChartData =
+    { series : List {name : String, xs : List Float, ys : List Float}
+    , isDelta : Bool
+    , retention : Int
+    , width : Int
+    , height : Int
+    }
+tagFromProtobuf : Templates -> Braggle.Tag -> Element
+tagFromProtobuf templates tag =
+    let attributes = tag.attributes |> Maybe.withDefault {misc = Dict.empty} in
     Tag
         { tagname = tag.tagname
+        , rawAttributes = attributes.misc
         , attributes = attributes.misc |> Dict.toList |> List.map (\(k, v) -> attribute k v)
         , children = tag.children
             |> (\x -> case x of Braggle.TagChildren childrenList -> childrenList)
-            |> List.map elementFromProtobuf
+            |> List.map (elementFromProtobuf templates)
         }
-elementFromProtobuf : Braggle.Element -> Element
-elementFromProtobuf {elementKind} =
+
+-- Replace a template body's slot placeholders with the given elements.
+fillSlots : List Braggle.Element -> Braggle.Element -> Braggle.Element
+fillSlots slots element =
+    case element.elementKind of
+        Braggle.ElementElementKind (Just (Braggle.ElementKindSlot i)) ->
+            slots |> List.drop i |> List.head |> orInvalid
+        Braggle.ElementElementKind (Just (Braggle.ElementKindTag tag)) ->
+            let (Braggle.TagChildren children) = tag.children in
+            {elementKind = Braggle.ElementElementKind (Just (Braggle.ElementKindTag { tag | children = Braggle.TagChildren (List.map (fillSlots slots) children) }))}
+        _ -> element
+
+elementFromProtobuf : Templates -> Braggle.Element -> Element
+elementFromProtobuf templates {elementKind} =
     case elementKind of
         Braggle.ElementElementKind Nothing -> Text "invalid protobuf"
         Braggle.ElementElementKind (Just (Braggle.ElementKindRef refId)) -> Ref refId
         Braggle.ElementElementKind (Just (Braggle.ElementKindText text)) -> Text text
-        Braggle.ElementElementKind (Just (Braggle.ElementKindTag tag)) -> tagFromProtobuf tag
+        Braggle.ElementElementKind (Just (Braggle.ElementKindTag tag)) -> tagFromProtobuf templates tag
+        Braggle.ElementElementKind (Just (Braggle.ElementKindSlot _)) -> Text "invalid protobuf"
+        Braggle.ElementElementKind (Just (Braggle.ElementKindInstance {templateId, slots})) ->
+            case Dict.get templateId templates of
+                Nothing -> Text "unknown template"
+                Just body ->
+                    let (Braggle.TemplateInstanceSlots slotList) = slots in
+                    elementFromProtobuf templates (fillSlots slotList body)
+        Braggle.ElementElementKind (Just (Braggle.ElementKindRawHtml html)) -> RawHtml html
+        Braggle.ElementElementKind (Just (Braggle.ElementKindChart chart)) ->
+            Chart
+                { series = chart.series |> List.map (\s -> {name = s.name, xs = s.x, ys = s.y})
+                , isDelta = chart.isDelta
+                , retention = chart.retention
+                , width = chart.width
+                , height = chart.height
+                }
+
+-- Most updates replace an element outright, but a chart may instead just send
+-- the points appended since our last poll.
+mergeElement : Id -> Element -> Dict.Dict Id Element -> Dict.Dict Id Element
+mergeElement id new elements =
+    case (new, Dict.get id elements) of
+        (Chart delta, Just (Chart old)) ->
+            if delta.isDelta then
+                let
+                    keepRecent xs = List.drop (List.length xs - old.retention) xs
+                    extend series =
+                        case delta.series |> List.filter (\s -> s.name == series.name) |> List.head of
+                            Nothing -> series
+                            Just appended -> { series | xs = keepRecent (series.xs ++ appended.xs), ys = keepRecent (series.ys ++ appended.ys) }
+                in
+                    Dict.insert id (Chart { old | series = List.map extend old.series }) elements
+            else
+                Dict.insert id new elements
+        _ -> Dict.insert id new elements
 
-poll : Timestep -> Cmd Msg
-poll ts =
+poll : Timestep -> Templates -> Cmd Msg
+poll ts templates =
     let
         fromResult : Result Http.Error Braggle.PollResponse -> Msg
         fromResult result = case result of
-            Ok {state} -> case state of
-                Just bareState -> PollCompleted bareState
-                Nothing -> Debug.todo "some kind of error"
+            Ok response -> case response.state of
+                Just bareState -> PollCompleted bareState (response.templates |> Dict.map (\_ -> orInvalid)) response.traceIds
+                Nothing -> PollFailed (Http.BadBody "poll response without a state")
             Err err -> PollFailed err
     in
-        Http.post
-            { url = "/poll"
+        Http.request
+            { method = "POST"
+            , headers = []
+            , url = "poll"
             , body = Http.bytesBody "application/octet-stream"
                 <| Protobuf.Encode.encode
-                <| Braggle.toPollRequestEncoder {sinceTimestep = ts}
+                <| Braggle.toPollRequestEncoder {sinceTimestep = ts, knownTemplates = Dict.size templates}
             , expect = Protobuf.Decode.expectBytes fromResult Braggle.pollResponseDecoder
+            , timeout = Nothing
+            , tracker = Just pollTracker
             }
 
-notify : Interaction -> Cmd Msg
-notify interaction =
+pollTracker : String
+pollTracker = "poll"
+
+-- Interactions are timestamped on their way out, for tracing.
+send : Interaction -> Cmd Msg
+send interaction = Task.perform (Send interaction) Time.now
+
+notify : Float -> Interaction -> Cmd Msg
+notify sentAt interaction =
     Http.post
-        { url = "/interaction"
+        { url = "interaction"
         , body = Http.bytesBody "application/octet-stream"
             <| Protobuf.Encode.encode
             <| Braggle.toInteractionRequestEncoder
                 { interaction = Just <| interactionToProtobuf interaction
                 }
+        , expect = Protobuf.Decode.expectBytes (Acked sentAt) Braggle.interactionResponseDecoder
+        }
+
+reportPaints : List Braggle.PaintReport -> Cmd Msg
+reportPaints reports =
+    if List.isEmpty reports then Cmd.none else
+    Http.post
+        { url = "trace"
+        , body = Http.bytesBody "application/octet-stream"
+            <| Protobuf.Encode.encode
+            <| Braggle.toPaintReportRequestEncoder {reports = reports}
         , expect = Http.expectWhatever (always Ignore)
         }
 
+paintReport : Int -> { sentAt : Float, roundTripMs : Float } -> { receivedAt : Float, paintedAt : Float } -> Braggle.PaintReport
+paintReport traceId sent painted =
+    { traceId = traceId
+    , endToEndMs = painted.paintedAt - sent.sentAt
+    , roundTripMs = sent.roundTripMs
+    , renderMs = painted.paintedAt - painted.receivedAt
+    }
+
+millis : Time.Posix -> Float
+millis = toFloat << Time.posixToMillis
+
 init : () -> Url.Url -> navkey -> (Model,  Cmd Msg)
 init _ _ _ =
     ( { serverState =
-        { elements = Dict.singleton "root" (Text "Loading...")
+        -- The server numbers elements from 1, so 0 is free for a placeholder.
+        { elements = Dict.singleton 0 (Text "Loading...")
         , timestep = 0
-        , root = "root"
+        , root = 0
+        , stylesheet = -1
         }
+      , throttled = Dict.empty
+      , hidden = False
+      , templates = Dict.empty
+      , tracing = { sent = Dict.empty, unpainted = [], painted = Dict.empty }
       }
-    , poll 0
+    , poll 0 Dict.empty
     )
 
 update : Msg -> Model -> (Model, Cmd Msg)
 update msg model =
     case msg of
-        Interacted interaction -> (model, notify interaction)
-        PollCompleted {timestep, rootId, elements} ->
+        Interacted interaction -> (model, send interaction)
+        Throttled intervalMs interaction ->
+            ( { model | throttled = model.throttled |> Dict.insert (interactionElementId interaction) (intervalMs, interaction) }
+            , Cmd.none
+            )
+        FlushThrottled ->
+            ( { model | throttled = Dict.empty }
+            , model.throttled |> Dict.values |> List.map (send << Tuple.second) |> Cmd.batch
+            )
+        Send interaction now -> (model, notify (millis now) interaction)
+        Acked sentAt (Ok {traceId}) ->
+            if traceId == 0 then (model, Cmd.none) else (model, Task.perform (AckedAt sentAt traceId) Time.now)
+        Acked _ (Err _) -> (model, Cmd.none)
+        AckedAt sentAt traceId now ->
+            let
+                tracing = model.tracing
+                sent = { sentAt = sentAt, roundTripMs = millis now - sentAt }
+            in
+            case Dict.get traceId tracing.painted of
+                Just painted ->
+                    ( { model | tracing = { tracing | painted = Dict.remove traceId tracing.painted } }
+                    , reportPaints [paintReport traceId sent painted]
+                    )
+                Nothing ->
+                    ({ model | tracing = { tracing | sent = Dict.insert traceId sent tracing.sent } }, Cmd.none)
+        UpdateReceived traceIds now ->
+            let tracing = model.tracing in
+            ({ model | tracing = { tracing | unpainted = (millis now, traceIds) :: tracing.unpainted } }, Cmd.none)
+        Painted now ->
+            let
+                tracing = model.tracing
+                paintedAt = millis now
+                justPainted = tracing.unpainted
+                    |> List.concatMap (\(receivedAt, ids) -> List.map (\id -> (id, { receivedAt = receivedAt, paintedAt = paintedAt })) ids)
+                (ours, others) = List.partition (\(id, _) -> Dict.member id tracing.sent) justPainted
+                reports = ours |> List.filterMap (\(id, p) -> Dict.get id tracing.sent |> Maybe.map (\sent -> paintReport id sent p))
+                -- Other clients' traces show up too; only remember them long enough for a slow InteractionResponse.
+                painted = Dict.union (Dict.fromList others) tracing.painted |> Dict.filter (\_ p -> paintedAt - p.paintedAt < 30000)
+            in
+            ( { model | tracing = { sent = List.foldl (Dict.remove << Tuple.first) tracing.sent ours, unpainted = [], painted = painted } }
+            , reportPaints reports
+            )
+        PollCompleted {timestep, rootId, stylesheetId, elements} newTemplates traceIds ->
             let
                 oldState = model.serverState
+                templates = Dict.union newTemplates model.templates
             in
-            ( { model | serverState = { oldState
+            ( { model | templates = templates, serverState = { oldState
                                         | root = rootId
-                                        , elements = oldState.elements |> Dict.union (Dict.map (\_ e -> elementFromProtobuf (must e)) elements)
+                                        , stylesheet = stylesheetId
+                                        , elements = elements |> Dict.foldl (\id e -> mergeElement id (elementFromProtobuf templates (orInvalid e))) oldState.elements
                                         , timestep = timestep
                                         }
               }
-            , poll timestep
+            , Cmd.batch
+                [ if model.hidden then Cmd.none else poll timestep templates
+                , if List.isEmpty traceIds then Cmd.none else Task.perform (UpdateReceived traceIds) Time.now
+                ]
             )
-        PollFailed err -> Debug.todo (Debug.toString err)
+        VisibilityChanged Browser.Events.Hidden ->
+            -- Stop receiving updates while nobody can see them...
+            ({ model | hidden = True }, Http.cancel pollTracker)
+        VisibilityChanged Browser.Events.Visible ->
+            -- ...and catch up in one go when somebody can again.
+            ({ model | hidden = False }, poll model.serverState.timestep model.templates)
+        -- The server's stopped serving our GUI (e.g. it evicted our session); reloading gets a new one.
+        PollFailed (Http.BadStatus 410) -> (model, Browser.Navigation.reload)
+        -- Anything else is likely transient (e.g. the server restarting), so try again shortly.
+        PollFailed _ -> (model, Process.sleep 1000 |> Task.perform (always RetryPoll))
+        RetryPoll -> (model, if model.hidden then Cmd.none else poll model.serverState.timestep model.templates)
         Ignore -> (model, Cmd.none)
 
 view : Model -> Browser.Document Msg
 view model =
     { title="Braggle"
     , body=
-        [ case Dict.get model.serverState.root model.serverState.elements of
+        [ case Dict.get model.serverState.stylesheet model.serverState.elements of
+            Nothing -> text ""
+            Just element -> viewElement model.serverState.elements model.serverState.stylesheet element
+        , case Dict.get model.serverState.root model.serverState.elements of
             Nothing -> text "<NO ROOT?>"
             Just element -> viewElement model.serverState.elements model.serverState.root element
         ]
@@ -135,23 +336,81 @@ viewElement : Dict.Dict Id Element -> Id -> Element -> Html Msg
 viewElement elements id element =
     case element of
         Text s -> Html.text s
-        Tag {tagname, attributes, children} ->
+        Tag {tagname, rawAttributes, attributes, children} ->
             let
-                allAttributes = case tagname of
-                    "button" -> onClick (Interacted (Clicked id)) :: attributes
-                    "input" -> onInput (\val -> Interacted (TextInputted id val)) :: attributes
-                    _ -> attributes
+                throttleMs = rawAttributes
+                    |> Dict.get "data-braggle-max-rate"
+                    |> Maybe.andThen String.toFloat
+                    |> Maybe.map (\rate -> 1000 / rate)
+                    |> Maybe.withDefault 0
+                throttled interaction =
+                    if throttleMs > 0 then Throttled throttleMs interaction else Interacted interaction
+                onPointer eventName =
+                    on eventName <| D.map3 (\x y buttons -> throttled (PointerMoved id x y (buttons /= 0)))
+                        (D.field "offsetX" D.float)
+                        (D.field "offsetY" D.float)
+                        (D.field "buttons" D.int)
+                allAttributes = case (tagname, Dict.get "type" rawAttributes) of
+                    ("button", _) -> onClick (Interacted (Clicked id)) :: attributes
+                    ("input", Just "range") -> onInput (\val -> throttled (Slid id (String.toFloat val |> Maybe.withDefault 0))) :: attributes
+                    ("input", _) -> onInput (\val -> Interacted (TextInputted id val)) :: attributes
+                    _ -> if Dict.member "data-braggle-pointer" rawAttributes
+                        then onPointer "pointermove" :: onPointer "pointerdown" :: onPointer "pointerup" :: attributes
+                        else attributes
             in
                 Html.node tagname allAttributes (List.map (viewElement elements id) children)
+        Chart chart -> viewChart chart
+        -- Elm won't set innerHTML itself; the <braggle-raw-html> custom element
+        -- defined in page.html does it with this property.
+        RawHtml html -> Html.node "braggle-raw-html" [property "html" (E.string html)] []
         Ref refId -> case Dict.get refId elements of
-            Nothing -> text <| "<no such element: " ++ refId ++ ">"
+            Nothing -> text <| "<no such element: " ++ String.fromInt refId ++ ">"
             Just referent -> viewElement elements refId referent
 
+viewChart : ChartData -> Html Msg
+viewChart chart =
+    let
+        bounds xs = (List.minimum xs |> Maybe.withDefault 0, List.maximum xs |> Maybe.withDefault 1)
+        (xMin, xMax) = bounds (List.concatMap .xs chart.series)
+        (yMin, yMax) = bounds (List.concatMap .ys chart.series)
+        scale lo hi size v = if hi == lo then size / 2 else (v - lo) / (hi - lo) * size
+        toPoint x y =
+            String.fromFloat (scale xMin xMax (toFloat chart.width) x)
+            ++ "," ++ String.fromFloat (toFloat chart.height - scale yMin yMax (toFloat chart.height) y)
+        colors = ["steelblue", "darkorange", "seagreen", "crimson", "purple"]
+        color i = colors |> List.drop (modBy (List.length colors) i) |> List.head |> Maybe.withDefault "black"
+        viewSeries i series =
+            Svg.polyline
+                [ SA.points (List.map2 toPoint series.xs series.ys |> String.join " ")
+                , SA.fill "none"
+                , SA.stroke (color i)
+                ]
+                [ Svg.title [] [Svg.text series.name] ]
+    in
+        Svg.svg
+            [ SA.width (String.fromInt chart.width)
+            , SA.height (String.fromInt chart.height)
+            , SA.style "border:1px solid black"
+            ]
+            (List.indexedMap viewSeries chart.series)
+
+subscriptions : Model -> Sub Msg
+subscriptions model =
+    Sub.batch
+        [ Browser.Events.onVisibilityChange VisibilityChanged
+        -- High-frequency inputs are buffered per element (latest wins) and flushed
+        -- at the fastest rate any of the pending elements asked for.
+        , case model.throttled |> Dict.values |> List.map Tuple.first |> List.minimum of
+            Nothing -> Sub.none
+            Just intervalMs -> Time.every intervalMs (always FlushThrottled)
+        , if List.isEmpty model.tracing.unpainted then Sub.none else Browser.Events.onAnimationFrame Painted
+        ]
+
 main = Browser.application
     { init=init
     , update=update
     , view=view
-    , subscriptions=(always Sub.none)
+    , subscriptions=subscriptions
     , onUrlRequest=(always Ignore)
     , onUrlChange=(always Ignore)
     }
@@ -0,0 +1,38 @@
+'''Compares writing poll responses directly to bytes against building and serializing protobuf messages.'''
+import pytest  # type: ignore
+
+from braggle import GUI, Grid, List, Text
+from braggle.protobuf import element_pb2
+
+def _big_gui() -> GUI:
+    return GUI(
+        List([Text(f'item {i}') for i in range(2_000)]),
+        Grid([[Text(f'{i},{j}') for j in range(20)] for i in range(100)]),
+    )
+
+@pytest.fixture(scope='module')
+def gui():
+    return _big_gui()
+
+def test_updates_since_serialized(benchmark, gui):
+    benchmark.group = 'encode full state'
+    benchmark(lambda: gui.updates_since(0).SerializeToString())
+
+def test_write_updates_since(benchmark, gui):
+    benchmark.group = 'encode full state'
+    def write():
+        buf = bytearray()
+        gui.write_updates_since(buf, 0)
+        return buf
+    result = benchmark(write)
+    assert element_pb2.PartialServerState.FromString(bytes(result)) == gui.updates_since(0)
+
+@pytest.mark.parametrize('path', ['to_protobuf', 'write_to'])
+def test_render_big_grid(benchmark, path):
+    benchmark.group = 'render 100x100 Grid'
+    grid = Grid([[Text('') for _ in range(100)] for _ in range(100)])
+    GUI(grid)
+    if path == 'to_protobuf':
+        benchmark(grid.to_protobuf)
+    else:
+        benchmark(lambda: grid.write_to(bytearray(), 0))
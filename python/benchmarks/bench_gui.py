@@ -0,0 +1,16 @@
+'''How GUI.updates_since scales with the length of the dirty log.'''
+import pytest  # type: ignore
+
+from braggle import GUI, List, Text
+
+@pytest.mark.parametrize('log_size', [1_000, 10_000, 100_000])
+@pytest.mark.parametrize('window', ['all', 'last 10'])
+def test_updates_since(benchmark, log_size, window):
+    benchmark.group = f'updates_since ({window})'
+    texts = [Text('') for _ in range(100)]
+    gui = GUI(List(texts))
+    while gui.time_step < log_size:
+        for t in texts:
+            t.text = str(gui.time_step)
+    since = 0 if window == 'all' else gui.time_step - 10
+    benchmark(lambda: gui.updates_since(since))
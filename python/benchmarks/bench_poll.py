@@ -0,0 +1,49 @@
+'''End-to-end latency of /poll: from a change to every waiting client having received it.'''
+import asyncio
+
+import pytest  # type: ignore
+from aiohttp.test_utils import TestClient, TestServer  # type: ignore
+
+from braggle import GUI, Text
+from braggle.protobuf import element_pb2
+from braggle.server import build_server_app
+
+@pytest.mark.parametrize('n_clients', [1, 10, 100])
+def test_poll_latency(benchmark, n_clients):
+    benchmark.group = 'poll latency'
+    text = Text('0')
+    gui = GUI(text)
+    loop = asyncio.new_event_loop()
+
+    async def setup():
+        clients = [TestClient(TestServer(build_server_app(gui, token='tok')))]
+        await clients[0].start_server()
+        # All clients share one server, but each needs its own auth cookie.
+        for _ in range(n_clients - 1):
+            c = TestClient(clients[0].server)
+            await c.start_server()
+            clients.append(c)
+        for c in clients:
+            await c.get('/auth/tok')
+        return clients
+    clients = loop.run_until_complete(setup())
+
+    async def poll(client, since):
+        resp = await client.post('/poll', data=element_pb2.PollRequest(since_timestep=since).SerializeToString())
+        await resp.read()
+
+    async def round_trip():
+        since = gui.time_step
+        polls = [asyncio.ensure_future(poll(c, since)) for c in clients]
+        await asyncio.sleep(0)
+        text.text = str(since)
+        await asyncio.gather(*polls)
+
+    try:
+        benchmark(lambda: loop.run_until_complete(round_trip()))
+    finally:
+        async def teardown():
+            for c in reversed(clients):
+                await c.close()
+        loop.run_until_complete(teardown())
+        loop.close()
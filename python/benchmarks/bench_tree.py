@@ -0,0 +1,55 @@
+'''How the costs of building and changing a tree scale.'''
+import pytest  # type: ignore
+
+from braggle import GUI, Container, Grid, List, Text
+
+def _chain(depth: int):
+    '''A GUI whose only leaf is ``depth`` containers deep.'''
+    leaf = Text('leaf')
+    node = leaf
+    for _ in range(depth):
+        node = Container([node])
+    return (GUI(node), leaf)
+
+@pytest.mark.parametrize('depth', [1, 10, 100])
+def test_mark_dirty_vs_depth(benchmark, depth):
+    benchmark.group = 'mark_dirty'
+    (_, leaf) = _chain(depth)
+    benchmark(leaf.mark_dirty)
+
+@pytest.mark.parametrize('n', [100, 1_000, 10_000])
+def test_append(benchmark, n):
+    benchmark.group = 'SequenceElement.append'
+    def append_n():
+        l = List()
+        GUI(l)
+        for i in range(n):
+            l.append(Text(''))
+    benchmark.pedantic(append_n, rounds=3)
+
+@pytest.mark.parametrize('n', [100, 1_000, 10_000])
+def test_insert_at_front(benchmark, n):
+    benchmark.group = 'SequenceElement.insert'
+    def setup():
+        # A fresh list each round, so every round inserts into one of n elements.
+        l = List([Text('') for _ in range(n)])
+        GUI(l)
+        return ((l, Text('')), {})
+    benchmark.pedantic(lambda l, child: l.insert(0, child), setup=setup, rounds=20)
+
+@pytest.mark.parametrize('size', [10, 100])
+def test_grid_construction(benchmark, size):
+    benchmark.group = 'Grid construction'
+    benchmark(lambda: Grid([[Text('') for _ in range(size)] for _ in range(size)]))
+
+@pytest.mark.parametrize('size', [10, 100])
+def test_grid_resize(benchmark, size):
+    benchmark.group = 'Grid resize'
+    grid = Grid([[Text('') for _ in range(size)] for _ in range(size)])
+    GUI(grid)
+    def resize():
+        grid.n_rows = 2 * size
+        grid.n_columns = 2 * size
+        grid.n_rows = size
+        grid.n_columns = size
+    benchmark(resize)
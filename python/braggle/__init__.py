@@ -1,5 +1,8 @@
-from .gui import AbstractGUI, GUI
-from .element import Container, Element, Text, TextField, Button, List, CodeSnippet, Link, CodeBlock, Bold, LineBreak
-from ._image import Image
+from .gui import AbstractGUI, GUI, ThreadSafeGUI
+from .element import Container, Element, Text, TextField, Button, List, CodeSnippet, Link, CodeBlock, Bold, LineBreak, Slider, PointerPad
+from ._image import Image, MemoryImage
+from ._html import RawHTML, Markdown, sanitize_html
 from .grid import Grid
-from .server import serve_async, serve
+from .chart import Chart
+from .style import StyleSheet
+from .server import serve_async, serve, serve_sessions_async, serve_sessions, serve_workers
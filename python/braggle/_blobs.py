@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import collections
+import hashlib
+import threading
+
+from typing import Optional
+
+class BlobStore:
+    '''An in-memory, content-addressed store of byte strings, evicting least-recently-used blobs to stay under ``max_bytes``.
+
+    Blobs are keyed by their SHA-256 hex digest, so a given key always means the same
+    bytes, and the server can tell browsers to cache them forever.
+    '''
+    def __init__(self, max_bytes: int = 64 * 2**20) -> None:
+        if max_bytes < 0:
+            raise ValueError(f'max_bytes must be non-negative, not {max_bytes}')
+        self.max_bytes = max_bytes
+        self._blobs: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __contains__(self, digest: object) -> bool:
+        return digest in self._blobs
+
+    def put(self, data: bytes, digest: Optional[str] = None) -> str:
+        '''Store ``data`` (if it isn't already), mark it most-recently-used, and return its digest.
+
+        If the caller already knows the digest, passing it saves rehashing.
+        '''
+        if digest is None:
+            digest = self.digest(data)
+        with self._lock:
+            if digest in self._blobs:
+                self._blobs.move_to_end(digest)
+                return digest
+            self._blobs[digest] = data
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes and len(self._blobs) > 1:
+                (_, evicted) = self._blobs.popitem(last=False)
+                self._total_bytes -= len(evicted)
+        return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._blobs.get(digest)
+            if data is not None:
+                self._blobs.move_to_end(digest)
+            return data
+
+DEFAULT_STORE = BlobStore()
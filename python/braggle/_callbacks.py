@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Optional
+
+POLICIES = ('queue', 'drop', 'cancel')
+
+class CallbackRunner:
+    '''Invokes an Element's callback, which may be a plain function, a coroutine function, or a blocking function to run in an executor.
+
+    Plain functions are just called. Coroutine functions run on the event loop, so they can
+    safely mutate the GUI between ``await``s. Functions run in ``executor`` (a thread or process
+    pool) must not touch the GUI; if one returns a callable, that callable is then called on the
+    event loop, where it may apply the result to the GUI.
+
+    ``policy`` says what happens when the callback is invoked while an earlier invocation is still running:
+
+    - ``'queue'``: run after the earlier invocation finishes
+    - ``'drop'``: ignore the new invocation
+    - ``'cancel'``: cancel the earlier invocation (an executor job can't be interrupted, but its result is discarded)
+    '''
+    def __init__(self, policy: str = 'queue', executor: Optional[Executor] = None) -> None:
+        if policy not in POLICIES:
+            raise ValueError(f'policy must be one of {POLICIES}, not {policy!r}')
+        self.policy = policy
+        self.executor = executor
+        self._latest: Optional[asyncio.Future] = None
+
+    def run(self, callback: Callable[..., Any], *args: Any) -> Optional[Awaitable[None]]:
+        '''Invoke ``callback(*args)``.
+
+        Returns None if the callback has already run to completion; otherwise, an awaitable that completes when it does.
+        '''
+        if (self.executor is None) and not asyncio.iscoroutinefunction(callback):
+            callback(*args)
+            return None
+        return self._run_async(callback, args)
+
+    def run_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        '''Like :meth:`run`, but schedules any asynchronous part on the running event loop instead of returning it.'''
+        pending = self.run(callback, *args)
+        if pending is not None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError('asynchronous callbacks can only be triggered from the event loop') from None
+            loop.create_task(pending)  # type: ignore
+
+    async def _run_async(self, callback: Callable[..., Any], args: Any) -> None:
+        previous = self._latest
+        if (previous is not None) and not previous.done():
+            if self.policy == 'drop':
+                return
+            if self.policy == 'cancel':
+                previous.cancel()
+        else:
+            previous = None
+
+        task = asyncio.ensure_future(self._invoke(callback, args, after=previous if self.policy == 'queue' else None))
+        self._latest = task
+        await asyncio.wait([task])
+        if not task.cancelled():
+            task.result()
+
+    async def _invoke(self, callback: Callable[..., Any], args: Any, after: Optional[asyncio.Future]) -> None:
+        if after is not None:
+            await asyncio.wait([after])
+        if self.executor is None:
+            await callback(*args)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self.executor, functools.partial(callback, *args))
+            if callable(result):
+                result()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import html
+import html.parser
+
+from typing import List, Optional, Tuple
+
+from . import Element
+from .protobuf import element_pb2
+
+SAFE_TAGS = frozenset('''
+    a abbr b blockquote br caption code dd del details div dl dt em figcaption figure
+    h1 h2 h3 h4 h5 h6 hr i img ins kbd li mark ol p pre q s small span strong sub
+    summary sup table tbody td tfoot th thead tr u ul
+'''.split())
+SAFE_ATTRIBUTES = frozenset('''
+    alt class colspan height href id lang rowspan src start title width
+'''.split())
+_URL_ATTRIBUTES = frozenset({'href', 'src'})
+_SAFE_URL_SCHEMES = ('http:', 'https:', 'mailto:', 'data:image/')
+# Tags whose contents, not just the tags themselves, should be dropped.
+_DROPPED_CONTENT_TAGS = frozenset({'script', 'style', 'template', 'iframe', 'object'})
+_VOID_TAGS = frozenset({'br', 'hr', 'img'})
+
+def _is_safe_url(url: str) -> bool:
+    url = ''.join(url.split()).lower()
+    if ':' not in url.split('/', 1)[0]:
+        return True  # relative
+    return url.startswith(_SAFE_URL_SCHEMES)
+
+class _Sanitizer(html.parser.HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.output: List[str] = []
+        self._open: List[str] = []
+        self._dropping = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in _DROPPED_CONTENT_TAGS:
+            self._dropping += 1
+            return
+        if self._dropping or tag not in SAFE_TAGS:
+            return
+        rendered = ''.join(
+            f' {name}="{html.escape(value or "")}"'
+            for (name, value) in attrs
+            if name in SAFE_ATTRIBUTES and not (name in _URL_ATTRIBUTES and not _is_safe_url(value or ''))
+        )
+        self.output.append(f'<{tag}{rendered}>')
+        if tag not in _VOID_TAGS:
+            self._open.append(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _DROPPED_CONTENT_TAGS:
+            self._dropping = max(0, self._dropping - 1)
+            return
+        if self._dropping or tag not in self._open:
+            return
+        while self._open:
+            opened = self._open.pop()
+            self.output.append(f'</{opened}>')
+            if opened == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        if not self._dropping:
+            self.output.append(html.escape(data, quote=False))
+
+def sanitize_html(source: str) -> str:
+    '''Strip everything but a conservative set of formatting tags and attributes from ``source``.
+
+    Scripts, styles, event-handler attributes and ``javascript:`` URLs are all removed, so
+    the result is safe to show even if ``source`` came from an untrusted user.
+    '''
+    sanitizer = _Sanitizer()
+    sanitizer.feed(source)
+    sanitizer.close()
+    return ''.join(sanitizer.output) + ''.join(f'</{tag}>' for tag in reversed(sanitizer._open))
+
+class RawHTML(Element):
+    """A block of pre-rendered HTML.
+
+    However big, it's a single element on the wire, so it's much cheaper than building
+    the same content out of :class:`Container`\\ s and :class:`Text`\\ s. Unless ``sanitize``
+    is false, the HTML is passed through :func:`sanitize_html` first; only turn that off
+    for HTML you trust.
+    """
+    __slots__ = ('_sanitize', '_rendered', '_html')
+    def __init__(self, html: str, sanitize: bool = True) -> None:
+        super().__init__()
+        if not isinstance(html, str):
+            raise TypeError(html)
+        self._sanitize = sanitize
+        self._rendered = self._prepare(html)
+        self._html = html
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._html!r})'
+
+    def _prepare(self, source: str) -> str:
+        return sanitize_html(source) if self._sanitize else source
+
+    @property
+    def html(self) -> str:
+        return self._html
+    @html.setter
+    def html(self, html: str) -> None:
+        self._rendered = self._prepare(html)
+        self._html = html
+        self.mark_dirty()
+
+    def to_protobuf(self) -> element_pb2.Element:
+        return element_pb2.Element(raw_html=self._rendered)
+
+class Markdown(RawHTML):
+    """A block of Markdown, rendered to HTML once, on the server (requires the ``markdown`` package)."""
+    __slots__ = ()
+    def __init__(self, text: str, sanitize: bool = True) -> None:
+        super().__init__(text, sanitize=sanitize)
+
+    def _prepare(self, source: str) -> str:
+        try:
+            import markdown  # type: ignore
+        except ImportError:
+            raise ImportError('Markdown requires the `markdown` package: pip install braggle[markdown]') from None
+        return super()._prepare(markdown.markdown(source))
+
+    @property
+    def text(self) -> str:
+        return self.html
+    @text.setter
+    def text(self, text: str) -> None:
+        self.html = text
@@ -1,12 +1,15 @@
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 from . import Element
 from . import protobuf_helpers
+from ._blobs import BlobStore, DEFAULT_STORE
 from .protobuf import element_pb2
 
 class Image(Element):
+  __slots__ = ('_url', 'format')
   def __init__(self, url: str, format: Optional[str] = None):
     """
-    :param str url: the URL to load the image from
+    :param str url: the URL to load the image from; to show a local file, pass
+      ``static_dir`` to :func:`braggle.serve` and use a URL like ``static/foo.png``
     :param str format: the image's file format, or None to guess from url
     """
     super().__init__()
@@ -28,3 +31,51 @@ class Image(Element):
 
   def to_protobuf(self) -> element_pb2.Element:
     return protobuf_helpers.tag('img', attributes={'src': self.url})
+
+class MemoryImage(Element):
+  """An image whose contents are held in memory, e.g. a freshly-rendered chart.
+
+  The bytes are served from a content-addressed :class:`BlobStore`, with headers telling
+  the browser to cache them forever; only the digest travels through ``/poll``, so
+  re-setting the same bytes costs nothing, and a changed image is downloaded exactly once.
+  """
+  __slots__ = ('format', '_store', '_digest', '_data')
+  def __init__(self, data: Union[bytes, BinaryIO], format: str, store: BlobStore = DEFAULT_STORE):
+    """
+    :param data: the image's bytes, or a binary file-like object to read them from
+    :param str format: the image's file format, e.g. ``'png'``
+    :param store: where to keep the bytes; it must be the one the server serves from
+    """
+    super().__init__()
+    if (format == "") or not format.isalnum():
+      raise ValueError(f'bad image format: {format!r}')
+    self.format = format
+    self._store = store
+    self._digest: Optional[str] = None
+    self._set_data(data)
+
+  def _set_data(self, data: Union[bytes, BinaryIO]) -> bool:
+    if not isinstance(data, bytes):
+      data = data.read()
+    digest = self._store.put(data)
+    changed = digest != self._digest
+    self._data = data
+    self._digest = digest
+    return changed
+
+  @property
+  def data(self) -> bytes:
+    return self._data
+  @data.setter
+  def data(self, data: Union[bytes, BinaryIO]) -> None:
+    if self._set_data(data):
+      self.mark_dirty()
+
+  @property
+  def url(self) -> str:
+    return f'blob/{self._digest}.{self.format}'
+
+  def to_protobuf(self) -> element_pb2.Element:
+    # Re-store, in case the store has evicted our bytes since they were set.
+    self._store.put(self._data, digest=self._digest)
+    return protobuf_helpers.tag('img', attributes={'src': self.url})
@@ -0,0 +1,8 @@
+from typing import Sequence
+
+def percentile(values: Sequence[float], p: float) -> float:
+    '''The nearest-rank ``p``-th percentile of ``values`` (0 if there are none).'''
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
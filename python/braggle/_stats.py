@@ -0,0 +1,105 @@
+'''What a GUI is made of, and how much it costs: see :meth:`braggle.AbstractGUI.stats`.'''
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import heapq
+import sys
+
+from typing import Any, Dict, Iterable, List, Mapping, TYPE_CHECKING
+
+from .element import Element
+
+if TYPE_CHECKING:
+    from .gui import AbstractGUI
+
+@dataclasses.dataclass
+class ElementSize:
+    id: int
+    type: str
+    encoded_bytes: int
+    memory_bytes: int
+
+@dataclasses.dataclass
+class GUIStats:
+    '''A snapshot of a GUI's size.
+
+    Memory figures are approximate: each element's own footprint, plus whatever strings,
+    lists, dicts etc. it holds (but not other elements, which are counted separately).
+    Encoded figures are how big elements are in a poll response that includes them.
+    '''
+    n_elements: int
+    elements_by_type: Dict[str, int]
+    memory_bytes_by_type: Dict[str, int]
+    encoded_bytes_by_type: Dict[str, int]
+    # How many entries the GUI keeps in its log of changed elements.
+    dirty_log_length: int
+    # Elements no longer in the GUI that its change log still keeps alive.
+    n_retained_detached: int
+    retained_detached_memory_bytes: int
+    # How big a poll response for a client that knows nothing would be, before compression.
+    snapshot_bytes: int
+    largest: List[ElementSize]
+
+    def to_json(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+# Slots that refer to things elements share, rather than own.
+_NOT_OWNED_SLOTS = frozenset({'_id_owner', '_gui', '_parent', '__weakref__', '__dict__'})
+
+def _approx_size(value: object, depth: int = 4) -> int:
+    if (depth == 0) or isinstance(value, Element):
+        return 0
+    size = sys.getsizeof(value)
+    items: Iterable[object]
+    if isinstance(value, Mapping):
+        items = [*value.keys(), *value.values()]
+    elif isinstance(value, (list, tuple, set, frozenset, collections.deque)):
+        items = value
+    else:
+        return size
+    return size + sum(_approx_size(item, depth - 1) for item in items)
+
+def approx_memory(element: Element) -> int:
+    '''Roughly how many bytes ``element`` takes up, not counting other elements it refers to.'''
+    size = sys.getsizeof(element)
+    for cls in type(element).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name not in _NOT_OWNED_SLOTS:
+                size += _approx_size(getattr(element, name, None))
+    if hasattr(element, '__dict__'):
+        size += _approx_size(element.__dict__)
+    return size
+
+def encoded_size(element: Element) -> int:
+    buf = bytearray()
+    element.write_to(buf, 0)
+    return len(buf)
+
+def collect(gui: AbstractGUI, elements: Iterable[Element], retained_detached: Iterable[Element], n_largest: int) -> GUIStats:
+    counts: Dict[str, int] = collections.Counter()
+    memory: Dict[str, int] = collections.Counter()
+    encoded: Dict[str, int] = collections.Counter()
+    sizes = []
+    for element in elements:
+        name = type(element).__name__
+        size = ElementSize(id=element.id, type=name, encoded_bytes=encoded_size(element), memory_bytes=approx_memory(element))
+        counts[name] += 1
+        memory[name] += size.memory_bytes
+        encoded[name] += size.encoded_bytes
+        sizes.append(size)
+    detached = list(retained_detached)
+    snapshot = bytearray()
+    gui.write_updates_since(snapshot, 0)
+    return GUIStats(
+        n_elements=len(sizes),
+        elements_by_type=dict(counts),
+        memory_bytes_by_type=dict(memory),
+        encoded_bytes_by_type=dict(encoded),
+        dirty_log_length=gui.dirty_log_length,
+        n_retained_detached=len(detached),
+        retained_detached_memory_bytes=sum(approx_memory(e) for e in detached),
+        snapshot_bytes=len(snapshot),
+        largest=heapq.nlargest(n_largest, sizes, key=lambda s: s.encoded_bytes),
+    )
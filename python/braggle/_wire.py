@@ -0,0 +1,120 @@
+'''Encodes protobuf messages from :mod:`element.proto` straight to bytes.
+
+Building ``element_pb2`` message objects only to serialize them right away is most of
+the cost of a poll, so the hot paths (see :meth:`braggle.Element.write_to`) write
+wire-format bytes directly into a ``bytearray``. The output parses to exactly what the
+corresponding ``element_pb2`` messages would, and is byte-for-byte what they serialize
+to, as long as maps are written in the same order.
+
+Every ``write_*`` function appends a single field to ``buf``. Functions named
+``encode_*`` return the encoded body of an ``Element`` message.
+'''
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping, Union, TYPE_CHECKING
+
+from .protobuf import element_pb2
+
+if TYPE_CHECKING:
+    from .element import Element
+
+_VARINT = 0
+_LENGTH_DELIMITED = 2
+
+# Field numbers, from element.proto.
+ELEMENT_REF = 1
+ELEMENT_TEXT = 2
+ELEMENT_TAG = 3
+TAG_TAGNAME = 1
+TAG_ATTRIBUTES = 2
+TAG_CHILDREN = 3
+ATTRIBUTES_MISC = 1
+STATE_TIMESTEP = 1
+STATE_ROOT_ID = 2
+STATE_ELEMENTS = 3
+STATE_STYLESHEET_ID = 4
+TEMPLATE_INSTANCE_TEMPLATE_ID = 1
+TEMPLATE_INSTANCE_SLOTS = 2
+ELEMENT_INSTANCE = 7
+POLL_RESPONSE_STATE = 1
+MAP_KEY = 1
+MAP_VALUE = 2
+
+Child = Union['Element', element_pb2.Element, bytes]
+
+def write_varint(buf: bytearray, n: int) -> None:
+    while n > 0x7f:
+        buf.append((n & 0x7f) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+def _varint_size(n: int) -> int:
+    return max(1, (n.bit_length() + 6) // 7)
+
+def write_key(buf: bytearray, field: int, wire_type: int) -> None:
+    write_varint(buf, (field << 3) | wire_type)
+
+def write_varint_field(buf: bytearray, field: int, n: int) -> None:
+    write_key(buf, field, _VARINT)
+    write_varint(buf, n)
+
+def write_bytes_field(buf: bytearray, field: int, data: Union[bytes, bytearray]) -> None:
+    write_key(buf, field, _LENGTH_DELIMITED)
+    write_varint(buf, len(data))
+    buf += data
+
+def write_string_field(buf: bytearray, field: int, s: str) -> None:
+    write_bytes_field(buf, field, s.encode('utf-8'))
+
+def write_child(buf: bytearray, field: int, child: Child) -> None:
+    '''Write an ``Element``-typed field: a ref to ``child`` if it's an Element, else its (encoded) self.'''
+    if isinstance(child, bytes):
+        write_bytes_field(buf, field, child)
+    elif isinstance(child, element_pb2.Element):
+        write_bytes_field(buf, field, child.SerializeToString())
+    else:
+        write_key(buf, field, _LENGTH_DELIMITED)
+        id = child.id
+        write_varint(buf, 1 + _varint_size(id))
+        buf.append((ELEMENT_REF << 3) | _VARINT)
+        write_varint(buf, id)
+
+def write_text(buf: bytearray, s: str) -> None:
+    write_string_field(buf, ELEMENT_TEXT, s)
+
+def encode_text(s: str) -> bytes:
+    buf = bytearray()
+    write_text(buf, s)
+    return bytes(buf)
+
+def write_tag(buf: bytearray, tagname: str, children: Iterable[Child] = (), attributes: Mapping[str, str] = {}) -> None:
+    '''Like :func:`braggle.protobuf_helpers.tag`, but encoding straight into ``buf``.'''
+    tag = bytearray()
+    if tagname:
+        write_string_field(tag, TAG_TAGNAME, tagname)
+    attributes_buf = bytearray()
+    for (name, value) in attributes.items():
+        entry = bytearray()
+        write_string_field(entry, MAP_KEY, name)
+        write_string_field(entry, MAP_VALUE, value)
+        write_bytes_field(attributes_buf, ATTRIBUTES_MISC, entry)
+    write_bytes_field(tag, TAG_ATTRIBUTES, attributes_buf)
+    for child in children:
+        write_child(tag, TAG_CHILDREN, child)
+    write_bytes_field(buf, ELEMENT_TAG, tag)
+
+def encode_tag(tagname: str, children: Iterable[Child] = (), attributes: Mapping[str, str] = {}) -> bytes:
+    buf = bytearray()
+    write_tag(buf, tagname, children, attributes)
+    return bytes(buf)
+
+def encode_instance(template_id: int, slots: Iterable[Child]) -> bytes:
+    instance = bytearray()
+    if template_id:
+        write_varint_field(instance, TEMPLATE_INSTANCE_TEMPLATE_ID, template_id)
+    for s in slots:
+        write_child(instance, TEMPLATE_INSTANCE_SLOTS, s)
+    buf = bytearray()
+    write_bytes_field(buf, ELEMENT_INSTANCE, instance)
+    return bytes(buf)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import collections
+import itertools
+
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from .element import Element
+from .protobuf import element_pb2
+
+def _as_floats(values: Any) -> List[float]:
+    '''Accepts any iterable of numbers, including a NumPy array (without needing NumPy installed).'''
+    tolist = getattr(values, 'tolist', None)
+    if tolist is not None:
+        values = tolist()
+    return [float(v) for v in values]
+
+class _Series:
+    __slots__ = ('xs', 'ys', 'time_steps')
+    def __init__(self, retention: int) -> None:
+        self.xs: Deque[float] = collections.deque(maxlen=retention)
+        self.ys: Deque[float] = collections.deque(maxlen=retention)
+        # The GUI timestep at which each point was appended (None if there was no GUI).
+        self.time_steps: Deque[Optional[int]] = collections.deque(maxlen=retention)
+
+    def extend(self, xs: Sequence[float], ys: Sequence[float], time_step: Optional[int]) -> None:
+        self.xs.extend(xs)
+        self.ys.extend(ys)
+        self.time_steps.extend(itertools.repeat(time_step, len(xs)))
+
+    def n_appended_since(self, since: int) -> int:
+        n = 0
+        for t in reversed(self.time_steps):
+            if t is None or t < since:
+                break
+            n += 1
+        return n
+
+class Chart(Element):
+    """A line chart of named numeric series, drawn by the browser.
+
+    Each series is a sequence of ``(x, y)`` points, given as lists or NumPy arrays, e.g.
+
+        >>> chart = Chart({'load': ([0, 1, 2], [0.5, 0.7, 0.6])})
+        >>> chart.extend('load', [3, 4], [0.9, 0.8])
+        >>> chart['load']
+        ([0.0, 1.0, 2.0, 3.0, 4.0], [0.5, 0.7, 0.6, 0.9, 0.8])
+
+    Only the most recent ``retention`` points of each series are kept. Appending points
+    is cheap: clients that already have the chart are sent just the new points, rather
+    than the whole thing. Charts must only be changed on the event loop (see
+    :meth:`braggle.ThreadSafeGUI.call_soon`).
+    """
+    __slots__ = ('_retention', '_width', '_height', '_series', '_last_full_change')
+    def __init__(
+        self,
+        series: Mapping[str, Tuple[Any, Any]] = {},
+        retention: int = 1000,
+        width: int = 400,
+        height: int = 200,
+    ) -> None:
+        super().__init__()
+        if retention <= 0:
+            raise ValueError(f'retention must be positive, not {retention}')
+        self._retention = retention
+        self._width = width
+        self._height = height
+        self._series: Dict[str, _Series] = {}
+        # The GUI timestep of the last change that wasn't just appending points;
+        # clients that haven't seen it need the whole chart. (None means it happened
+        # before this chart joined its GUI, so only brand-new clients need it all.)
+        self._last_full_change: Optional[int] = None
+        for (name, (xs, ys)) in series.items():
+            self[name] = (xs, ys)
+
+    def __repr__(self) -> str:
+        return f'Chart({ {name: self[name] for name in self._series}!r}, retention={self._retention!r})'
+
+    @property
+    def retention(self) -> int:
+        return self._retention
+
+    def __getitem__(self, name: str) -> Tuple[List[float], List[float]]:
+        series = self._series[name]
+        return (list(series.xs), list(series.ys))
+
+    def __setitem__(self, name: str, points: Tuple[Any, Any]) -> None:
+        (xs, ys) = (_as_floats(points[0]), _as_floats(points[1]))
+        if len(xs) != len(ys):
+            raise ValueError(f'series must have as many xs as ys, not {len(xs)} and {len(ys)}')
+        series = _Series(self._retention)
+        series.extend(xs, ys, time_step=None)
+        self._series[name] = series
+        self.mark_dirty()
+
+    def __delitem__(self, name: str) -> None:
+        del self._series[name]
+        self.mark_dirty()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._series)
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def append(self, name: str, x: float, y: float) -> None:
+        self.extend(name, [x], [y])
+
+    def extend(self, name: str, xs: Any, ys: Any) -> None:
+        '''Add points to the end of series ``name`` (creating it if need be), discarding the oldest beyond ``retention``.'''
+        if name not in self._series:
+            self[name] = (xs, ys)
+            return
+        (xs, ys) = (_as_floats(xs), _as_floats(ys))
+        if len(xs) != len(ys):
+            raise ValueError(f'series must have as many xs as ys, not {len(xs)} and {len(ys)}')
+        gui = self.gui
+        self._series[name].extend(xs, ys, time_step=None if gui is None else gui.time_step)
+        # Deliberately not self.mark_dirty(), which would make clients re-fetch everything.
+        super().mark_dirty()
+
+    def mark_dirty(self, *, recursive: bool = False) -> None:
+        super().mark_dirty(recursive=recursive)
+        gui = self.gui
+        self._last_full_change = None if gui is None else gui.time_step - 1
+
+    def to_protobuf(self) -> element_pb2.Element:
+        return self._render(since=None)
+
+    def to_protobuf_since(self, since: int) -> element_pb2.Element:
+        last_full_change = 0 if self._last_full_change is None else self._last_full_change
+        if last_full_change >= since:
+            return self._render(since=None)
+        return self._render(since=since)
+
+    def _render(self, since: Optional[int]) -> element_pb2.Element:
+        series_pbs = []
+        for (name, series) in self._series.items():
+            n = len(series.xs) if since is None else series.n_appended_since(since)
+            start = len(series.xs) - n
+            series_pbs.append(element_pb2.Series(
+                name=name,
+                x=itertools.islice(series.xs, start, None),
+                y=itertools.islice(series.ys, start, None),
+            ))
+        return element_pb2.Element(chart=element_pb2.Chart(
+            series=series_pbs,
+            is_delta=since is not None,
+            retention=self._retention,
+            width=self._width,
+            height=self._height,
+        ))
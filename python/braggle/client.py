@@ -0,0 +1,191 @@
+'''A headless client for braggle servers, for testing and load generation.
+
+It speaks the same protocol as the browser client: it authenticates once, then
+long-polls ``/poll`` and keeps its own copy of every element, merging in updates
+(including chart deltas and templates) just as the browser does; and it can
+click, type, and slide.
+
+    >>> async def main():  # doctest: +SKIP
+    ...     async with Client('http://localhost:8080/auth/TOKEN') as client:
+    ...         await client.poll()
+    ...         [button] = client.find('button')
+    ...         await client.click(button)
+'''
+
+from __future__ import annotations
+
+import itertools
+
+from typing import Dict, Iterator, List, Optional, Set
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+from .protobuf import element_pb2
+from .types import ElementId, TimeStep
+
+class Client:
+    '''A connection to a braggle server, given the auth URL it prints on startup (``http://host:port/auth/TOKEN``).
+
+    If ``session`` is given, requests are made through it (and it's left open). Clients
+    that share a session share its cookies too, so against a session server (see
+    :func:`braggle.server.build_session_app`) they're all one visitor. Otherwise,
+    if ``unix_socket`` is given, the client connects to the server through it (the
+    host in ``url`` is then ignored).
+    '''
+    def __init__(self, url: str, *, session: Optional[aiohttp.ClientSession] = None, unix_socket: Optional[str] = None) -> None:
+        parts = urlsplit(url)
+        # The server's other routes are siblings of /auth/TOKEN.
+        self.auth_url = url
+        self.base_url = urlunsplit((parts.scheme, parts.netloc, parts.path.rsplit('/auth/', 1)[0], '', ''))
+        self._session = session
+        self._owns_session = session is None
+        self.unix_socket = unix_socket
+        self.reset()
+
+    def reset(self) -> None:
+        '''Forget everything the server's sent, so the next poll fetches the whole GUI afresh.'''
+        self.timestep = TimeStep(0)
+        self.root_id = ElementId(0)
+        self.stylesheet_id = ElementId(0)
+        self.elements: Dict[ElementId, element_pb2.Element] = {}
+        self.templates: Dict[int, element_pb2.Element] = {}
+
+    async def __aenter__(self) -> Client:
+        try:
+            await self.connect()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=None if self.unix_socket is None else aiohttp.UnixConnector(path=self.unix_socket),
+                # unsafe=True: servers are often on bare IP addresses, whose cookies aiohttp ignores by default.
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+                # Polls wait for as long as the GUI doesn't change.
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=30),
+            )
+        return self._session
+
+    async def connect(self) -> None:
+        '''Get the auth cookie (which all subsequent requests need).'''
+        async with self.session.get(self.auth_url, allow_redirects=False) as resp:
+            if resp.status >= 400:
+                raise aiohttp.ClientResponseError(resp.request_info, resp.history, status=resp.status, message=resp.reason or '')
+
+    async def close(self) -> None:
+        if self._owns_session and (self._session is not None):
+            await self._session.close()
+
+    async def _post(self, path: str, body: bytes) -> bytes:
+        async with self.session.post(self.base_url + path, data=body) as resp:
+            resp.raise_for_status()
+            return await resp.read()
+
+    async def poll(self) -> element_pb2.PartialServerState:
+        '''Wait for the GUI to change, apply the changes to :attr:`elements`, and return them.'''
+        body = await self._post('/poll', element_pb2.PollRequest(
+            since_timestep=self.timestep,
+            known_templates=len(self.templates),
+        ).SerializeToString())
+        response = element_pb2.PollResponse.FromString(body)
+        self.templates.update(response.templates)
+        state = response.state
+        self.timestep = TimeStep(state.timestep)
+        self.root_id = ElementId(state.root_id)
+        self.stylesheet_id = ElementId(state.stylesheet_id)
+        for (id, element) in state.elements.items():
+            self._merge(ElementId(id), element)
+        return state
+
+    async def poll_forever(self) -> None:
+        while True:
+            await self.poll()
+
+    def _merge(self, id: ElementId, new: element_pb2.Element) -> None:
+        old = self.elements.get(id)
+        if (old is not None) and new.HasField('chart') and new.chart.is_delta and old.HasField('chart'):
+            retention = new.chart.retention
+            appended = {s.name: s for s in new.chart.series}
+            for series in old.chart.series:
+                delta = appended.get(series.name)
+                if delta is not None:
+                    xs = list(itertools.chain(series.x, delta.x))[-retention:]
+                    ys = list(itertools.chain(series.y, delta.y))[-retention:]
+                    series.x[:] = xs
+                    series.y[:] = ys
+            return
+        self.elements[id] = new
+
+    def prune(self) -> None:
+        '''Forget elements that can no longer be rendered, i.e. aren't reachable from the root or stylesheet.
+
+        The server never says when elements are removed, so a long-lived client's
+        :attr:`elements` only grows unless this is called now and then.
+        '''
+        reachable: Set[ElementId] = set()
+        frontier = [self.root_id, self.stylesheet_id]
+        while frontier:
+            id = frontier.pop()
+            if (id in reachable) or (id not in self.elements):
+                continue
+            reachable.add(id)
+            frontier.extend(self._refs(self.elements[id]))
+        for id in set(self.elements) - reachable:
+            del self.elements[id]
+
+    def _refs(self, element: element_pb2.Element) -> Iterator[ElementId]:
+        kind = element.WhichOneof('element_kind')
+        if kind == 'ref':
+            yield ElementId(element.ref)
+        elif kind == 'tag':
+            for child in element.tag.children:
+                yield from self._refs(child)
+        elif kind == 'instance':
+            for slot in element.instance.slots:
+                yield from self._refs(slot)
+
+    def find(self, tagname: str) -> List[ElementId]:
+        '''The ids of all known elements rendered as a ``tagname`` tag, e.g. ``'button'``.'''
+        return [id for (id, e) in self.elements.items() if e.HasField('tag') and e.tag.tagname == tagname]
+
+    def text(self, id: Optional[ElementId] = None) -> str:
+        '''All the text in an element (by default, the root) and its descendants, concatenated.'''
+        return self._text(self.elements.get(self.root_id if id is None else id), slots=())
+
+    def _text(self, element: Optional[element_pb2.Element], slots: List[element_pb2.Element]) -> str:
+        if element is None:
+            return ''
+        kind = element.WhichOneof('element_kind')
+        if kind == 'text':
+            return element.text
+        if kind == 'ref':
+            return self.text(ElementId(element.ref))
+        if kind == 'tag':
+            return ''.join(self._text(child, slots) for child in element.tag.children)
+        if kind == 'slot':
+            return self._text(slots[element.slot], slots=()) if element.slot < len(slots) else ''
+        if kind == 'instance':
+            return self._text(self.templates.get(element.instance.template_id), list(element.instance.slots))
+        return ''
+
+    async def interact(self, interaction: element_pb2.Interaction) -> element_pb2.InteractionResponse:
+        return element_pb2.InteractionResponse.FromString(
+            await self._post('/interaction', element_pb2.InteractionRequest(interaction=interaction).SerializeToString())
+        )
+
+    async def click(self, element_id: ElementId) -> None:
+        await self.interact(element_pb2.Interaction(click=element_pb2.ClickEvent(element_id=element_id)))
+
+    async def text_input(self, element_id: ElementId, value: str) -> None:
+        await self.interact(element_pb2.Interaction(text_input=element_pb2.TextInputEvent(element_id=element_id, value=value)))
+
+    async def slide(self, element_id: ElementId, value: float) -> None:
+        await self.interact(element_pb2.Interaction(slide=element_pb2.SlideEvent(element_id=element_id, value=value)))
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import itertools
+
 from abc import ABC, abstractmethod, abstractproperty
-from typing import AbstractSet, Callable, Iterable, Iterator, MutableSequence, NewType, Optional, overload, Sequence, Set, TypeVar, TYPE_CHECKING
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Collection, Dict, Iterable, Iterator, MutableSequence, NewType, Optional, overload, Sequence, Set, TypeVar, TYPE_CHECKING
 
-from . import protobuf_helpers
+from . import _wire, protobuf_helpers
+from ._callbacks import CallbackRunner
 from .protobuf import element_pb2
 from .types import ElementId
 
@@ -12,19 +16,29 @@ if TYPE_CHECKING:
 
 F = TypeVar('F', bound=Callable)
 
-def _count():
-    i = 0
-    while True:
-        yield i
-        i += 1
+_NO_CHILDREN: Collection[Element] = ()
 
 class Element(ABC):
-    __nonces = _count()
+    # GUIs can have hundreds of thousands of elements, so every built-in Element
+    # class declares __slots__; subclasses elsewhere needn't bother.
+    __slots__ = ('_id', '_id_owner', '_parent', '_children', '_gui', '__weakref__')
+
+    # Ids of elements that aren't in any GUI yet. A GUI renumbers each element from
+    # its own counter as soon as it's attached (see the parent setter), so these
+    # are never seen by a client. itertools.count, unlike a generator, is safe to
+    # advance from several threads at once (e.g. producers building elements for a
+    # ThreadSafeGUI).
+    _nonces = itertools.count()
     def __init__(self) -> None:
         super().__init__()
-        self._id = ElementId(str(next(self.__nonces)))
-        self.__parent: Optional[Element] = None
-        self.__children: Set[Element] = set()
+        self._id = ElementId(next(Element._nonces))
+        self._id_owner: Optional[AbstractGUI] = None
+        self._parent: Optional[Element] = None
+        # This element's children, in order. By default, a dict used as an ordered
+        # set, created only once there are any children (most elements are leaves);
+        # subclasses that keep their own ordered collection of children store it here
+        # instead, and override _add_child and _remove_child.
+        self._children: Optional[Collection[Element]] = None
         self._gui: Optional[AbstractGUI] = None
 
     @property
@@ -38,30 +52,56 @@ class Element(ABC):
         - ``x.parent == y`` must be equivalent to ``x in y.children``.
         - Consequently, you probably never want to set an Element's parent, unless you're writing your own Element class and implementing a method that adds a child. For example, ``my_list_element.append(e)`` will set ``e.parent``; end users should never have to worry about it.
         '''
-        return self.__parent
+        return self._parent
     @parent.setter
     def parent(self, parent: Element) -> None:
+        old_parent = self._parent
+        self._set_parent(parent)
+        if old_parent is not None:
+            old_parent._remove_child(self)
+        if parent is not None:
+            parent._add_child(self)
+
+    def _set_parent(self, parent: Optional[Element]) -> None:
+        '''Set the parent, without telling the old or new parent, for a parent that's updating its own children.'''
         if (parent is not None) and not isinstance(parent, Element):
             raise TypeError(f'parent must be Element, not {type(parent)}')
-        if (self.__parent is not None) and (parent is not None):
+        if (self._parent is not None) and (parent is not None):
             raise RuntimeError('cannot set parent of Element that already has a parent')
-        if self.__parent is not None:
-            self.__parent.__children.remove(self)
-        self.__parent = parent
+        self._parent = parent
         if parent is not None:
-            parent.__children.add(self)
+            # Only elements that have been in a GUI can be in one now; checking that first
+            # saves walking up the tree for elements that are still being assembled.
+            gui = parent._id_owner
+            if (gui is not None) and (parent.gui is gui):
+                gui._adopt(self)
+
+    def _add_child(self, child: Element) -> None:
+        if self._children is None:
+            self._children = {}
+        self._children[child] = None  # type: ignore
+
+    def _remove_child(self, child: Element) -> None:
+        del self._children[child]  # type: ignore
 
     @property
-    def children(self) -> AbstractSet[Element]:
+    def children(self) -> Collection[Element]:
         '''...
 
         ``x.parent == y`` must be equivalent to ``x in y.children``.
+
+        This is a live, read-only view, not a copy, so don't add or remove children while iterating over it.
         '''
-        return set(self.__children)
+        children = self._children
+        if children is None:
+            return _NO_CHILDREN
+        if isinstance(children, dict):
+            return children.keys()
+        return children
 
     def walk(self) -> Iterator[Element]:
         yield self
-        for child in self.__children:
+        for child in self.children:
             yield from child.walk()
 
     @property
@@ -85,24 +125,67 @@ class Element(ABC):
             for child in self.children:
                 child.mark_dirty(recursive=True)
 
-    def handle_click(self, event: element_pb2.ClickEvent) -> None:
-        pass
-    def handle_text_input(self, event: element_pb2.TextInputEvent) -> None:
-        pass
+    # Event handlers may return an awaitable, if handling the event involves
+    # asynchronous work; the server awaits it without holding the GUI lock.
+    def handle_click(self, event: element_pb2.ClickEvent) -> Optional[Awaitable[None]]:
+        return None
+    def handle_text_input(self, event: element_pb2.TextInputEvent) -> Optional[Awaitable[None]]:
+        return None
+    def handle_slide(self, event: element_pb2.SlideEvent) -> Optional[Awaitable[None]]:
+        return None
+    def handle_pointer_move(self, event: element_pb2.PointerMoveEvent) -> Optional[Awaitable[None]]:
+        return None
 
     @abstractmethod
     def to_protobuf(self) -> element_pb2.Element:
         pass
 
+    def to_protobuf_since(self, since: int) -> element_pb2.Element:
+        '''Render this element for a client that's up to date as of timestep ``since``.
+
+        Most elements just re-render in full; an element can override this to send only what's changed.
+        '''
+        return self.to_protobuf()
+
+    def write_to(self, buf: bytearray, since: int) -> None:
+        '''Append ``self.to_protobuf_since(since)``, serialized, to ``buf``.
+
+        This is what the server actually calls. The default just serializes the message;
+        elements that make up the bulk of big GUIs override it to write the bytes
+        directly, with the helpers in :mod:`braggle._wire`, which is much faster.
+        '''
+        buf += self.to_protobuf_since(since).SerializeToString()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # A subclass that changes how it renders, but not how it's written, must
+        # fall back to writing what it renders.
+        if ('write_to' not in cls.__dict__) and not cls.__dict__.keys().isdisjoint({'to_protobuf', 'to_protobuf_since'}):
+            cls.write_to = Element.write_to  # type: ignore
+
 class SequenceElement(Element, MutableSequence[Element]):
+    __slots__ = ()
+    _children: MutableSequence[Element]
+
     def __init__(self, children: Iterable[Element] = ()) -> None:
         children = list(children)
         if not all(isinstance(child, Element) for child in children):
             raise TypeError("SequencElement children must be Elements")
         super().__init__()
-        self._children: MutableSequence[Element] = []
+        self._children = []
         self[:] = children
 
+    # The list of children is the only record of them. The sequence methods keep it up
+    # to date themselves (via _update_children); these are for anyone setting a child's
+    # parent directly, which appends it.
+    def _add_child(self, child: Element) -> None:
+        self._children.append(child)
+        child.mark_dirty(recursive=True)
+        self.mark_dirty()
+    def _remove_child(self, child: Element) -> None:
+        self._children.remove(child)
+        self.mark_dirty()
+
     @overload
     def __getitem__(self, index: int) -> Element:
         pass
@@ -112,20 +195,20 @@ class SequenceElement(Element, MutableSequence[Element]):
     def __getitem__(self, index):
         return self._children[index]
 
-    def __update_children(self, new_children: MutableSequence[Element]) -> None:
+    def _update_children(self, new_children: MutableSequence[Element]) -> None:
         for child in new_children:
             if not isinstance(child, Element):
                 raise TypeError(f"SequenceElement children must be Elements, not {type(child)}")
         old_children = self._children
         for added_child in set(new_children) - set(old_children):
-            added_child.parent = self
+            added_child._set_parent(self)
             added_child.mark_dirty(recursive=True)
             # TODO: ^ come up with semantics for "ensure this element is added to the tree"
 
         self._children = new_children
 
         for removed_child in set(old_children) - set(new_children):
-            removed_child.parent = None
+            removed_child._set_parent(None)
 
         self.mark_dirty()
 
@@ -139,7 +222,7 @@ class SequenceElement(Element, MutableSequence[Element]):
     def __setitem__(self, index, child):
         new_children = list(self._children)
         new_children[index] = child
-        self.__update_children(new_children)
+        self._update_children(new_children)
 
     @overload
     def __delitem__(self, index: int) -> None:
@@ -150,7 +233,7 @@ class SequenceElement(Element, MutableSequence[Element]):
     def __delitem__(self, index):
         new_children = list(self._children)
         del new_children[index]
-        self.__update_children(new_children)
+        self._update_children(new_children)
 
     def __len__(self) -> int:
         return len(self._children)
@@ -158,7 +241,9 @@ class SequenceElement(Element, MutableSequence[Element]):
     def insert(self, index: int, child: Element) -> None:
         new_children = list(self._children)
         new_children.insert(index, child)
-        self.__update_children(new_children)
+        self._update_children(new_children)
+
+_LIST_ITEM = protobuf_helpers.Template(protobuf_helpers.tag('li', [protobuf_helpers.slot(0)]))
 
 class List(SequenceElement):
     """A list of elements.
@@ -174,6 +259,7 @@ class List(SequenceElement):
         my_list[1] = new_second
         del my_list[2]
     """
+    __slots__ = ('_numbered',)
     def __init__(self, children: Iterable[Element] = (), numbered: bool = False) -> None:
         super().__init__(children=children)
         self._numbered = numbered
@@ -192,17 +278,24 @@ class List(SequenceElement):
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag(
             tagname='ol' if self.numbered else 'ul',
-            children=[
-                protobuf_helpers.tag('li', children=[child])
-                for child in self._children
-            ],
+            children=[_LIST_ITEM(child) for child in self._children],
+        )
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(
+            buf,
+            tagname='ol' if self.numbered else 'ul',
+            children=[_LIST_ITEM.encode(child) for child in self._children],
         )
 
 class Container(SequenceElement):
+    __slots__ = ()
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag('div', children=self._children)
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(buf, 'div', children=self._children)
 
 class Text(Element):
+    __slots__ = ('_text',)
     def __init__(self, text: str) -> None:
         super().__init__()
         if not isinstance(text, str):
@@ -217,28 +310,40 @@ class Text(Element):
         self.mark_dirty()
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.text(self.text)
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_text(buf, self.text)
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.text!r})'
 
 class Bold(Text):
+    __slots__ = ()
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag('b', children=[protobuf_helpers.text(self.text)])
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(buf, 'b', children=[_wire.encode_text(self.text)])
 class CodeSnippet(Text):
+    __slots__ = ()
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag(
             'code',
             children=[protobuf_helpers.text(self.text)],
-            attributes={'style': 'white-space:pre'},
+            attributes={'class': 'braggle-code-snippet'},
         )
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(buf, 'code', children=[_wire.encode_text(self.text)], attributes={'class': 'braggle-code-snippet'})
 class CodeBlock(Text):
+    __slots__ = ()
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag(
             'pre',
             children=[protobuf_helpers.text(self.text)],
         )
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(buf, 'pre', children=[_wire.encode_text(self.text)])
 class Link(Text):
     """A `hyperlink <http://github.com/speezepearson/browsergui>`_."""
+    __slots__ = ('_url',)
     def __init__(self, *, text: str, url: str):
         super().__init__(text)
         self._url = url
@@ -252,6 +357,8 @@ class Link(Text):
             children=[protobuf_helpers.text(self.text)],
             attributes={'href': self.url},
         )
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(buf, 'a', children=[_wire.encode_text(self.text)], attributes={'href': self.url})
 
     @property
     def url(self) -> str:
@@ -264,12 +371,27 @@ class Link(Text):
 
 
 class Button(Element):
-    def __init__(self, text: str, callback: Optional[Callable[[], None]] = None) -> None:
+    """A clickable button.
+
+    The callback may be a plain function, a coroutine function, or (given an
+    ``executor``) a blocking function to run off the event loop; ``policy`` governs
+    overlapping clicks. See :class:`braggle._callbacks.CallbackRunner`.
+    """
+    __slots__ = ('_text', 'callback', '_runner')
+    def __init__(
+        self,
+        text: str,
+        callback: Optional[Callable[[], object]] = None,
+        *,
+        policy: str = 'queue',
+        executor: Optional[Executor] = None,
+    ) -> None:
         super().__init__()
         if not isinstance(text, str):
             raise TypeError(text)
         self._text = text
         self.callback = callback
+        self._runner = CallbackRunner(policy=policy, executor=executor)
 
     def __repr__(self) -> str:
         return f'Button(text={self.text!r}, callback={self.callback!r})'
@@ -283,10 +405,13 @@ class Button(Element):
         self.mark_dirty()
 
     def to_protobuf(self) -> element_pb2.Element:
-        return protobuf_helpers.tag('button', children=[protobuf_helpers.text(self._text)])
-    def handle_click(self, event: element_pb2.ClickEvent) -> None:
+        return protobuf_helpers.tag('button', children=[protobuf_helpers.text(self.text)])
+    def write_to(self, buf: bytearray, since: int) -> None:
+        _wire.write_tag(buf, 'button', children=[_wire.encode_text(self.text)])
+    def handle_click(self, event: element_pb2.ClickEvent) -> Optional[Awaitable[None]]:
         if self.callback is not None:
-            self.callback()
+            return self._runner.run(self.callback)
+        return None
 
     def set_callback(self, f: F) -> F:
         '''Set the Button's ``callback``. Returns the same function, for use as a decorator.
@@ -299,22 +424,35 @@ class Button(Element):
         return f
 
 class LineBreak(Element):
+    __slots__ = ()
     def __repr__(self) -> str:
         return f'LineBreak()'
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag('br')
 
 class TextField(Element):
-    def __init__(self, callback: Optional[Callable[[str], None]] = None) -> None:
+    """A single-line text input. The callback is run like :class:`Button`'s."""
+    __slots__ = ('_value', '_callback', '_runner')
+    def __init__(
+        self,
+        callback: Optional[Callable[[str], object]] = None,
+        *,
+        policy: str = 'queue',
+        executor: Optional[Executor] = None,
+    ) -> None:
         super().__init__()
         self._value = ''
         self._callback = callback
+        self._runner = CallbackRunner(policy=policy, executor=executor)
     def __repr__(self) -> str:
         return f'TextField(value={self.value!r}, callback={self._callback!r})'
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag('input', attributes={'value': self._value})
-    def handle_text_input(self, interaction: element_pb2.TextInputEvent) -> None:
-        self.value = interaction.value
+    def handle_text_input(self, interaction: element_pb2.TextInputEvent) -> Optional[Awaitable[None]]:
+        self._value = interaction.value
+        pending = None if self._callback is None else self._runner.run(self._callback, interaction.value)
+        self.mark_dirty()
+        return pending
 
     @property
     def value(self) -> str:
@@ -323,5 +461,107 @@ class TextField(Element):
     def value(self, value: str) -> None:
         self._value = value
         if self._callback is not None:
-            self._callback(value)
+            self._runner.run_soon(self._callback, value)
         self.mark_dirty()
+
+class Slider(Element):
+    """A draggable range input.
+
+    High-frequency: the client sends at most ``max_rate`` updates per second, and
+    the server only runs the callback for the latest of any updates that queue up.
+    The callback is run like :class:`Button`'s.
+    """
+    __slots__ = ('_min', '_max', '_step', '_value', '_callback', '_runner', 'max_rate')
+    def __init__(
+        self,
+        min: float = 0.0,
+        max: float = 1.0,
+        value: Optional[float] = None,
+        step: Optional[float] = None,
+        callback: Optional[Callable[[float], object]] = None,
+        max_rate: float = 30,
+        *,
+        policy: str = 'queue',
+        executor: Optional[Executor] = None,
+    ) -> None:
+        super().__init__()
+        if not min <= max:
+            raise ValueError(f'min ({min}) must not exceed max ({max})')
+        if max_rate <= 0:
+            raise ValueError(f'max_rate must be positive, not {max_rate}')
+        self._min = min
+        self._max = max
+        self._step = step
+        self._value = min if value is None else value
+        self._callback = callback
+        self._runner = CallbackRunner(policy=policy, executor=executor)
+        self.max_rate = max_rate
+
+    def __repr__(self) -> str:
+        return f'Slider(min={self._min!r}, max={self._max!r}, value={self.value!r}, callback={self._callback!r})'
+
+    def to_protobuf(self) -> element_pb2.Element:
+        return protobuf_helpers.tag('input', attributes={
+            'type': 'range',
+            'min': repr(self._min),
+            'max': repr(self._max),
+            'step': 'any' if self._step is None else repr(self._step),
+            'value': repr(self._value),
+            'data-braggle-max-rate': repr(self.max_rate),
+        })
+    def handle_slide(self, event: element_pb2.SlideEvent) -> Optional[Awaitable[None]]:
+        self._value = event.value
+        pending = None if self._callback is None else self._runner.run(self._callback, event.value)
+        self.mark_dirty()
+        return pending
+
+    @property
+    def value(self) -> float:
+        return self._value
+    @value.setter
+    def value(self, value: float) -> None:
+        self._value = value
+        if self._callback is not None:
+            self._runner.run_soon(self._callback, value)
+        self.mark_dirty()
+
+class PointerPad(Element):
+    """A rectangular area that reports pointer movement over it.
+
+    The callback receives ``(x, y, pressed)``, with coordinates in pixels from the
+    pad's top-left corner. Like :class:`Slider`, updates are rate-limited by the
+    client and coalesced by the server, and the callback is run like :class:`Button`'s.
+    """
+    __slots__ = ('_width', '_height', 'callback', '_runner', 'max_rate')
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        callback: Optional[Callable[[float, float, bool], object]] = None,
+        max_rate: float = 30,
+        *,
+        policy: str = 'queue',
+        executor: Optional[Executor] = None,
+    ) -> None:
+        super().__init__()
+        if max_rate <= 0:
+            raise ValueError(f'max_rate must be positive, not {max_rate}')
+        self._width = width
+        self._height = height
+        self.callback = callback
+        self._runner = CallbackRunner(policy=policy, executor=executor)
+        self.max_rate = max_rate
+
+    def __repr__(self) -> str:
+        return f'PointerPad(width={self._width!r}, height={self._height!r}, callback={self.callback!r})'
+
+    def to_protobuf(self) -> element_pb2.Element:
+        return protobuf_helpers.tag('div', attributes={
+            'style': f'width:{self._width}px; height:{self._height}px; border:1px solid black; touch-action:none',
+            'data-braggle-pointer': '',
+            'data-braggle-max-rate': repr(self.max_rate),
+        })
+    def handle_pointer_move(self, event: element_pb2.PointerMoveEvent) -> Optional[Awaitable[None]]:
+        if self.callback is not None:
+            return self._runner.run(self.callback, event.x, event.y, event.pressed)
+        return None
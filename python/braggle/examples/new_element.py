@@ -17,6 +17,8 @@ class Details(Element):
         self._summary.parent = None
         self._summary = value
         value.parent = self
+        self.mark_dirty()
+        value.mark_dirty(recursive=True)
 
     @property
     def contents(self) -> Element:
@@ -26,6 +28,8 @@ class Details(Element):
         self._contents.parent = None
         self._contents = value
         value.parent = self
+        self.mark_dirty()
+        value.mark_dirty(recursive=True)
 
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag(
@@ -3,7 +3,11 @@ from typing import MutableSequence, Optional, Sequence, overload, Tuple, Type, T
 
 from .element import Element
 from .protobuf import element_pb2
-from . import protobuf_helpers
+from . import _wire, protobuf_helpers
+
+_CELL_ATTRIBUTES = {'class': 'braggle-grid-cell'}
+_CELL = protobuf_helpers.Template(protobuf_helpers.tag('td', [protobuf_helpers.slot(0)], attributes=_CELL_ATTRIBUTES))
+_EMPTY_CELL = protobuf_helpers.Template(protobuf_helpers.tag('td', attributes=_CELL_ATTRIBUTES))
 
 def empty_grid(n_rows, n_columns):
     if not (isinstance(n_rows, int) and n_rows < 0):
@@ -34,6 +38,7 @@ class Grid(Element):
          [Text('2,0'), Text('2,1'), Text('2,2')],
          [None, None, Text('new 3,2')]]
     """
+    __slots__ = ('_n_rows', '_n_columns', '_cells')
     def __init__(
         self,
         cells: Sequence[Sequence[Optional[Element]]] = (),
@@ -63,23 +68,28 @@ class Grid(Element):
     def to_protobuf(self) -> element_pb2.Element:
         return protobuf_helpers.tag(
             'table',
-            attributes={'style': 'border-spacing:0; border-collapse:collapse'},
+            attributes={'class': 'braggle-grid'},
             children=[
                 protobuf_helpers.tag(
                     'tr',
-                    children=[
-                        protobuf_helpers.tag(
-                            'td',
-                            attributes={'style': 'border: 1px solid black'},
-                            children=[cell] if (cell is not None) else [],
-                        )
-                        for cell in row
-                    ]
+                    children=[_CELL(cell) if (cell is not None) else _EMPTY_CELL() for cell in row],
                  )
                  for row in self._cells
             ],
         )
 
+    def write_to(self, buf: bytearray, since: int) -> None:
+        empty_cell = _EMPTY_CELL.encode()
+        _wire.write_tag(
+            buf,
+            'table',
+            attributes={'class': 'braggle-grid'},
+            children=[
+                _wire.encode_tag('tr', children=[_CELL.encode(cell) if (cell is not None) else empty_cell for cell in row])
+                for row in self._cells
+            ],
+        )
+
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}(cells={self._cells!r})'
 
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import contextlib
+import functools
+import itertools
+import threading
+import warnings
+import weakref
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Callable, Iterable, MutableSequence, MutableSet, Optional, Sequence, TYPE_CHECKING
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterable, MutableSequence, MutableSet, Optional, Sequence, TYPE_CHECKING
 
+from . import _stats, _wire, protobuf_helpers
 from .element import Element, Container
 from .protobuf import element_pb2
-from .types import TimeStep
+from .style import DEFAULT_STYLES, StyleSheet
+from .types import ElementId, TimeStep
 
 class AbstractGUI(ABC):
     @property
@@ -25,10 +34,56 @@ class AbstractGUI(ABC):
     def time_step(self) -> int:
         '''...'''
 
+    @abstractmethod
+    def element_by_id(self, id: ElementId) -> Optional[Element]:
+        '''The element in this GUI with the given id, if any.'''
+
     @abstractmethod
     def updates_since(self, since: int = 0) -> element_pb2.PartialServerState:
         '''...'''
 
+    @property
+    def dirty_log_length(self) -> int:
+        '''How many entries the GUI keeps in its log of changed elements.'''
+        return self.time_step
+
+    def n_elements(self) -> int:
+        '''How many elements are in the GUI.'''
+        return sum(1 for _ in self._elements())
+
+    def _elements(self) -> Iterable[Element]:
+        return self.root.walk()
+
+    def _retained_detached(self) -> Iterable[Element]:
+        '''Elements no longer in the GUI that it's still keeping alive.'''
+        return ()
+
+    def _adopt(self, element: Element) -> None:
+        '''Called when ``element`` (and its descendants) joins the GUI, before it's marked dirty.'''
+
+    def stats(self, n_largest: int = 10) -> _stats.GUIStats:
+        '''Counts and (approximate) sizes of the GUI's elements, by type, and its ``n_largest`` largest elements.
+
+        This walks and encodes the whole GUI, so it's slow for big ones.
+        '''
+        with self._rendering():
+            return _stats.collect(self, self._elements(), self._retained_detached(), n_largest)
+
+    def templates_since(self, n_known: int) -> Dict[int, element_pb2.Element]:
+        '''The bodies of the templates this GUI's elements use that a client knowing the first ``n_known`` doesn't, by id.
+
+        Only complete once the updates a client is being sent have been rendered.
+        '''
+        return protobuf_helpers.templates_since(n_known)
+
+    def _rendering(self) -> ContextManager[None]:
+        '''A context to render this GUI's elements in, so templates get this GUI's ids.'''
+        return contextlib.nullcontext()
+
+    def write_updates_since(self, buf: bytearray, since: int = 0) -> None:
+        '''Append ``self.updates_since(since)``, serialized, to ``buf``.'''
+        buf += self.updates_since(since).SerializeToString()
+
     @abstractmethod
     def add_listener(self, listener: Callable[[], Any]) -> None:
         '''TODO: this is awkward and weird.'''
@@ -38,15 +93,54 @@ class GUI(AbstractGUI):
     def __init__(self, *children: Element) -> None:
         self._root = Container(children)
         self._root.gui = self
-        self._dirty_elements: MutableSequence[Element] = list(self._root.walk()) # OPTIMIZE: weakref
+        self._stylesheet = StyleSheet(DEFAULT_STYLES)
+        self._templates = protobuf_helpers.TemplateRegistry()
+        self._stylesheet.gui = self
+        # Ids are only unique within a GUI; 0 is never used, so clients can treat it as "none".
+        self._ids = itertools.count(1)
+        self._elements_by_id: weakref.WeakValueDictionary[ElementId, Element] = weakref.WeakValueDictionary()
+        self._dirty_elements: MutableSequence[Element] = [] # OPTIMIZE: weakref
         self._mark_dirty_listeners: MutableSet[Callable[[], Any]] = set()
+        for element in itertools.chain(self._root.walk(), self._stylesheet.walk()):
+            self._record_dirty(element)
 
     @property
     def root(self) -> Element:
         return self._root
 
+    @property
+    def stylesheet(self) -> StyleSheet:
+        '''CSS rules available to every element in this GUI (see :class:`braggle.StyleSheet`).'''
+        return self._stylesheet
+
     def mark_dirty(self, element: Element) -> None:
+        self._record_dirty(element)
+        self._notify_listeners()
+
+    def _record_dirty(self, element: Element) -> None:
+        if element._id_owner is not self:
+            self._assign_id(element)
         self._dirty_elements.append(element)
+
+    def _adopt(self, element: Element) -> None:
+        # Elements attached without being marked dirty (e.g. by custom elements)
+        # mustn't keep their pre-GUI ids, which could clash with ours.
+        for e in element.walk():
+            if e._id_owner is not self:
+                self._assign_id(e)
+
+    def _assign_id(self, element: Element) -> None:
+        element._id = ElementId(next(self._ids))
+        element._id_owner = self
+        self._elements_by_id[element._id] = element
+
+    def element_by_id(self, id: ElementId) -> Optional[Element]:
+        element = self._elements_by_id.get(id)
+        if (element is None) or (element.gui is not self) or (element.id != id):
+            return None
+        return element
+
+    def _notify_listeners(self) -> None:
         for listener in self._mark_dirty_listeners:
             listener()
 
@@ -54,14 +148,132 @@ class GUI(AbstractGUI):
     def time_step(self) -> TimeStep:
         return TimeStep(len(self._dirty_elements))
 
+    @property
+    def dirty_log_length(self) -> int:
+        return len(self._dirty_elements)
+
+    def _elements(self) -> Iterable[Element]:
+        return itertools.chain(self._root.walk(), self._stylesheet.walk())
+
+    def _retained_detached(self) -> Iterable[Element]:
+        return {e for e in self._dirty_elements if e.gui is not self}
+
+    def _recently_dirtied(self, since: int) -> Iterable[Element]:
+        # Elements that have since been removed from the tree can't be referenced by
+        # anything the client will render, so a client that's been away a while (e.g.
+        # a background tab) only gets the current state of what's still attached.
+        return {e for e in self._dirty_elements[since:] if e.gui is self}
+
+    def templates_since(self, n_known: int) -> Dict[int, element_pb2.Element]:
+        return self._templates.since(n_known)
+
+    def _rendering(self) -> ContextManager[None]:
+        return self._templates.active()
+
     def updates_since(self, since: int = 0) -> element_pb2.PartialServerState:
         since = max(since, 0)
-        recently_dirtied = set(self._dirty_elements[since:])
-        return element_pb2.PartialServerState(
-            root_id=self.root.id,
-            timestep=self.time_step,
-            elements={e.id: e.to_protobuf() for e in recently_dirtied},
-        )
+        with self._rendering():
+            return element_pb2.PartialServerState(
+                root_id=self.root.id,
+                stylesheet_id=self._stylesheet.id,
+                timestep=self.time_step,
+                elements={e.id: e.to_protobuf_since(since) for e in self._recently_dirtied(since)},
+            )
+
+    def write_updates_since(self, buf: bytearray, since: int = 0) -> None:
+        with self._rendering():
+            self._write_updates_since(buf, max(since, 0))
+
+    def _write_updates_since(self, buf: bytearray, since: int) -> None:
+        if self.time_step:
+            _wire.write_varint_field(buf, _wire.STATE_TIMESTEP, self.time_step)
+        _wire.write_varint_field(buf, _wire.STATE_ROOT_ID, self.root.id)
+        entry = bytearray()
+        value = bytearray()
+        for e in self._recently_dirtied(since):
+            del entry[:], value[:]
+            _wire.write_varint_field(entry, _wire.MAP_KEY, e.id)
+            e.write_to(value, since)
+            _wire.write_bytes_field(entry, _wire.MAP_VALUE, value)
+            _wire.write_bytes_field(buf, _wire.STATE_ELEMENTS, entry)
+        _wire.write_varint_field(buf, _wire.STATE_STYLESHEET_ID, self._stylesheet.id)
 
     def add_listener(self, listener: Callable[[], None]) -> None:
         self._mark_dirty_listeners.add(listener)
+
+class ThreadSafeGUI(GUI):
+    '''A GUI whose elements may be changed from threads other than the event loop's.
+
+    Changes made off the loop are queued, and applied on the loop in batches, so
+    they never race with the server reading the GUI. Producer threads only ever
+    append to a queue, so they never wait on the server.
+
+    Every change made from another thread must go through :meth:`call_soon` (or
+    :meth:`set`, for simple property changes), which queues the change itself to be
+    made on the loop. Changing elements directly from another thread (e.g.
+    ``text.text = ...``) races with the server encoding them; it still gets noticed,
+    but with a :class:`RuntimeWarning`.
+
+    ``loop`` is the event loop serving this GUI; :func:`braggle.serve` fills it in.
+    Until it's known, changes are applied immediately.
+    '''
+    def __init__(self, *children: Element, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        self.loop = loop
+        self._pending: Deque[Callable[[], Any]] = collections.deque()
+        self._flush_lock = threading.Lock()
+        self._flush_scheduled = False
+        self._flushing = False
+        super().__init__(*children)
+
+    def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
+        '''Run ``callback(*args)`` on the event loop, soon. Safe to call from any thread.'''
+        if self._on_loop():
+            callback(*args)
+            return
+        self._pending.append(functools.partial(callback, *args))
+        with self._flush_lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        assert self.loop is not None
+        self.loop.call_soon_threadsafe(self._flush)
+
+    def set(self, element: Element, **attributes: Any) -> None:
+        '''Set ``element``'s attributes (e.g. ``gui.set(text, text='hi')``) on the event loop, soon. Safe to call from any thread.'''
+        self.call_soon(_set_attributes, element, attributes)
+
+    def mark_dirty(self, element: Element) -> None:
+        if not self._on_loop():
+            warnings.warn(
+                f'{element!r} was changed off the event loop; use ThreadSafeGUI.call_soon or .set instead',
+                RuntimeWarning,
+                stacklevel=4,
+            )
+            self.call_soon(self.mark_dirty, element)
+        elif self._flushing:
+            self._record_dirty(element)
+        else:
+            super().mark_dirty(element)
+
+    def _on_loop(self) -> bool:
+        if self.loop is None:
+            return True
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _flush(self) -> None:
+        with self._flush_lock:
+            self._flush_scheduled = False
+        self._flushing = True
+        try:
+            while self._pending:
+                self._pending.popleft()()
+        finally:
+            self._flushing = False
+            self._notify_listeners()
+
+def _set_attributes(element: Element, attributes: Dict[str, Any]) -> None:
+    for (name, value) in attributes.items():
+        setattr(element, name, value)
@@ -0,0 +1,141 @@
+'''Simulates many viewers and interactors against a running braggle server, and reports how it coped.
+
+    python -m braggle.loadgen http://localhost:8080/auth/TOKEN --viewers 2000 --interactors 50 --duration 60
+
+Viewers just long-poll, like idle browser tabs. Interactors also poll, and every
+``--interval`` seconds (on average) click a random button, type into a random text
+field, or move a random slider. The report gives latency percentiles for polls (which
+includes time spent waiting for something to change) and interactions, plus throughput.
+'''
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import random
+import string
+import time
+
+from typing import List, Optional, Sequence
+
+import aiohttp
+
+from ._percentiles import percentile
+from .client import Client
+
+@dataclasses.dataclass
+class Report:
+    duration: float
+    n_clients: int
+    poll_latencies: List[float] = dataclasses.field(default_factory=list)
+    interaction_latencies: List[float] = dataclasses.field(default_factory=list)
+    poll_bytes: int = 0
+    errors: int = 0
+
+    def summary(self) -> str:
+        lines = [f'{self.n_clients} clients for {self.duration:.1f}s, {self.errors} errors']
+        for (name, latencies) in [('poll', self.poll_latencies), ('interaction', self.interaction_latencies)]:
+            lines.append(
+                f'{name}: {len(latencies)} ({len(latencies) / self.duration:.1f}/s); latency (ms) '
+                + ', '.join(f'p{p}={1000 * percentile(latencies, p):.1f}' for p in (50, 90, 99))
+                + f', max={1000 * max(latencies, default=0):.1f}'
+            )
+        lines.append(f'received {self.poll_bytes / 1e6:.2f} MB ({self.poll_bytes / 1e6 / self.duration:.2f} MB/s)')
+        return '\n'.join(lines)
+
+async def _viewer(client: Client, report: Report) -> None:
+    await client.connect()
+    while True:
+        started = time.monotonic()
+        try:
+            state = await client.poll()
+        except aiohttp.ClientError:
+            report.errors += 1
+            await asyncio.sleep(1)
+            continue
+        report.poll_latencies.append(time.monotonic() - started)
+        report.poll_bytes += state.ByteSize()
+
+async def _interactor(client: Client, report: Report, interval: float, rng: random.Random) -> None:
+    while not client.elements:
+        await asyncio.sleep(0.05)
+    while True:
+        await asyncio.sleep(rng.expovariate(1 / interval))
+        targets = [(kind, id) for kind in ('button', 'input') for id in client.find(kind)]
+        if not targets:
+            continue
+        (kind, id) = rng.choice(targets)
+        started = time.monotonic()
+        try:
+            if kind == 'button':
+                await client.click(id)
+            elif client.elements[id].tag.attributes.misc.get('type') == 'range':
+                await client.slide(id, rng.random())
+            else:
+                await client.text_input(id, ''.join(rng.choices(string.ascii_letters, k=8)))
+        except aiohttp.ClientError:
+            report.errors += 1
+            continue
+        report.interaction_latencies.append(time.monotonic() - started)
+
+async def run_load(
+    url: str,
+    *,
+    viewers: int,
+    interactors: int = 0,
+    duration: float = 10,
+    interval: float = 1,
+    seed: Optional[int] = None,
+) -> Report:
+    '''Run ``viewers + interactors`` simulated clients against the server at ``url`` for ``duration`` seconds.'''
+    rng = random.Random(seed)
+    report = Report(duration=duration, n_clients=viewers + interactors)
+    # One connection pool for everybody, but a cookie jar each: against a session
+    # server (see braggle.server.build_session_app), each client is a visitor with its
+    # own session, as each browser tab would be.
+    async with aiohttp.TCPConnector(limit=0) as connector:
+        clients = [Client(url, session=_client_session(connector)) for _ in range(viewers + interactors)]
+        tasks = [asyncio.ensure_future(_viewer(c, report)) for c in clients]
+        tasks += [asyncio.ensure_future(_interactor(c, report, interval, rng)) for c in clients[viewers:]]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=duration, return_when=asyncio.FIRST_EXCEPTION)
+            for t in done:
+                t.result()
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for c in clients:
+                await c.session.close()
+    return report
+
+def _client_session(connector: aiohttp.BaseConnector) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        connector=connector,
+        connector_owner=False,
+        cookie_jar=aiohttp.CookieJar(unsafe=True),
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=30),
+    )
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m braggle.loadgen', description=__doc__.split('\n\n')[0])
+    parser.add_argument('url', help='the auth URL the server printed, http://HOST:PORT/auth/TOKEN')
+    parser.add_argument('--viewers', type=int, default=100, help='clients that only poll')
+    parser.add_argument('--interactors', type=int, default=10, help='clients that poll and interact')
+    parser.add_argument('--duration', type=float, default=10, help='seconds to run for')
+    parser.add_argument('--interval', type=float, default=1, help='mean seconds between each interactor\'s interactions')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+    report = asyncio.run(run_load(
+        args.url,
+        viewers=args.viewers,
+        interactors=args.interactors,
+        duration=args.duration,
+        interval=args.interval,
+        seed=args.seed,
+    ))
+    print(report.summary())
+
+if __name__ == '__main__':
+    main()
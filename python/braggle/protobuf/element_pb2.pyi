@@ -2,11 +2,11 @@
 import sys
 from google.protobuf.descriptor import (
     Descriptor as google___protobuf___descriptor___Descriptor,
-    FileDescriptor as google___protobuf___descriptor___FileDescriptor,
 )
 
 from google.protobuf.internal.containers import (
     RepeatedCompositeFieldContainer as google___protobuf___internal___containers___RepeatedCompositeFieldContainer,
+    RepeatedScalarFieldContainer as google___protobuf___internal___containers___RepeatedScalarFieldContainer,
 )
 
 from google.protobuf.message import (
@@ -19,7 +19,6 @@ from typing import (
     MutableMapping as typing___MutableMapping,
     Optional as typing___Optional,
     Text as typing___Text,
-    Union as typing___Union,
 )
 
 from typing_extensions import (
@@ -31,33 +30,28 @@ builtin___bool = bool
 builtin___bytes = bytes
 builtin___float = float
 builtin___int = int
-if sys.version_info < (3,):
-    builtin___buffer = buffer
-    builtin___unicode = unicode
 
 
-DESCRIPTOR: google___protobuf___descriptor___FileDescriptor = ...
-
 class Attributes(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     class MiscEntry(google___protobuf___message___Message):
         DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-        key: typing___Text = ...
-        value: typing___Text = ...
+        key = ... # type: typing___Text
+        value = ... # type: typing___Text
 
         def __init__(self,
             *,
             key : typing___Optional[typing___Text] = None,
             value : typing___Optional[typing___Text] = None,
             ) -> None: ...
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> Attributes.MiscEntry: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
         if sys.version_info >= (3,):
-            @classmethod
-            def FromString(cls, s: builtin___bytes) -> Attributes.MiscEntry: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
         else:
-            @classmethod
-            def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Attributes.MiscEntry: ...
-        def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
-    type___MiscEntry = MiscEntry
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
 
 
     @property
@@ -67,238 +61,454 @@ class Attributes(google___protobuf___message___Message):
         *,
         misc : typing___Optional[typing___Mapping[typing___Text, typing___Text]] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> Attributes: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> Attributes: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"misc"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Attributes: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"misc",b"misc"]) -> None: ...
-type___Attributes = Attributes
+        def ClearField(self, field_name: typing_extensions___Literal[u"misc",b"misc"]) -> None: ...
 
 class Tag(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-    tagname: typing___Text = ...
+    tagname = ... # type: typing___Text
 
     @property
-    def attributes(self) -> type___Attributes: ...
+    def attributes(self) -> Attributes: ...
 
     @property
-    def children(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[type___Element]: ...
+    def children(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Element]: ...
 
     def __init__(self,
         *,
         tagname : typing___Optional[typing___Text] = None,
-        attributes : typing___Optional[type___Attributes] = None,
-        children : typing___Optional[typing___Iterable[type___Element]] = None,
+        attributes : typing___Optional[Attributes] = None,
+        children : typing___Optional[typing___Iterable[Element]] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> Tag: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> Tag: ...
+        def HasField(self, field_name: typing_extensions___Literal[u"attributes"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"attributes",u"children",u"tagname"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Tag: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"attributes",b"attributes"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"attributes",b"attributes",u"children",b"children",u"tagname",b"tagname"]) -> None: ...
-type___Tag = Tag
+        def HasField(self, field_name: typing_extensions___Literal[u"attributes",b"attributes"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"attributes",b"attributes",u"children",b"children",u"tagname",b"tagname"]) -> None: ...
+
+class Series(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    name = ... # type: typing___Text
+    x = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float]
+    y = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___float]
+
+    def __init__(self,
+        *,
+        name : typing___Optional[typing___Text] = None,
+        x : typing___Optional[typing___Iterable[builtin___float]] = None,
+        y : typing___Optional[typing___Iterable[builtin___float]] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> Series: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",u"x",u"y"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"name",b"name",u"x",b"x",u"y",b"y"]) -> None: ...
+
+class Chart(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    is_delta = ... # type: builtin___bool
+    retention = ... # type: builtin___int
+    width = ... # type: builtin___int
+    height = ... # type: builtin___int
+
+    @property
+    def series(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Series]: ...
+
+    def __init__(self,
+        *,
+        series : typing___Optional[typing___Iterable[Series]] = None,
+        is_delta : typing___Optional[builtin___bool] = None,
+        retention : typing___Optional[builtin___int] = None,
+        width : typing___Optional[builtin___int] = None,
+        height : typing___Optional[builtin___int] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> Chart: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"height",u"is_delta",u"retention",u"series",u"width"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"height",b"height",u"is_delta",b"is_delta",u"retention",b"retention",u"series",b"series",u"width",b"width"]) -> None: ...
+
+class TemplateInstance(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    template_id = ... # type: builtin___int
+
+    @property
+    def slots(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[Element]: ...
+
+    def __init__(self,
+        *,
+        template_id : typing___Optional[builtin___int] = None,
+        slots : typing___Optional[typing___Iterable[Element]] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> TemplateInstance: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"slots",u"template_id"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"slots",b"slots",u"template_id",b"template_id"]) -> None: ...
 
 class Element(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-    ref: typing___Text = ...
-    text: typing___Text = ...
+    ref = ... # type: builtin___int
+    text = ... # type: typing___Text
+    raw_html = ... # type: typing___Text
+    slot = ... # type: builtin___int
+
+    @property
+    def tag(self) -> Tag: ...
+
+    @property
+    def chart(self) -> Chart: ...
 
     @property
-    def tag(self) -> type___Tag: ...
+    def instance(self) -> TemplateInstance: ...
 
     def __init__(self,
         *,
-        ref : typing___Optional[typing___Text] = None,
+        ref : typing___Optional[builtin___int] = None,
         text : typing___Optional[typing___Text] = None,
-        tag : typing___Optional[type___Tag] = None,
+        tag : typing___Optional[Tag] = None,
+        chart : typing___Optional[Chart] = None,
+        raw_html : typing___Optional[typing___Text] = None,
+        slot : typing___Optional[builtin___int] = None,
+        instance : typing___Optional[TemplateInstance] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> Element: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> Element: ...
+        def HasField(self, field_name: typing_extensions___Literal[u"chart",u"element_kind",u"instance",u"raw_html",u"ref",u"slot",u"tag",u"text"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"chart",u"element_kind",u"instance",u"raw_html",u"ref",u"slot",u"tag",u"text"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Element: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"element_kind",b"element_kind",u"ref",b"ref",u"tag",b"tag",u"text",b"text"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"element_kind",b"element_kind",u"ref",b"ref",u"tag",b"tag",u"text",b"text"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"element_kind",b"element_kind"]) -> typing_extensions___Literal["ref","text","tag"]: ...
-type___Element = Element
+        def HasField(self, field_name: typing_extensions___Literal[u"chart",b"chart",u"element_kind",b"element_kind",u"instance",b"instance",u"raw_html",b"raw_html",u"ref",b"ref",u"slot",b"slot",u"tag",b"tag",u"text",b"text"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"chart",b"chart",u"element_kind",b"element_kind",u"instance",b"instance",u"raw_html",b"raw_html",u"ref",b"ref",u"slot",b"slot",u"tag",b"tag",u"text",b"text"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"element_kind",b"element_kind"]) -> typing_extensions___Literal["ref","text","tag","chart","raw_html","slot","instance"]: ...
 
 class PartialServerState(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
     class ElementsEntry(google___protobuf___message___Message):
         DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-        key: typing___Text = ...
+        key = ... # type: builtin___int
 
         @property
-        def value(self) -> type___Element: ...
+        def value(self) -> Element: ...
 
         def __init__(self,
             *,
-            key : typing___Optional[typing___Text] = None,
-            value : typing___Optional[type___Element] = None,
+            key : typing___Optional[builtin___int] = None,
+            value : typing___Optional[Element] = None,
             ) -> None: ...
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> PartialServerState.ElementsEntry: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
         if sys.version_info >= (3,):
-            @classmethod
-            def FromString(cls, s: builtin___bytes) -> PartialServerState.ElementsEntry: ...
+            def HasField(self, field_name: typing_extensions___Literal[u"value"]) -> builtin___bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
         else:
-            @classmethod
-            def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PartialServerState.ElementsEntry: ...
-        def HasField(self, field_name: typing_extensions___Literal[u"value",b"value"]) -> builtin___bool: ...
-        def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
-    type___ElementsEntry = ElementsEntry
+            def HasField(self, field_name: typing_extensions___Literal[u"value",b"value"]) -> builtin___bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
 
-    timestep: builtin___int = ...
-    root_id: typing___Text = ...
+    timestep = ... # type: builtin___int
+    root_id = ... # type: builtin___int
+    stylesheet_id = ... # type: builtin___int
 
     @property
-    def elements(self) -> typing___MutableMapping[typing___Text, type___Element]: ...
+    def elements(self) -> typing___MutableMapping[builtin___int, Element]: ...
 
     def __init__(self,
         *,
         timestep : typing___Optional[builtin___int] = None,
-        root_id : typing___Optional[typing___Text] = None,
-        elements : typing___Optional[typing___Mapping[typing___Text, type___Element]] = None,
+        root_id : typing___Optional[builtin___int] = None,
+        elements : typing___Optional[typing___Mapping[builtin___int, Element]] = None,
+        stylesheet_id : typing___Optional[builtin___int] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> PartialServerState: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> PartialServerState: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"elements",u"root_id",u"stylesheet_id",u"timestep"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PartialServerState: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"elements",b"elements",u"root_id",b"root_id",u"timestep",b"timestep"]) -> None: ...
-type___PartialServerState = PartialServerState
+        def ClearField(self, field_name: typing_extensions___Literal[u"elements",b"elements",u"root_id",b"root_id",u"stylesheet_id",b"stylesheet_id",u"timestep",b"timestep"]) -> None: ...
 
 class PollRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-    since_timestep: builtin___int = ...
+    since_timestep = ... # type: builtin___int
+    known_templates = ... # type: builtin___int
 
     def __init__(self,
         *,
         since_timestep : typing___Optional[builtin___int] = None,
+        known_templates : typing___Optional[builtin___int] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> PollRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> PollRequest: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"known_templates",u"since_timestep"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PollRequest: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"since_timestep",b"since_timestep"]) -> None: ...
-type___PollRequest = PollRequest
+        def ClearField(self, field_name: typing_extensions___Literal[u"known_templates",b"known_templates",u"since_timestep",b"since_timestep"]) -> None: ...
 
 class PollResponse(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    class TemplatesEntry(google___protobuf___message___Message):
+        DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+        key = ... # type: builtin___int
+
+        @property
+        def value(self) -> Element: ...
+
+        def __init__(self,
+            *,
+            key : typing___Optional[builtin___int] = None,
+            value : typing___Optional[Element] = None,
+            ) -> None: ...
+        @classmethod
+        def FromString(cls, s: builtin___bytes) -> PollResponse.TemplatesEntry: ...
+        def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+        if sys.version_info >= (3,):
+            def HasField(self, field_name: typing_extensions___Literal[u"value"]) -> builtin___bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",u"value"]) -> None: ...
+        else:
+            def HasField(self, field_name: typing_extensions___Literal[u"value",b"value"]) -> builtin___bool: ...
+            def ClearField(self, field_name: typing_extensions___Literal[u"key",b"key",u"value",b"value"]) -> None: ...
+
+    trace_ids = ... # type: google___protobuf___internal___containers___RepeatedScalarFieldContainer[builtin___int]
+
+    @property
+    def state(self) -> PartialServerState: ...
 
     @property
-    def state(self) -> type___PartialServerState: ...
+    def templates(self) -> typing___MutableMapping[builtin___int, Element]: ...
 
     def __init__(self,
         *,
-        state : typing___Optional[type___PartialServerState] = None,
+        state : typing___Optional[PartialServerState] = None,
+        templates : typing___Optional[typing___Mapping[builtin___int, Element]] = None,
+        trace_ids : typing___Optional[typing___Iterable[builtin___int]] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> PollResponse: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> PollResponse: ...
+        def HasField(self, field_name: typing_extensions___Literal[u"state"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"state",u"templates",u"trace_ids"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> PollResponse: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"state",b"state"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"state",b"state"]) -> None: ...
-type___PollResponse = PollResponse
+        def HasField(self, field_name: typing_extensions___Literal[u"state",b"state"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"state",b"state",u"templates",b"templates",u"trace_ids",b"trace_ids"]) -> None: ...
 
 class ClickEvent(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-    element_id: typing___Text = ...
+    element_id = ... # type: builtin___int
 
     def __init__(self,
         *,
-        element_id : typing___Optional[typing___Text] = None,
+        element_id : typing___Optional[builtin___int] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> ClickEvent: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> ClickEvent: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> ClickEvent: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"element_id",b"element_id"]) -> None: ...
-type___ClickEvent = ClickEvent
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",b"element_id"]) -> None: ...
 
 class TextInputEvent(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
-    element_id: typing___Text = ...
-    value: typing___Text = ...
+    element_id = ... # type: builtin___int
+    value = ... # type: typing___Text
 
     def __init__(self,
         *,
-        element_id : typing___Optional[typing___Text] = None,
+        element_id : typing___Optional[builtin___int] = None,
         value : typing___Optional[typing___Text] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> TextInputEvent: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> TextInputEvent: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",u"value"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> TextInputEvent: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"element_id",b"element_id",u"value",b"value"]) -> None: ...
-type___TextInputEvent = TextInputEvent
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",b"element_id",u"value",b"value"]) -> None: ...
+
+class SlideEvent(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    element_id = ... # type: builtin___int
+    value = ... # type: builtin___float
+
+    def __init__(self,
+        *,
+        element_id : typing___Optional[builtin___int] = None,
+        value : typing___Optional[builtin___float] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> SlideEvent: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",u"value"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",b"element_id",u"value",b"value"]) -> None: ...
+
+class PointerMoveEvent(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    element_id = ... # type: builtin___int
+    x = ... # type: builtin___float
+    y = ... # type: builtin___float
+    pressed = ... # type: builtin___bool
+
+    def __init__(self,
+        *,
+        element_id : typing___Optional[builtin___int] = None,
+        x : typing___Optional[builtin___float] = None,
+        y : typing___Optional[builtin___float] = None,
+        pressed : typing___Optional[builtin___bool] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> PointerMoveEvent: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",u"pressed",u"x",u"y"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"element_id",b"element_id",u"pressed",b"pressed",u"x",b"x",u"y",b"y"]) -> None: ...
 
 class Interaction(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
 
     @property
-    def click(self) -> type___ClickEvent: ...
+    def click(self) -> ClickEvent: ...
+
+    @property
+    def text_input(self) -> TextInputEvent: ...
 
     @property
-    def text_input(self) -> type___TextInputEvent: ...
+    def slide(self) -> SlideEvent: ...
+
+    @property
+    def pointer_move(self) -> PointerMoveEvent: ...
 
     def __init__(self,
         *,
-        click : typing___Optional[type___ClickEvent] = None,
-        text_input : typing___Optional[type___TextInputEvent] = None,
+        click : typing___Optional[ClickEvent] = None,
+        text_input : typing___Optional[TextInputEvent] = None,
+        slide : typing___Optional[SlideEvent] = None,
+        pointer_move : typing___Optional[PointerMoveEvent] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> Interaction: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> Interaction: ...
+        def HasField(self, field_name: typing_extensions___Literal[u"click",u"interaction_kind",u"pointer_move",u"slide",u"text_input"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"click",u"interaction_kind",u"pointer_move",u"slide",u"text_input"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> Interaction: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"click",b"click",u"interaction_kind",b"interaction_kind",u"text_input",b"text_input"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"click",b"click",u"interaction_kind",b"interaction_kind",u"text_input",b"text_input"]) -> None: ...
-    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"interaction_kind",b"interaction_kind"]) -> typing_extensions___Literal["click","text_input"]: ...
-type___Interaction = Interaction
+        def HasField(self, field_name: typing_extensions___Literal[u"click",b"click",u"interaction_kind",b"interaction_kind",u"pointer_move",b"pointer_move",u"slide",b"slide",u"text_input",b"text_input"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"click",b"click",u"interaction_kind",b"interaction_kind",u"pointer_move",b"pointer_move",u"slide",b"slide",u"text_input",b"text_input"]) -> None: ...
+    def WhichOneof(self, oneof_group: typing_extensions___Literal[u"interaction_kind",b"interaction_kind"]) -> typing_extensions___Literal["click","text_input","slide","pointer_move"]: ...
 
 class InteractionRequest(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
 
     @property
-    def interaction(self) -> type___Interaction: ...
+    def interaction(self) -> Interaction: ...
 
     def __init__(self,
         *,
-        interaction : typing___Optional[type___Interaction] = None,
+        interaction : typing___Optional[Interaction] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> InteractionRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> InteractionRequest: ...
+        def HasField(self, field_name: typing_extensions___Literal[u"interaction"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"interaction"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> InteractionRequest: ...
-    def HasField(self, field_name: typing_extensions___Literal[u"interaction",b"interaction"]) -> builtin___bool: ...
-    def ClearField(self, field_name: typing_extensions___Literal[u"interaction",b"interaction"]) -> None: ...
-type___InteractionRequest = InteractionRequest
+        def HasField(self, field_name: typing_extensions___Literal[u"interaction",b"interaction"]) -> builtin___bool: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"interaction",b"interaction"]) -> None: ...
 
 class InteractionResponse(google___protobuf___message___Message):
     DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    trace_id = ... # type: builtin___int
 
     def __init__(self,
+        *,
+        trace_id : typing___Optional[builtin___int] = None,
         ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> InteractionResponse: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
     if sys.version_info >= (3,):
-        @classmethod
-        def FromString(cls, s: builtin___bytes) -> InteractionResponse: ...
+        def ClearField(self, field_name: typing_extensions___Literal[u"trace_id"]) -> None: ...
     else:
-        @classmethod
-        def FromString(cls, s: typing___Union[builtin___bytes, builtin___buffer, builtin___unicode]) -> InteractionResponse: ...
-type___InteractionResponse = InteractionResponse
+        def ClearField(self, field_name: typing_extensions___Literal[u"trace_id",b"trace_id"]) -> None: ...
+
+class PaintReport(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+    trace_id = ... # type: builtin___int
+    end_to_end_ms = ... # type: builtin___float
+    round_trip_ms = ... # type: builtin___float
+    render_ms = ... # type: builtin___float
+
+    def __init__(self,
+        *,
+        trace_id : typing___Optional[builtin___int] = None,
+        end_to_end_ms : typing___Optional[builtin___float] = None,
+        round_trip_ms : typing___Optional[builtin___float] = None,
+        render_ms : typing___Optional[builtin___float] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> PaintReport: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"end_to_end_ms",u"render_ms",u"round_trip_ms",u"trace_id"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"end_to_end_ms",b"end_to_end_ms",u"render_ms",b"render_ms",u"round_trip_ms",b"round_trip_ms",u"trace_id",b"trace_id"]) -> None: ...
+
+class PaintReportRequest(google___protobuf___message___Message):
+    DESCRIPTOR: google___protobuf___descriptor___Descriptor = ...
+
+    @property
+    def reports(self) -> google___protobuf___internal___containers___RepeatedCompositeFieldContainer[PaintReport]: ...
+
+    def __init__(self,
+        *,
+        reports : typing___Optional[typing___Iterable[PaintReport]] = None,
+        ) -> None: ...
+    @classmethod
+    def FromString(cls, s: builtin___bytes) -> PaintReportRequest: ...
+    def MergeFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    def CopyFrom(self, other_msg: google___protobuf___message___Message) -> None: ...
+    if sys.version_info >= (3,):
+        def ClearField(self, field_name: typing_extensions___Literal[u"reports"]) -> None: ...
+    else:
+        def ClearField(self, field_name: typing_extensions___Literal[u"reports",b"reports"]) -> None: ...
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
+
 from .protobuf import element_pb2
 from dataclasses import dataclass
-from typing import Mapping, Sequence, Union
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Union
 
-from . import element
+from . import _wire, element
 from .types import ElementId, TimeStep
 
 def text(s: str) -> element_pb2.Element:
@@ -23,3 +26,102 @@ def tag(
         attributes=element_pb2.Attributes(misc=attributes),
         children=[ref(child) if isinstance(child, element.Element) else child for child in children],
     ))
+
+def slot(i: int) -> element_pb2.Element:
+    '''A placeholder, in a :class:`Template` body, for an instance's ``i``-th slot.'''
+    return element_pb2.Element(slot=i)
+
+class TemplateRegistry:
+    '''Numbers the templates one GUI uses, in order of first use.
+
+    Each GUI has its own, so its clients are only sent the templates its elements
+    actually use, however many other GUIs (e.g. other sessions) there are.
+    '''
+    def __init__(self) -> None:
+        self._templates: List[Template] = []
+        self._ids: Dict[Template, int] = {}
+
+    def id_of(self, template: Template) -> int:
+        id = self._ids.get(template)
+        if id is None:
+            id = self._ids[template] = len(self._templates)
+            self._templates.append(template)
+        return id
+
+    def body(self, id: int) -> element_pb2.Element:
+        return self._templates[id].body
+
+    def since(self, n_known: int) -> Dict[int, element_pb2.Element]:
+        '''The bodies of all templates a client that knows the first ``n_known`` doesn't, by id.'''
+        return {id: t.body for (id, t) in enumerate(self._templates[n_known:], n_known)}
+
+    @contextlib.contextmanager
+    def active(self) -> Iterator[None]:
+        '''Number the templates used within this block (e.g. while rendering a GUI) from this registry.'''
+        token = _active_registry.set(self)
+        try:
+            yield
+        finally:
+            _active_registry.reset(token)
+
+# For rendering that isn't on behalf of any GUI (e.g. an element on its own).
+_DEFAULT_REGISTRY = TemplateRegistry()
+_active_registry: contextvars.ContextVar[TemplateRegistry] = contextvars.ContextVar('template_registry', default=_DEFAULT_REGISTRY)
+
+class Template:
+    '''A structure that's sent to each client once, after which instances of it cost only their slot values.
+
+    Useful for boilerplate repeated many times per element, like a table cell's attributes:
+
+        >>> cell = Template(tag('td', [slot(0)], attributes={'style': 'border: 1px solid black'}))
+        >>> row = tag('tr', [cell(text('a')), cell(text('b'))])
+
+    Each GUI numbers the templates its elements use (see :class:`TemplateRegistry`) and
+    never forgets them, so create templates once, at import time, rather than per element.
+    '''
+    def __init__(self, body: element_pb2.Element) -> None:
+        self.body = body
+
+    def __repr__(self) -> str:
+        return f'<Template {self.body!r}>'
+
+    @property
+    def id(self) -> int:
+        '''This template's id in the GUI being rendered.'''
+        return _active_registry.get().id_of(self)
+
+    def __call__(self, *slots: Union[element_pb2.Element, element.Element]) -> element_pb2.Element:
+        return element_pb2.Element(instance=element_pb2.TemplateInstance(
+            template_id=self.id,
+            slots=[ref(s) if isinstance(s, element.Element) else s for s in slots],
+        ))
+
+    def encode(self, *slots: _wire.Child) -> bytes:
+        '''Like calling the template, but returns the encoded ``Element`` (see :mod:`braggle._wire`).'''
+        return _wire.encode_instance(self.id, slots)
+
+def templates_since(n_known: int) -> Dict[int, element_pb2.Element]:
+    '''The bodies of all templates (in the active registry) a client that knows the first ``n_known`` doesn't, by id.'''
+    return _active_registry.get().since(n_known)
+
+def expand_templates(pb: element_pb2.Element, registry: Optional[TemplateRegistry] = None) -> element_pb2.Element:
+    '''Return a copy of ``pb`` with all template instances replaced by what they stand for.
+
+    ``registry`` is the one ``pb`` was rendered with; by default, the active one.
+    '''
+    return _expand(pb, slots=(), registry=_active_registry.get() if registry is None else registry)
+
+def _expand(pb: element_pb2.Element, slots: Sequence[element_pb2.Element], registry: TemplateRegistry) -> element_pb2.Element:
+    kind = pb.WhichOneof('element_kind')
+    if kind == 'slot':
+        return slots[pb.slot]
+    if kind == 'instance':
+        instance_slots = [_expand(s, slots, registry) for s in pb.instance.slots]
+        return _expand(registry.body(pb.instance.template_id), instance_slots, registry)
+    if kind == 'tag':
+        result = element_pb2.Element()
+        result.CopyFrom(pb)
+        del result.tag.children[:]
+        result.tag.children.extend(_expand(child, slots, registry) for child in pb.tag.children)
+        return result
+    return pb
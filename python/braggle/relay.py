@@ -0,0 +1,242 @@
+'''Re-serves another braggle server's GUI, read-only, to a large audience.
+
+    python -m braggle.relay http://localhost:8080/auth/TOKEN --port 9000
+
+A relay follows its upstream server the way a browser does, with one long poll (see
+:class:`braggle.client.Client`), and serves ``/poll`` to its own viewers from its copy
+of the elements. However many viewers it has, the upstream server sees one client;
+and since viewers mostly poll from the same timestep, each update is encoded once and
+sent to all of them. Relays can follow relays, to fan out further.
+
+Interactions are refused, unless ``--forward-interactions`` is given, in which case
+they're passed upstream. ``--upstream-socket`` connects to the upstream server over a
+Unix socket, and ``--socket`` serves viewers on one.
+'''
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import secrets
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from .client import Client
+from .protobuf import element_pb2
+from .server import _auth, _get_client_bundle, _run_app
+from .types import ElementId, TimeStep
+
+class Relay:
+    '''Serves what ``upstream`` (once started) sees.
+
+    ``history`` is how many upstream updates to remember which elements changed in;
+    viewers further behind than that get everything. At most ``max_cached_responses``
+    encoded responses are kept for each update.
+
+    Whenever the relay reconnects upstream (which might have restarted, or evicted its
+    session), it starts over from nothing. Its timesteps carry on from where they were,
+    so viewers can tell they need everything again.
+    '''
+    def __init__(
+        self,
+        upstream: Client,
+        *,
+        forward_interactions: bool = False,
+        compress_threshold: Optional[int] = 1024,
+        history: int = 1000,
+        retry_interval: float = 1,
+        max_cached_responses: int = 100,
+    ) -> None:
+        self.upstream = upstream
+        self.forward_interactions = forward_interactions
+        self.compress_threshold = compress_threshold
+        self.history = history
+        self.retry_interval = retry_interval
+        self.max_cached_responses = max_cached_responses
+        self.condition = asyncio.Condition()
+        # Added to upstream timesteps, so ours never go backwards when upstream's start over.
+        self._offset = 0
+        # The timesteps of the remembered upstream updates, and the ids of the elements each changed.
+        self._update_timesteps: List[TimeStep] = []
+        self._update_ids: List[Sequence[ElementId]] = []
+        # Encoded responses to this timestep's polls, by (since, known templates).
+        self._responses: Dict[Tuple[int, int], bytes] = {}
+        self._n_elements_after_prune = 0
+        self._following: Optional[asyncio.Task] = None
+
+    @property
+    def timestep(self) -> TimeStep:
+        return TimeStep(self._offset + self.upstream.timestep)
+
+    async def start(self, app: web.Application) -> None:
+        self._following = asyncio.ensure_future(self._follow())
+
+    async def stop(self, app: web.Application) -> None:
+        if self._following is not None:
+            self._following.cancel()
+        await self.upstream.close()
+
+    async def _follow(self) -> None:
+        connected = False
+        while True:
+            try:
+                if not connected:
+                    self._reset()
+                    await self.upstream.connect()
+                    connected = True
+                state = await self.upstream.poll()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                connected = False
+                await asyncio.sleep(self.retry_interval)
+                continue
+            self._record(self.timestep, [ElementId(id) for id in state.elements])
+            async with self.condition:
+                self.condition.notify_all()
+
+    def _reset(self) -> None:
+        self._offset = self.timestep
+        self.upstream.reset()
+        self._update_timesteps.clear()
+        self._update_ids.clear()
+        self._responses.clear()
+        self._n_elements_after_prune = 0
+
+    def _record(self, timestep: TimeStep, ids: Sequence[ElementId]) -> None:
+        self._update_timesteps.append(timestep)
+        self._update_ids.append(ids)
+        if len(self._update_timesteps) > self.history:
+            del self._update_timesteps[0], self._update_ids[0]
+        self._responses.clear()
+        # Like the browser, the upstream client never forgets elements, so clear out the dead ones now and then.
+        if len(self.upstream.elements) > 2 * self._n_elements_after_prune + 100:
+            self.upstream.prune()
+            self._n_elements_after_prune = len(self.upstream.elements)
+
+    def _changed_since(self, since: int) -> Sequence[ElementId]:
+        if (not self._update_timesteps) or since < self._update_timesteps[0]:
+            return list(self.upstream.elements)
+        start = bisect.bisect_right(self._update_timesteps, since)
+        return list({id for ids in self._update_ids[start:] for id in ids})
+
+    def encode_poll_response(self, since: int, known_templates: int) -> bytes:
+        if (since <= self._offset) or (since > self.timestep):
+            # The viewer's state is from before we last started over (or from some other relay).
+            (since, known_templates) = (0, 0)
+        key = (since, known_templates)
+        response = self._responses.get(key)
+        if response is None:
+            upstream = self.upstream
+            elements = upstream.elements
+            response = element_pb2.PollResponse(
+                state=element_pb2.PartialServerState(
+                    timestep=self.timestep,
+                    root_id=upstream.root_id,
+                    stylesheet_id=upstream.stylesheet_id,
+                    elements={id: elements[id] for id in self._changed_since(since) if id in elements},
+                ),
+                # Template ids count up from 0, so a client that knows n templates knows ids 0..n-1.
+                templates={id: t for (id, t) in upstream.templates.items() if id >= known_templates},
+            ).SerializeToString()
+            # Keys come from viewers, so don't let them grow the cache without bound.
+            if len(self._responses) < self.max_cached_responses:
+                self._responses[key] = response
+        return response
+
+    def build_routes(self) -> Sequence[web.RouteDef]:
+        return [
+            web.get('/', self.index, name='index'),
+            web.post('/poll', self.poll),
+            web.post('/interaction', self.interaction),
+            web.get('/blob/{name}', self.blob),
+        ]
+
+    async def index(self, request: web.BaseRequest) -> web.StreamResponse:
+        return _get_client_bundle().response(request)
+
+    async def poll(self, request: web.BaseRequest) -> web.StreamResponse:
+        request_pb = element_pb2.PollRequest.FromString(await request.content.read())
+        since = request_pb.since_timestep
+        async with self.condition:
+            # Viewers ahead of us (e.g. of a relay that's since restarted) get everything straight away.
+            await self.condition.wait_for(lambda: bool(self._update_timesteps) and (self.timestep != since))
+        body = self.encode_poll_response(since, request_pb.known_templates)
+        response = web.Response(status=200, content_type='application/octet_stream', body=body)
+        if (self.compress_threshold is not None) and len(body) >= self.compress_threshold:
+            response.enable_compression()
+        return response
+
+    async def interaction(self, request: web.BaseRequest) -> web.StreamResponse:
+        if not self.forward_interactions:
+            raise web.HTTPForbidden(text='this relay is read-only')
+        request_pb = element_pb2.InteractionRequest.FromString(await request.content.read())
+        try:
+            response = await self.upstream.interact(request_pb.interaction)
+        except aiohttp.ClientResponseError as e:
+            return web.Response(status=e.status, text=e.message)
+        return web.Response(status=200, content_type='application/octet_stream', body=response.SerializeToString())
+
+    async def blob(self, request: web.Request) -> web.StreamResponse:
+        async with self.upstream.session.get(f'{self.upstream.base_url}/blob/{request.match_info["name"]}') as upstream:
+            headers = {k: upstream.headers[k] for k in ('ETag', 'Cache-Control') if k in upstream.headers}
+            return web.Response(status=upstream.status, body=await upstream.read(), content_type=upstream.content_type, headers=headers)
+
+def build_relay_app(
+    upstream_url: str,
+    *,
+    token: str,
+    upstream_socket: Optional[str] = None,
+    forward_interactions: bool = False,
+    compress_threshold: Optional[int] = 1024,
+) -> web.Application:
+    '''An app relaying the GUI served at ``upstream_url`` (an auth URL, ``http://host:port/auth/TOKEN``).'''
+    relay = Relay(Client(upstream_url, unix_socket=upstream_socket), forward_interactions=forward_interactions, compress_threshold=compress_threshold)
+    app = web.Application(middlewares=[_auth.build_middleware(token=token)])
+    app.on_startup.append(relay.start)
+    app.on_cleanup.append(relay.stop)
+    app.add_routes(_auth.build_routes(token=token))
+    app.add_routes(relay.build_routes())
+    return app
+
+async def serve_relay_async(
+    upstream_url: str,
+    *,
+    host: str = 'localhost',
+    port: Optional[int] = None,
+    token: Optional[str] = None,
+    open_browser: bool = False,
+    upstream_socket: Optional[str] = None,
+    forward_interactions: bool = False,
+    compress_threshold: Optional[int] = 1024,
+    path: Optional[str] = None,
+) -> None:
+    if token is None:
+        token = secrets.token_urlsafe(32)
+    app = build_relay_app(upstream_url, token=token, upstream_socket=upstream_socket, forward_interactions=forward_interactions, compress_threshold=compress_threshold)
+    await _run_app(app, host=host, port=port, token=token, open_browser=open_browser, path=path)
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog='python -m braggle.relay', description=__doc__.split('\n\n')[0])
+    parser.add_argument('url', help='the auth URL the upstream server printed, http://HOST:PORT/auth/TOKEN')
+    parser.add_argument('--upstream-socket', default=None, help='connect to the upstream server through this Unix socket')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--socket', default=None, help='listen on this Unix socket instead of HOST:PORT')
+    parser.add_argument('--token', default=None, help="viewers' auth token (default: random)")
+    parser.add_argument('--forward-interactions', action='store_true', help='pass interactions upstream, instead of refusing them')
+    args = parser.parse_args(argv)
+    asyncio.run(serve_relay_async(
+        args.url,
+        host=args.host,
+        port=args.port,
+        token=args.token,
+        path=args.socket,
+        upstream_socket=args.upstream_socket,
+        forward_interactions=args.forward_interactions,
+    ))
+
+if __name__ == '__main__':
+    main()
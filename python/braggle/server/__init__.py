@@ -1,25 +1,46 @@
 import asyncio
 import base64
 import functools
+import mimetypes
 import secrets
 import socket
 import time
 import webbrowser
 
 from pathlib import Path
-from typing import Iterable, MutableSet, Optional, Sequence, Set, Tuple, TypeVar, Callable, Awaitable
+from typing import Iterable, MutableMapping, MutableSet, Optional, Sequence, Set, Tuple, TypeVar, Callable, Awaitable
 
 from aiohttp import web
 
+from .._blobs import BlobStore, DEFAULT_STORE
 from ..element import Element
-from ..gui import AbstractGUI
+from ..gui import AbstractGUI, ThreadSafeGUI
+from .. import _wire
 from ..protobuf import element_pb2
 from ..types import ElementId
 from . import _auth
+from ._bundle import PrecompressedFile, etag_matches
+from ._metrics import ServerMetrics
+from ._sessions import SessionManager
+from ._tracing import TraceRecorder
+from ._watchdog import Watchdog
+from ._workers import serve_workers
 
 CLIENT_HTML = (Path(__file__).parent / 'static' / 'index.html').resolve()
 assert CLIENT_HTML.is_file()
 
+_client_bundle: Optional[PrecompressedFile] = None
+def _get_client_bundle() -> PrecompressedFile:
+    global _client_bundle
+    if _client_bundle is None:
+        _client_bundle = PrecompressedFile(CLIENT_HTML, content_type='text/html')
+    return _client_bundle
+
+# Interactions that can arrive many times a second, and for which only the latest
+# one matters: if several for the same element queue up behind the GUI lock,
+# only the newest gets dispatched.
+_COALESCED_INTERACTION_KINDS = frozenset({'slide', 'pointer_move'})
+
 _T = TypeVar('_T')
 def _union(xss: Iterable[Iterable[_T]]) -> Set[_T]:
     result: MutableSet[_T] = set()
@@ -28,58 +49,281 @@ def _union(xss: Iterable[Iterable[_T]]) -> Set[_T]:
     return set(result)
 
 class Server:
-    def __init__(self, gui: AbstractGUI, condition: asyncio.Condition):
+    def __init__(
+        self,
+        gui: AbstractGUI,
+        condition: asyncio.Condition,
+        *,
+        max_update_rate: Optional[float] = None,
+        compress_threshold: Optional[int] = 1024,
+        blob_store: BlobStore = DEFAULT_STORE,
+        metrics: Optional[ServerMetrics] = None,
+        tracer: Optional[TraceRecorder] = None,
+        watchdog: Optional[Watchdog] = None,
+        stats: bool = False,
+    ):
+        """
+        :param max_update_rate: if given, the most poll responses per second any one
+          client will receive. Changes made in between are merged into the next response.
+        :param compress_threshold: poll responses at least this many bytes long are
+          compressed, if the client accepts it; None to never compress.
+        :param blob_store: where to find the contents of :class:`braggle.MemoryImage`s.
+        :param metrics: if given, where to record how the server's doing, which is served at ``/metrics``.
+        :param tracer: if given, where to record click-to-paint traces, which are summarized at ``/debug/traces``.
+        :param watchdog: if given, its event loop stalls are listed at ``/debug/stalls``,
+          and ``/debug/profile?seconds=N`` profiles the event loop for N seconds.
+        :param stats: whether to serve the GUI's :meth:`braggle.AbstractGUI.stats` at
+          ``/debug/stats?top=N``. Each request walks and encodes the whole GUI.
+        """
+        if (max_update_rate is not None) and max_update_rate <= 0:
+            raise ValueError(f'max_update_rate must be positive, not {max_update_rate}')
         self.gui = gui
         self.condition = condition
+        self.min_update_interval = 0.0 if max_update_rate is None else 1 / max_update_rate
+        self.compress_threshold = compress_threshold
+        self.blob_store = blob_store
+        self.metrics = metrics
+        self.tracer = tracer
+        self.watchdog = watchdog
+        self.stats = stats
+        self.closed = False
+        self._latest_interactions: MutableMapping[Tuple[str, ElementId], element_pb2.Interaction] = {}
+        # Scratch space for encoding poll responses, reused to save reallocating it every time.
+        self._state_buffer = bytearray()
 
-    def build_routes(self) -> Sequence[web.RouteDef]:
+    @staticmethod
+    def route_table(*, metrics: bool = False, tracing: bool = False, watchdog: bool = False, stats: bool = False) -> Sequence[Tuple[str, str, str]]:
+        '''The (method, path, handler method name) of each route a server with the given features serves.'''
         return [
-            web.get('/', self.index),
-            web.post('/poll', self.poll),
-            web.post('/interaction', self.interaction),
+            ('GET', '/', 'index'),
+            ('POST', '/poll', 'poll'),
+            ('POST', '/interaction', 'interaction'),
+            ('GET', '/blob/{name}', 'blob'),
+            *([('GET', '/metrics', 'metrics_endpoint')] if metrics else []),
+            *([('POST', '/trace', 'trace'), ('GET', '/debug/traces', 'traces_endpoint')] if tracing else []),
+            *([('GET', '/debug/stalls', 'stalls_endpoint'), ('GET', '/debug/profile', 'profile_endpoint')] if watchdog else []),
+            *([('GET', '/debug/stats', 'stats_endpoint')] if stats else []),
         ]
 
+    def build_routes(self) -> Sequence[web.RouteDef]:
+        table = self.route_table(metrics=self.metrics is not None, tracing=self.tracer is not None, watchdog=self.watchdog is not None, stats=self.stats)
+        return [web.route(method, path, getattr(self, name), name=name) for (method, path, name) in table]
+
+    async def close(self) -> None:
+        '''Stop serving: waiting polls, and any further requests, get ``410 Gone``.'''
+        self.closed = True
+        async with self.condition:
+            self.condition.notify_all()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise web.HTTPGone(text='this GUI is no longer being served')
+
+    async def metrics_endpoint(self, request: web.BaseRequest) -> web.StreamResponse:
+        assert self.metrics is not None
+        return web.Response(text=self.metrics.render(), content_type='text/plain', charset='utf-8', headers={'Cache-Control': 'no-store'})
+
+    async def trace(self, request: web.BaseRequest) -> web.StreamResponse:
+        assert self.tracer is not None
+        for report in element_pb2.PaintReportRequest.FromString(await request.content.read()).reports:
+            self.tracer.painted(report)
+        return web.Response(status=204)
+
+    async def traces_endpoint(self, request: web.BaseRequest) -> web.StreamResponse:
+        assert self.tracer is not None
+        if request.query.get('format') == 'chrome':
+            return web.json_response(self.tracer.trace_events(), headers={'Cache-Control': 'no-store'})
+        return web.json_response(self.tracer.summary(), headers={'Cache-Control': 'no-store'})
+
+    async def stats_endpoint(self, request: web.BaseRequest) -> web.StreamResponse:
+        assert self.stats
+        try:
+            n_largest = int(request.query.get('top', '10'))
+        except ValueError:
+            raise web.HTTPBadRequest(text='top must be an integer')
+        if n_largest < 0:
+            raise web.HTTPBadRequest(text='top must be non-negative')
+        # Nothing here awaits, so the GUI can't change underfoot; and not taking the
+        # condition's lock means waiting polls aren't held up any longer than they must be.
+        stats = self.gui.stats(n_largest=n_largest)
+        return web.json_response(stats.to_json(), headers={'Cache-Control': 'no-store'})
+
+    async def stalls_endpoint(self, request: web.BaseRequest) -> web.StreamResponse:
+        assert self.watchdog is not None
+        return web.json_response(self.watchdog.summary(), headers={'Cache-Control': 'no-store'})
+
+    async def profile_endpoint(self, request: web.BaseRequest) -> web.StreamResponse:
+        assert self.watchdog is not None
+        try:
+            seconds = float(request.query.get('seconds', '5'))
+        except ValueError:
+            raise web.HTTPBadRequest(text='seconds must be a number')
+        if not 0 < seconds <= 300:
+            raise web.HTTPBadRequest(text='seconds must be in (0, 300]')
+        sort = request.query.get('sort', 'cumulative')
+        if sort not in ('cumulative', 'tottime', 'calls'):
+            raise web.HTTPBadRequest(text='sort must be one of cumulative, tottime, calls')
+        try:
+            report = await self.watchdog.profile(seconds, sort=sort)
+        except RuntimeError as e:
+            raise web.HTTPConflict(text=str(e))
+        return web.Response(text=report, content_type='text/plain', charset='utf-8', headers={'Cache-Control': 'no-store'})
+
     async def index(self, request: web.BaseRequest) -> web.StreamResponse:
-        return web.FileResponse(CLIENT_HTML)
+        return _get_client_bundle().response(request)
+
+    async def blob(self, request: web.Request) -> web.StreamResponse:
+        name = request.match_info['name']
+        digest = name.split('.', 1)[0]
+        headers = {
+            'ETag': f'"{digest}"',
+            # Blobs are content-addressed: a given URL's contents never change.
+            'Cache-Control': 'public, max-age=31536000, immutable',
+        }
+        data = self.blob_store.get(digest)
+        if data is None:
+            raise web.HTTPNotFound()
+        if etag_matches(request.headers.get('If-None-Match', ''), digest):
+            return web.Response(status=304, headers=headers)
+        (content_type, _) = mimetypes.guess_type(name)
+        return web.Response(body=data, content_type=content_type or 'application/octet-stream', headers=headers)
 
     async def poll(self, request: web.BaseRequest) -> web.StreamResponse:
         request_pb = element_pb2.PollRequest.FromString(await request.content.read())
         since = request_pb.since_timestep
+        # Clients re-poll as soon as they get a response, so the time this request
+        # arrived is (about) when this client last heard from us.
+        arrived_at = time.monotonic()
+        metrics = self.metrics
+        if metrics is not None:
+            metrics.waiting_pollers += 1
+        try:
+            async with self.condition:
+                await self.condition.wait_for(lambda: self.closed or (self.gui.time_step > since))
+        finally:
+            if metrics is not None:
+                metrics.waiting_pollers -= 1
+                metrics.poll_wait.observe(time.monotonic() - arrived_at)
+        self._check_open()
+        delay = arrived_at + self.min_update_interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
         async with self.condition:
-            await self.condition.wait_for(lambda: self.gui.time_step > since)
-            return web.Response(
-                status=200,
-                content_type="application/octet_stream",
-                body=element_pb2.PollResponse(state=self.gui.updates_since(since)).SerializeToString(),
-            )
+            build_started = time.monotonic()
+            state = self._state_buffer
+            del state[:]
+            self.gui.write_updates_since(state, since)
+            # Concatenated messages parse as one, so the templates can be serialized separately.
+            response_buf = bytearray()
+            _wire.write_bytes_field(response_buf, _wire.POLL_RESPONSE_STATE, state)
+            response_buf += element_pb2.PollResponse(
+                templates=self.gui.templates_since(request_pb.known_templates),
+            ).SerializeToString()
+            built_at = time.monotonic()
+            if self.tracer is not None:
+                trace_ids = self.tracer.delivered(since, self.gui.time_step, build_started, built_at)
+                if trace_ids:
+                    response_buf += element_pb2.PollResponse(trace_ids=trace_ids).SerializeToString()
+            body = bytes(response_buf)
+            if metrics is not None:
+                metrics.poll_build.observe(built_at - build_started)
+                metrics.poll_size.observe(len(body))
+        response = web.Response(
+            status=200,
+            content_type="application/octet_stream",
+            body=body,
+        )
+        if (self.compress_threshold is not None) and len(body) >= self.compress_threshold:
+            response.enable_compression()
+        return response
 
     async def interaction(self, request: web.BaseRequest) -> web.StreamResponse:
+        received_at = time.monotonic()
+        self._check_open()
         bs = await request.content.read()
         request_pb = element_pb2.InteractionRequest.FromString(bs)
         interaction = request_pb.interaction
-        async with self.condition:
-            _dispatch_event_or_404(self.gui.root, interaction)
+        kind = interaction.WhichOneof("interaction_kind")
+        if kind in _COALESCED_INTERACTION_KINDS:
+            key = (kind, getattr(interaction, kind).element_id)
+            superseded = key in self._latest_interactions
+            self._latest_interactions[key] = interaction
+            if superseded:
+                # An earlier request is already waiting for the lock; it'll dispatch this one instead.
+                return _interaction_response()
+            dispatching = False
+            try:
+                async with self.condition:
+                    dispatching = True
+                    dispatch_started = time.monotonic()
+                    timestep_before = self.gui.time_step
+                    pending = _dispatch_event_or_404(self.gui, self._latest_interactions.pop(key))
+                    handled = time.monotonic()
+            finally:
+                if not dispatching:
+                    # Cancelled while waiting for the lock (e.g. the client went away): later
+                    # interactions with this element mustn't think we'll dispatch them.
+                    self._latest_interactions.pop(key, None)
+        else:
+            async with self.condition:
+                dispatch_started = time.monotonic()
+                timestep_before = self.gui.time_step
+                pending = _dispatch_event_or_404(self.gui, interaction)
+                handled = time.monotonic()
 
-        return web.Response(
-            status=200,
-            content_type="application/octet_stream",
-            body=element_pb2.InteractionResponse().SerializeToString(),
-        )
+        # Asynchronous callbacks run without the lock, so they don't hold up other clients.
+        if pending is not None:
+            await pending
+
+        if (self.metrics is None) and (self.tracer is None):
+            return _interaction_response()
+        finished = time.monotonic()
+        target = self.gui.element_by_id(ElementId(getattr(interaction, kind).element_id))
+        element_type = 'unknown' if target is None else type(target).__name__
+        if self.metrics is not None:
+            self.metrics.interaction_latency.observe(finished - received_at)
+            self.metrics.callback_duration.observe(finished - dispatch_started, element_type)
+        trace_id = 0
+        if self.tracer is not None:
+            trace_id = self.tracer.record_interaction(
+                kind=kind,
+                element_type=element_type,
+                received=received_at,
+                dispatch_started=dispatch_started,
+                handled=handled,
+                finished=finished,
+                timestep_before=timestep_before,
+                timestep_after=self.gui.time_step,
+            )
+        return _interaction_response(trace_id)
 
-def _dispatch_event_or_404(root: Element, interaction: element_pb2.Interaction) -> None:
+def _interaction_response(trace_id: int = 0) -> web.Response:
+    return web.Response(
+        status=200,
+        content_type="application/octet_stream",
+        body=element_pb2.InteractionResponse(trace_id=trace_id).SerializeToString(),
+    )
+
+def _dispatch_event_or_404(gui: AbstractGUI, interaction: element_pb2.Interaction) -> Optional[Awaitable[None]]:
     if interaction.WhichOneof("interaction_kind") == "click":
         click_event = interaction.click
-        _find_element_or_404(root, ElementId(click_event.element_id)).handle_click(click_event)
+        return _find_element_or_404(gui, ElementId(click_event.element_id)).handle_click(click_event)
     elif interaction.WhichOneof("interaction_kind") == "text_input":
         text_input_event = interaction.text_input
-        _find_element_or_404(root, ElementId(text_input_event.element_id)).handle_text_input(text_input_event)
+        return _find_element_or_404(gui, ElementId(text_input_event.element_id)).handle_text_input(text_input_event)
+    elif interaction.WhichOneof("interaction_kind") == "slide":
+        slide_event = interaction.slide
+        return _find_element_or_404(gui, ElementId(slide_event.element_id)).handle_slide(slide_event)
+    elif interaction.WhichOneof("interaction_kind") == "pointer_move":
+        pointer_move_event = interaction.pointer_move
+        return _find_element_or_404(gui, ElementId(pointer_move_event.element_id)).handle_pointer_move(pointer_move_event)
     else:
         raise ValueError("unknown kind of interaction", interaction.WhichOneof("interaction_kind"))
 
-def _find_element_or_404(root: Element, id: ElementId) -> Element:
-    result = next((e for e in root.walk() if e.id == id), None)
+def _find_element_or_404(gui: AbstractGUI, id: ElementId) -> Element:
+    result = gui.element_by_id(id)
     if result is None:
-        raise web.HTTPNotFound(body=id)
+        raise web.HTTPNotFound(text=f'no such element: {id}')
     return result
 
 def _get_open_port() -> int:
@@ -94,24 +338,123 @@ def build_server_app(
     *,
     token: str,
     loop: Optional[asyncio.AbstractEventLoop] = None,
+    max_update_rate: Optional[float] = None,
+    compress_threshold: Optional[int] = 1024,
+    static_dir: Optional[Path] = None,
+    metrics: bool = False,
+    tracing: bool = False,
+    watchdog: Optional[float] = None,
+    stats: bool = False,
 ) -> web.Application:
+    '''An app serving ``gui``, to browsers that have visited ``/auth/TOKEN``.
 
-    if loop is None:
-        loop = asyncio.get_event_loop()
-        if loop is None:
-            raise RuntimeError("can't get my hands on an event loop")
-    _mandatory_loop = loop  # mypy hack to make it realize this variable is effectively final
+    The app can be run on its own, or mounted in another aiohttp app with
+    ``parent.add_subapp('/some/prefix/', app)``, in which case the GUI's page is at
+    ``/some/prefix/`` (note the trailing slash) and its auth URL is
+    ``/some/prefix/auth/TOKEN``.
 
-    condition = asyncio.Condition(loop=loop)
+    ``loop`` is the event loop the app will run on; by default, whichever it's started on.
+    '''
+    condition = asyncio.Condition()
+    app = web.Application(middlewares=[_auth.build_middleware(token=token)])
+    if loop is not None:
+        _notify_on_change(gui, condition, loop)
+    else:
+        async def watch_gui(_):
+            _notify_on_change(gui, condition, asyncio.get_running_loop())
+        app.on_startup.append(watch_gui)
+    app.add_routes(_auth.build_routes(token=token))
+    watchdog_ = _add_watchdog(app, watchdog)
+    app.add_routes(Server(
+        gui,
+        condition,
+        max_update_rate=max_update_rate,
+        compress_threshold=compress_threshold,
+        metrics=ServerMetrics(gui) if metrics else None,
+        tracer=TraceRecorder() if tracing else None,
+        watchdog=watchdog_,
+        stats=stats,
+    ).build_routes())
+    if static_dir is not None:
+        # aiohttp serves these with sendfile, ETag/Last-Modified revalidation and Range support.
+        app.router.add_static('/static', static_dir)
+
+    return app
+
+def _notify_on_change(gui: AbstractGUI, condition: asyncio.Condition, loop: asyncio.AbstractEventLoop) -> None:
+    '''Notify ``condition`` (on ``loop``) whenever ``gui`` changes.'''
+    if isinstance(gui, ThreadSafeGUI) and gui.loop is None:
+        gui.loop = loop
 
     async def notify_all():
         async with condition:
             condition.notify_all()
-    gui.add_listener(lambda: asyncio.run_coroutine_threadsafe(notify_all(), _mandatory_loop))
-    app = web.Application(loop=loop, middlewares=[_auth.build_middleware(token=token)])
-    app.add_routes(_auth.build_routes(token=token))
-    app.add_routes(Server(gui, condition).build_routes())
+    gui.add_listener(lambda: asyncio.run_coroutine_threadsafe(notify_all(), loop))
+
+def _watch_gui(gui: AbstractGUI, loop: asyncio.AbstractEventLoop) -> asyncio.Condition:
+    '''A condition that's notified (on ``loop``) whenever ``gui`` changes.'''
+    condition = asyncio.Condition()
+    _notify_on_change(gui, condition, loop)
+    return condition
+
+def _add_watchdog(app: web.Application, threshold: Optional[float]) -> Optional[Watchdog]:
+    if threshold is None:
+        return None
+    watchdog = Watchdog(threshold=threshold)
+    async def start_watchdog(_):
+        watchdog.start()
+    async def stop_watchdog(_):
+        watchdog.stop()
+    app.on_startup.append(start_watchdog)
+    app.on_cleanup.append(stop_watchdog)
+    return watchdog
+
+def build_session_app(
+    gui_factory: Callable[[], AbstractGUI],
+    *,
+    token: str,
+    idle_timeout: float = 3600,
+    max_sessions: int = 1000,
+    max_update_rate: Optional[float] = None,
+    compress_threshold: Optional[int] = 1024,
+    static_dir: Optional[Path] = None,
+    tracing: bool = False,
+    watchdog: Optional[float] = None,
+    stats: bool = False,
+    session_id_prefix: str = '',
+) -> web.Application:
+    '''Like :func:`build_server_app`, but giving each browser session its own GUI, made by ``gui_factory``.
+
+    Sessions with no requests in flight for ``idle_timeout`` seconds are evicted, as
+    is the least recently active idle one whenever there would otherwise be more than
+    ``max_sessions``; if none is idle, new sessions are refused (with ``503``) until
+    one is. See :mod:`braggle.server._sessions`.
 
+    ``/debug/traces`` and ``/debug/stats`` describe the requesting session's GUI.
+    There's no ``metrics`` option: a scraper has no session, and per-session numbers
+    wouldn't add up to anything meaningful.
+    '''
+    app = web.Application()
+    watchdog_ = _add_watchdog(app, watchdog)
+
+    def server_factory(gui: AbstractGUI) -> Server:
+        return Server(
+            gui,
+            _watch_gui(gui, asyncio.get_running_loop()),
+            max_update_rate=max_update_rate,
+            compress_threshold=compress_threshold,
+            tracer=TraceRecorder() if tracing else None,
+            watchdog=watchdog_,
+            stats=stats,
+        )
+    sessions = SessionManager(gui_factory, server_factory, idle_timeout=idle_timeout, max_sessions=max_sessions, id_prefix=session_id_prefix)
+    app.middlewares.append(_auth.build_middleware(token=token, sessions=sessions))
+    app.on_startup.append(sessions.start)
+    app.on_cleanup.append(sessions.stop)
+    app.add_routes(_auth.build_routes(token=token))
+    app.add_routes(sessions.build_routes(Server.route_table(tracing=tracing, watchdog=watchdog_ is not None, stats=stats)))
+    if static_dir is not None:
+        app.router.add_static('/static', static_dir)
     return app
 
 async def serve_async(
@@ -122,24 +465,67 @@ async def serve_async(
     token: Optional[str] = None,
     open_browser: bool = True,
     loop: Optional[asyncio.AbstractEventLoop] = None,
+    max_update_rate: Optional[float] = None,
+    compress_threshold: Optional[int] = 1024,
+    static_dir: Optional[Path] = None,
+    metrics: bool = False,
+    tracing: bool = False,
+    watchdog: Optional[float] = None,
+    stats: bool = False,
+    path: Optional[str] = None,
 ) -> None:
+    '''Serve ``gui`` until cancelled; see :func:`build_server_app`.
+
+    If ``path`` is given, listen on a Unix socket there (e.g. behind a reverse proxy)
+    instead of on ``host:port``.
+    '''
     if token is None:
         token = secrets.token_urlsafe(32)
-    if port is None:
-        port = _get_open_port()
 
-    app = build_server_app(gui=gui, token=token, loop=loop)
+    app = build_server_app(gui=gui, token=token, loop=loop, max_update_rate=max_update_rate, compress_threshold=compress_threshold, static_dir=static_dir, metrics=metrics, tracing=tracing, watchdog=watchdog, stats=stats)
+    await _run_app(app, host=host, port=port, token=token, open_browser=open_browser, path=path)
 
-    url = f'http://{host}:{port}/auth/{token}'
-    print('serving on:', url) # TODO: figure out a better way to yield this information
-    if open_browser:
-        async def _open_browser(_):
-            webbrowser.open(url)
-        app.on_startup.append(_open_browser)
+async def serve_sessions_async(
+    gui_factory: Callable[[], AbstractGUI],
+    *,
+    host: str = 'localhost',
+    port: Optional[int] = None,
+    token: Optional[str] = None,
+    open_browser: bool = True,
+    idle_timeout: float = 3600,
+    max_sessions: int = 1000,
+    max_update_rate: Optional[float] = None,
+    compress_threshold: Optional[int] = 1024,
+    static_dir: Optional[Path] = None,
+    tracing: bool = False,
+    watchdog: Optional[float] = None,
+    stats: bool = False,
+    path: Optional[str] = None,
+) -> None:
+    '''Serve a separate GUI, made by ``gui_factory``, to each browser session. See :func:`build_session_app`, and :func:`serve_async` for ``path``.'''
+    if token is None:
+        token = secrets.token_urlsafe(32)
+
+    app = build_session_app(gui_factory, token=token, idle_timeout=idle_timeout, max_sessions=max_sessions, max_update_rate=max_update_rate, compress_threshold=compress_threshold, static_dir=static_dir, tracing=tracing, watchdog=watchdog, stats=stats)
+    await _run_app(app, host=host, port=port, token=token, open_browser=open_browser, path=path)
+
+async def _run_app(app: web.Application, *, host: str, port: Optional[int], token: str, open_browser: bool, path: Optional[str] = None) -> None:
+    '''Run ``app`` until cancelled: on ``path``, a Unix socket, if given (in which case there's no browser to open), else on ``host:port``.'''
+    if path is not None:
+        print(f'serving on: unix:{path}, auth at /auth/{token}')
+    else:
+        if port is None:
+            port = _get_open_port()
+        url = f'http://{host}:{port}/auth/{token}'
+        print('serving on:', url) # TODO: figure out a better way to yield this information
+        if open_browser:
+            async def _open_browser(_):
+                webbrowser.open(url)
+            app.on_startup.append(_open_browser)
 
     runner = web.AppRunner(app)
     await runner.setup()
-    site = web.TCPSite(runner, host, port)
+    site = web.UnixSite(runner, path) if path is not None else web.TCPSite(runner, host, port)
     await site.start()
     try:
         await asyncio.sleep(1e10)
@@ -149,3 +535,7 @@ async def serve_async(
 functools.wraps(serve_async, assigned=['__annotations__'])
 def serve(*args, **kwargs) -> None:
     asyncio.run(serve_async(*args, **kwargs))
+
+functools.wraps(serve_sessions_async, assigned=['__annotations__'])
+def serve_sessions(*args, **kwargs) -> None:
+    asyncio.run(serve_sessions_async(*args, **kwargs))
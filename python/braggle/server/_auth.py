@@ -6,34 +6,63 @@ import time
 import webbrowser
 
 from pathlib import Path
-from typing import Iterable, MutableSet, Optional, Sequence, Set, Tuple, TypeVar, Callable, Awaitable
+from typing import Iterable, MutableSet, Optional, Sequence, Set, Tuple, TypeVar, Callable, Awaitable, TYPE_CHECKING
 
 from aiohttp import web
 
+from ._sessions import SESSION_KEY
+
+if TYPE_CHECKING:
+    from ._sessions import SessionManager
+
+SESSION_COOKIE = 'session'
+
+def _index_path(request: web.Request) -> str:
+    # Under a prefix if the app's mounted as a sub-app (see build_server_app).
+    return str(request.app.router['index'].url_for())
+
 async def _redirect_to_index(request: web.Request) -> web.Response:
-    result = web.HTTPPermanentRedirect('/')
-    return result
+    # Returned rather than raised, so the middleware can set the auth cookie on it.
+    return web.Response(status=web.HTTPPermanentRedirect.status_code, headers={'Location': _index_path(request)})
 
 def build_middleware(
     token: str,
+    sessions: Optional['SessionManager'] = None,
 ):
     @web.middleware
     async def middleware(
         request: web.Request,
         handler: Callable[[web.Request], Awaitable[web.Response]],
     ) -> web.Response:
-        if request.path == f'/auth/{token}':
-            result = await handler(request)
-            result.set_cookie('token', token)
-            return result
-        if request.cookies.get('token') != token:
+        route_name = request.match_info.route.name
+        authenticating = route_name == 'auth'
+        # Browsers send the cookie; other clients (e.g. metrics scrapers) may send the token as a header instead.
+        if not authenticating and (request.cookies.get('token') != token) and (request.headers.get('Authorization') != f'Bearer {token}'):
             raise web.HTTPForbidden(reason='bad/no auth token')
-        return await handler(request)
+        if sessions is None:
+            result = await handler(request)
+        else:
+            session = sessions.get(request.cookies.get(SESSION_COOKIE, ''))
+            new_session = session is None
+            if session is None:
+                # Sessions start at /auth/TOKEN (where headless clients stop) or a page load;
+                # anything else is from a page whose session has been evicted.
+                if route_name not in ('auth', 'index'):
+                    raise web.HTTPGone(reason='session expired')
+                session = await sessions.create()
+            request[SESSION_KEY] = session
+            with session.active():
+                result = await handler(request)
+            if new_session:
+                result.set_cookie(SESSION_COOKIE, session.id, path=_index_path(request), httponly=True)
+        if authenticating:
+            result.set_cookie('token', token, path=_index_path(request))
+        return result
     return middleware
 
 def build_routes(
     token: str,
 ) -> Sequence[web.RouteDef]:
     return [
-        web.RouteDef(method='GET', path=f'/auth/{token}', handler=_redirect_to_index, kwargs={}),
+        web.get(f'/auth/{token}', _redirect_to_index, name='auth'),
     ]
@@ -0,0 +1,71 @@
+import gzip
+import hashlib
+
+from pathlib import Path
+from typing import Collection, Mapping, Optional
+
+from aiohttp import web
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover
+    brotli = None
+
+class PrecompressedFile:
+    '''A static file held in memory alongside its compressed variants, served with an ETag.
+
+    The client bundle never changes while the server is running, so we compress it once,
+    up front, instead of on every page load. Brotli is used if the ``brotli`` package is
+    installed; gzip always is.
+    '''
+    def __init__(self, path: Path, content_type: str) -> None:
+        self.content_type = content_type
+        self.identity = path.read_bytes()
+        self.etag = hashlib.sha256(self.identity).hexdigest()[:32]
+        self.variants: Mapping[str, bytes] = {
+            'gzip': gzip.compress(self.identity, compresslevel=9),
+            **({'br': brotli.compress(self.identity)} if brotli is not None else {}),
+        }
+
+    def response(self, request: web.BaseRequest) -> web.Response:
+        headers = {
+            'ETag': f'"{self.etag}"',
+            # The bundle changes whenever braggle is upgraded, so always revalidate (cheap, thanks to the ETag).
+            'Cache-Control': 'no-cache',
+            'Vary': 'Accept-Encoding',
+        }
+        if etag_matches(request.headers.get('If-None-Match', ''), self.etag):
+            return web.Response(status=304, headers=headers)
+
+        encoding = _choose_encoding(request.headers.get('Accept-Encoding', ''), available=self.variants.keys())
+        if encoding is not None:
+            headers['Content-Encoding'] = encoding
+        return web.Response(
+            body=self.identity if encoding is None else self.variants[encoding],
+            content_type=self.content_type,
+            headers=headers,
+        )
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    '''Whether an ``If-None-Match`` header value matches the (unquoted) ``etag`` of a resource that exists.'''
+    quoted = f'"{etag}"'
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        # If-None-Match uses weak comparison: W/"x" matches "x".
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate in ('*', quoted):
+            return True
+    return False
+
+def _choose_encoding(accept_encoding: str, available: Collection[str]) -> Optional[str]:
+    accepted = set()
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        if params.strip().replace(' ', '') in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+            continue
+        accepted.add(coding.strip().lower())
+    for coding in ('br', 'gzip'):
+        if (coding in accepted) and (coding in available):
+            return coding
+    return None
@@ -0,0 +1,91 @@
+'''Server metrics, in the Prometheus text exposition format.
+
+Deliberately dependency-free and minimal: everything is updated from the event loop,
+so there's no locking, and recording a sample is a few list operations.
+'''
+
+from __future__ import annotations
+
+import bisect
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..gui import AbstractGUI
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Long polls can legitimately wait for as long as nothing changes.
+WAIT_BUCKETS = (0.001, 0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(10))
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for (_, value) in labels)
+    return '{' + ','.join(f'{name}="{value}"' for ((name, _), value) in zip(labels, escaped)) + '}'
+
+class Histogram:
+    '''A Prometheus histogram, optionally partitioned by the value of a single label.'''
+    def __init__(self, name: str, help: str, buckets: Sequence[float], label: Optional[str] = None) -> None:
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.label = label
+        # label value -> (per-bucket counts, the last being +Inf; [sum])
+        self._series: Dict[Optional[str], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, label_value: Optional[str] = None) -> None:
+        series = self._series.get(label_value)
+        if series is None:
+            series = self._series[label_value] = ([0] * (len(self.buckets) + 1), [0.0])
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1][0] += value
+
+    def count(self, label_value: Optional[str] = None) -> int:
+        series = self._series.get(label_value)
+        return 0 if series is None else sum(series[0])
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        for (label_value, (counts, total)) in self._series.items():
+            base = [] if self.label is None else [(self.label, label_value or '')]
+            cumulative = 0
+            for (bound, n) in zip([*map(repr, self.buckets), '+Inf'], counts):
+                cumulative += n
+                lines.append(f'{self.name}_bucket{_format_labels([*base, ("le", bound)])} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(base)} {total[0]!r}')
+            lines.append(f'{self.name}_count{_format_labels(base)} {cumulative}')
+        return lines
+
+class Gauge:
+    '''A Prometheus gauge whose value is computed when scraped.'''
+    def __init__(self, name: str, help: str, read: Callable[[], float]) -> None:
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} gauge', f'{self.name} {self.read()!r}']
+
+class ServerMetrics:
+    '''Everything :class:`braggle.server.Server` records, when it's given one of these.'''
+    def __init__(self, gui: AbstractGUI) -> None:
+        self.waiting_pollers = 0
+        self.poll_wait = Histogram('braggle_poll_wait_seconds', 'Time polls spent waiting for the GUI to change.', WAIT_BUCKETS)
+        self.poll_build = Histogram('braggle_poll_build_seconds', 'Time spent rendering and encoding poll responses.', LATENCY_BUCKETS)
+        self.poll_size = Histogram('braggle_poll_response_bytes', 'Size of poll responses, before compression.', SIZE_BUCKETS)
+        self.interaction_latency = Histogram('braggle_interaction_seconds', 'Time from receiving an interaction to responding to it.', LATENCY_BUCKETS)
+        self.callback_duration = Histogram('braggle_callback_seconds', 'Time spent handling interactions, including callbacks, by element type.', LATENCY_BUCKETS, label='element_type')
+        self._gauges = [
+            Gauge('braggle_waiting_pollers', 'Polls currently waiting for the GUI to change.', lambda: self.waiting_pollers),
+            Gauge('braggle_timestep', "The GUI's current timestep.", lambda: gui.time_step),
+            Gauge('braggle_dirty_log_length', "Number of entries in the GUI's log of changed elements.", lambda: gui.dirty_log_length),
+            Gauge('braggle_elements', 'Number of elements in the GUI.', gui.n_elements),
+        ]
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for gauge in self._gauges:
+            lines += gauge.render()
+        for histogram in [self.poll_wait, self.poll_build, self.poll_size, self.interaction_latency, self.callback_duration]:
+            lines += histogram.render()
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,139 @@
+'''Serving many independent GUIs from one process: one per browser session.
+
+Each session gets its own GUI (from a factory) and its own :class:`braggle.server.Server`.
+The auth middleware (see :mod:`._auth`) identifies the session by a cookie and
+stashes it in ``request[SESSION_KEY]``; the routes here hand each request to that
+session's server, so the browser client talks to ``/poll`` etc. exactly as it would
+to a single-GUI server.
+
+Sessions that have had no requests in flight (a browser tab always has a poll
+waiting) for ``idle_timeout`` seconds are evicted, and so is the least recently used
+idle one whenever a new session would take the count past ``max_sessions``, which
+bounds memory use. An evicted session's server is closed, so any stragglers get
+``410 Gone``; the browser client reloads the page on seeing that, which starts a new
+session. If every session is in use, new ones are refused with ``503 Service
+Unavailable`` instead: evicting an open tab would just make it reload and evict
+another.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import secrets
+import time
+
+from typing import Awaitable, Callable, Dict, Iterator, Optional, Sequence, Tuple, TYPE_CHECKING
+
+from aiohttp import web
+
+from ..gui import AbstractGUI
+
+if TYPE_CHECKING:
+    from . import Server
+
+class Session:
+    def __init__(self, id: str, server: Server) -> None:
+        self.id = id
+        self.server = server
+        self.last_active = time.monotonic()
+        self.in_flight = 0
+
+    @property
+    def gui(self) -> AbstractGUI:
+        return self.server.gui
+
+    @contextlib.contextmanager
+    def active(self) -> Iterator[None]:
+        '''Mark the session as in use for the duration of a request.'''
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.last_active = time.monotonic()
+
+    def idle_for(self, now: float) -> float:
+        return 0.0 if self.in_flight else now - self.last_active
+
+SESSION_KEY = web.RequestKey('session', Session)
+
+class SessionManager:
+    '''Creates a server (via ``server_factory``) for each GUI ``gui_factory`` makes, one per session.'''
+    def __init__(
+        self,
+        gui_factory: Callable[[], AbstractGUI],
+        server_factory: Callable[[AbstractGUI], Server],
+        *,
+        idle_timeout: float = 3600,
+        max_sessions: int = 1000,
+        id_prefix: str = '',
+    ) -> None:
+        if idle_timeout <= 0:
+            raise ValueError(f'idle_timeout must be positive, not {idle_timeout}')
+        if max_sessions < 1:
+            raise ValueError(f'max_sessions must be positive, not {max_sessions}')
+        self.gui_factory = gui_factory
+        self.server_factory = server_factory
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # Lets whoever's in front of us (see _workers) tell which process a session lives in.
+        self.id_prefix = id_prefix
+        self._sessions: Dict[str, Session] = {}
+        self._reaper: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, id: str) -> Optional[Session]:
+        return self._sessions.get(id)
+
+    async def create(self) -> Session:
+        while len(self._sessions) >= self.max_sessions:
+            idle = [s for s in self._sessions.values() if not s.in_flight]
+            if not idle:
+                raise web.HTTPServiceUnavailable(reason='too many sessions')
+            victim = min(idle, key=lambda s: s.last_active)
+            await self.evict(victim.id)
+        session = Session(self.id_prefix + secrets.token_urlsafe(24), self.server_factory(self.gui_factory()))
+        self._sessions[session.id] = session
+        return session
+
+    async def evict(self, id: str) -> None:
+        session = self._sessions.pop(id, None)
+        if session is not None:
+            await session.server.close()
+
+    async def evict_idle(self) -> int:
+        '''Evict every session that's been idle for longer than ``idle_timeout``; returns how many there were.'''
+        now = time.monotonic()
+        idle = [s.id for s in self._sessions.values() if s.idle_for(now) > self.idle_timeout]
+        for id in idle:
+            await self.evict(id)
+        return len(idle)
+
+    async def _reap_forever(self) -> None:
+        while True:
+            await asyncio.sleep(min(self.idle_timeout / 2, 60))
+            await self.evict_idle()
+
+    async def start(self, app: web.Application) -> None:
+        self._reaper = asyncio.ensure_future(self._reap_forever())
+
+    async def stop(self, app: web.Application) -> None:
+        if self._reaper is not None:
+            self._reaper.cancel()
+        for id in list(self._sessions):
+            await self.evict(id)
+
+    def build_routes(self, route_table: Sequence[Tuple[str, str, str]]) -> Sequence[web.RouteDef]:
+        '''Routes that hand requests to the requesting session's server.
+
+        ``route_table`` is as returned by :meth:`braggle.server.Server.route_table`.
+        '''
+        return [web.route(method, path, _dispatcher(name), name=name) for (method, path, name) in route_table]
+
+def _dispatcher(name: str) -> Callable[[web.Request], Awaitable[web.StreamResponse]]:
+    async def dispatch(request: web.Request) -> web.StreamResponse:
+        return await getattr(request[SESSION_KEY].server, name)(request)
+    return dispatch
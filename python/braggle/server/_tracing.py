@@ -0,0 +1,209 @@
+'''Click-to-paint tracing: where the time goes between a user interacting and seeing the result.
+
+Each interaction gets a trace id, returned in its ``InteractionResponse``. The server
+notes when the interaction arrived, got the GUI lock, was dispatched, and finished
+(including asynchronous callbacks); then, when a poll first delivers the changes it
+made, the trace id goes along in the ``PollResponse`` and the server notes how long
+that response took to build. The client that sent the interaction reports back, in a
+``PaintReport``, how long the whole thing took from its point of view and how long
+rendering took.
+
+All times here are in seconds, from :func:`time.monotonic` (server-side) or
+durations measured by the client.
+'''
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import itertools
+
+from typing import Any, Dict, List, MutableMapping, Optional, Sequence
+
+from .._percentiles import percentile
+from ..protobuf import element_pb2
+from ..types import TimeStep
+
+STAGES = ('lock_wait', 'dispatch', 'callback', 'poll_wait', 'serialize', 'network', 'render', 'end_to_end')
+
+@dataclasses.dataclass
+class Trace:
+    id: int
+    kind: str
+    element_type: str
+    received: float
+    dispatch_started: float
+    handled: float
+    finished: float
+    # The GUI's timestep once the interaction was handled, or None if it changed nothing.
+    timestep: Optional[TimeStep]
+    poll_started: Optional[float] = None
+    poll_built: Optional[float] = None
+    round_trip: Optional[float] = None
+    render: Optional[float] = None
+    end_to_end: Optional[float] = None
+
+    def stages(self) -> Dict[str, float]:
+        '''How long each stage took, for as many stages as we know about.
+
+        ``network`` is the interaction's trip to the server plus the update's trip
+        back, i.e. whatever of ``end_to_end`` the other stages don't account for.
+        '''
+        result = {
+            'lock_wait': self.dispatch_started - self.received,
+            'dispatch': self.handled - self.dispatch_started,
+            'callback': self.finished - self.handled,
+        }
+        if (self.poll_started is not None) and (self.poll_built is not None):
+            result['poll_wait'] = max(0.0, self.poll_started - self.finished)
+            result['serialize'] = self.poll_built - self.poll_started
+            if (self.end_to_end is not None) and (self.render is not None):
+                result['network'] = max(0.0, self.end_to_end - self.render - (self.poll_built - self.received))
+        if self.render is not None:
+            result['render'] = self.render
+        if self.end_to_end is not None:
+            result['end_to_end'] = self.end_to_end
+        return result
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'element_type': self.element_type,
+            'timestep': self.timestep,
+            'stages_ms': {name: 1000 * t for (name, t) in self.stages().items()},
+        }
+
+    def trace_events(self, origin: float) -> List[Dict[str, Any]]:
+        '''Chrome trace events (see ``chrome://tracing``) for this trace, one per stage, on a timeline starting at ``origin``.
+
+        The client's clock isn't comparable to ours, so its stages are placed assuming the network is symmetric.
+        '''
+        spans = [
+            ('lock_wait', self.received, self.dispatch_started),
+            ('dispatch', self.dispatch_started, self.handled),
+            ('callback', self.handled, self.finished),
+        ]
+        stages = self.stages()
+        if (self.poll_started is not None) and (self.poll_built is not None):
+            spans += [
+                ('poll_wait', self.finished, max(self.finished, self.poll_started)),
+                ('serialize', self.poll_started, self.poll_built),
+            ]
+            if 'network' in stages:
+                half = stages['network'] / 2
+                spans += [
+                    ('network', self.received - half, self.received),
+                    ('network', self.poll_built, self.poll_built + half),
+                    ('render', self.poll_built + half, self.poll_built + half + stages['render']),
+                ]
+        return [
+            {
+                'name': name,
+                'cat': self.kind,
+                'ph': 'X',
+                'pid': 1,
+                'tid': self.id,
+                'ts': 1e6 * (start - origin),
+                'dur': 1e6 * (end - start),
+                'args': {'element_type': self.element_type},
+            }
+            for (name, start, end) in spans
+        ]
+
+class TraceRecorder:
+    '''Keeps the most recent ``max_traces`` traces, and summarizes them.
+
+    A trace whose changes haven't been delivered within ``delivery_timeout`` seconds
+    (e.g. because nobody's polling) stops waiting to be.
+    '''
+    def __init__(self, max_traces: int = 1000, delivery_timeout: float = 30) -> None:
+        self.delivery_timeout = delivery_timeout
+        self._ids = itertools.count(1)
+        self._traces: MutableMapping[int, Trace] = collections.OrderedDict()
+        self._max_traces = max_traces
+        self._in_flight: Dict[int, Trace] = {}
+
+    def record_interaction(
+        self,
+        kind: str,
+        element_type: str,
+        received: float,
+        dispatch_started: float,
+        handled: float,
+        finished: float,
+        timestep_before: TimeStep,
+        timestep_after: TimeStep,
+    ) -> int:
+        '''Note that an interaction has been handled; returns its trace id.'''
+        trace = Trace(
+            # Trace ids are uint32s on the wire; 0 means "untraced".
+            id=next(self._ids) % 2**32 or next(self._ids) % 2**32,
+            kind=kind,
+            element_type=element_type,
+            received=received,
+            dispatch_started=dispatch_started,
+            handled=handled,
+            finished=finished,
+            timestep=timestep_after if timestep_after > timestep_before else None,
+        )
+        self._traces[trace.id] = trace
+        while len(self._traces) > self._max_traces:
+            self._traces.pop(next(iter(self._traces)))
+        if trace.timestep is not None:
+            self._in_flight[trace.id] = trace
+        return trace.id
+
+    def delivered(self, since: TimeStep, now: TimeStep, poll_started: float, poll_built: float) -> List[int]:
+        '''Note that a poll response covering changes in ``(since, now]`` has been built; returns the ids of the traces it carries.'''
+        result = []
+        for trace in list(self._in_flight.values()):
+            assert trace.timestep is not None
+            if since < trace.timestep <= now:
+                # Every client gets the trace id (we don't know which one sent the
+                # interaction), but the first delivery is the one we time.
+                if trace.poll_started is None:
+                    trace.poll_started = poll_started
+                    trace.poll_built = poll_built
+                result.append(trace.id)
+            elif poll_built - trace.finished > self.delivery_timeout:
+                del self._in_flight[trace.id]
+        return result
+
+    def painted(self, report: element_pb2.PaintReport) -> None:
+        # Once it's been painted, there's no more to learn about delivering it.
+        self._in_flight.pop(report.trace_id, None)
+        trace = self._traces.get(report.trace_id)
+        if (trace is None) or (trace.end_to_end is not None):
+            return
+        trace.end_to_end = report.end_to_end_ms / 1000
+        trace.round_trip = report.round_trip_ms / 1000
+        trace.render = report.render_ms / 1000
+
+    def summary(self, n_recent: int = 20) -> Dict[str, Any]:
+        '''Per-stage latency percentiles (in milliseconds) over all retained traces, plus the ``n_recent`` latest traces.'''
+        by_stage: Dict[str, List[float]] = {name: [] for name in STAGES}
+        for trace in self._traces.values():
+            for (name, t) in trace.stages().items():
+                by_stage[name].append(1000 * t)
+        recent: Sequence[Trace] = list(self._traces.values())[-n_recent:] if n_recent else []
+        return {
+            'stages_ms': {
+                name: {
+                    'count': len(times),
+                    **{f'p{p}': percentile(times, p) for p in (50, 90, 99)},
+                    'max': max(times, default=0.0),
+                }
+                for (name, times) in by_stage.items()
+            },
+            'recent': [trace.to_json() for trace in reversed(recent)],
+        }
+
+    def trace_events(self) -> Dict[str, Any]:
+        '''All retained traces, in the Chrome trace event format (loadable by ``chrome://tracing`` or Perfetto).'''
+        traces = list(self._traces.values())
+        origin = min((t.received - t.stages().get('network', 0.0) / 2 for t in traces), default=0.0)
+        return {
+            'traceEvents': [event for trace in traces for event in trace.trace_events(origin)],
+            'displayTimeUnit': 'ms',
+        }
@@ -0,0 +1,196 @@
+'''Notices when the event loop is blocked, and works out what's blocking it.
+
+Element callbacks and rendering both run on the event loop, so one slow handler
+freezes every client. A :class:`Watchdog` keeps a heartbeat going on the loop and,
+from a thread of its own, notices when a beat is late; while the loop is stuck, it
+samples the loop thread's stack. Each stall longer than the threshold is logged,
+blamed on the innermost element method on the stack (``handle_click``,
+``to_protobuf`` and so on) if there is one, and otherwise on the outermost code
+that isn't asyncio's or aiohttp's.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import cProfile
+import dataclasses
+import io
+import logging
+import pstats
+import selectors
+import sys
+import threading
+import time
+import traceback
+
+from pathlib import Path
+from types import FrameType
+from typing import Any, Counter, Deque, Dict, List, Optional
+
+import aiohttp
+
+from ..element import Element
+
+logger = logging.getLogger(__name__)
+
+_ELEMENT_METHODS = frozenset({
+    'handle_click', 'handle_text_input', 'handle_slide', 'handle_pointer_move',
+    'to_protobuf', 'to_protobuf_since', 'write_to',
+})
+_LIBRARY_FILES = (
+    str(Path(asyncio.__file__).parent),
+    str(Path(aiohttp.__file__).parent),
+    selectors.__file__,
+    threading.__file__,
+)
+
+def _stack(frame: Optional[FrameType]) -> List[FrameType]:
+    '''``frame`` and its callers, innermost first.'''
+    result = []
+    while frame is not None:
+        result.append(frame)
+        frame = frame.f_back
+    return result
+
+def blame(stack: List[FrameType]) -> str:
+    '''Describe the code responsible for ``stack`` (innermost frame first), e.g. ``Button#3.handle_click -> on_click``.'''
+    for frame in stack:
+        if frame.f_code.co_name in _ELEMENT_METHODS:
+            element = frame.f_locals.get('self')
+            if isinstance(element, Element):
+                result = f'{type(element).__name__}#{element.id}.{frame.f_code.co_name}'
+                callback = getattr(element, 'callback', None)
+                if frame.f_code.co_name.startswith('handle_') and (callback is not None):
+                    result += f' -> {getattr(callback, "__qualname__", repr(callback))}'
+                return result
+    for frame in reversed(stack):
+        if not frame.f_code.co_filename.startswith(_LIBRARY_FILES):
+            return f'{frame.f_code.co_name} ({frame.f_code.co_filename}:{frame.f_lineno})'
+    return 'unknown'
+
+@dataclasses.dataclass
+class Stall:
+    '''A stretch of time during which the event loop was blocked.'''
+    started: float
+    duration: float = 0.0
+    # blame -> how many samples
+    culprits: Counter[str] = dataclasses.field(default_factory=collections.Counter)
+    # formatted stack -> how many samples
+    stacks: Counter[str] = dataclasses.field(default_factory=collections.Counter)
+
+    @property
+    def culprit(self) -> str:
+        return self.culprits.most_common(1)[0][0] if self.culprits else 'unknown'
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'duration_ms': 1000 * self.duration,
+            'culprit': self.culprit,
+            'samples': sum(self.culprits.values()),
+            'stack': self.stacks.most_common(1)[0][0] if self.stacks else '',
+        }
+
+class Watchdog:
+    '''Watches the event loop it's :meth:`start`\\ ed on, from a background thread, for stalls longer than ``threshold`` seconds.
+
+    While the loop is blocked, its stack is sampled every ``sample_interval`` seconds.
+    The most recent ``max_stalls`` stalls are kept in :attr:`stalls`.
+    '''
+    def __init__(self, threshold: float = 0.1, *, sample_interval: Optional[float] = None, max_stalls: int = 100) -> None:
+        if threshold <= 0:
+            raise ValueError(f'threshold must be positive, not {threshold}')
+        self.threshold = threshold
+        self.sample_interval = threshold / 5 if sample_interval is None else sample_interval
+        self.stalls: Deque[Stall] = collections.deque(maxlen=max_stalls)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._heartbeat: Optional[asyncio.TimerHandle] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._profiling = False
+
+    def start(self) -> None:
+        '''Start watching the running event loop.'''
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._beat()
+        self._thread = threading.Thread(target=self._watch, name='braggle-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self) -> None:
+        assert self._loop is not None
+        self._last_beat = time.monotonic()
+        self._heartbeat = self._loop.call_later(self.sample_interval, self._beat)
+
+    def _watch(self) -> None:
+        stall: Optional[Stall] = None
+        while not self._stopped.wait(self.sample_interval):
+            now = time.monotonic()
+            # A beat is due every sample_interval; anything later than that is the loop being busy.
+            lag = now - self._last_beat - self.sample_interval
+            if lag > 0:
+                if stall is None:
+                    stall = Stall(started=now - lag)
+                self._sample(stall)
+                continue
+            if stall is not None:
+                stall.duration = self._last_beat - stall.started
+                if stall.duration >= self.threshold:
+                    self._report(stall)
+                stall = None
+
+    def _sample(self, stall: Stall) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore
+        stack = _stack(frame)
+        stall.culprits[blame(stack)] += 1
+        stall.stacks[''.join(traceback.format_list(traceback.extract_stack(frame)))] += 1
+
+    def _report(self, stall: Stall) -> None:
+        self.stalls.append(stall)
+        logger.warning(
+            'event loop blocked for %.0fms, mostly by %s; most common stack:\n%s',
+            1000 * stall.duration, stall.culprit, stall.to_json()['stack'],
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        '''The recorded stalls (latest first), and the worst offenders across all of them.'''
+        blocked: Dict[str, float] = collections.defaultdict(float)
+        for stall in self.stalls:
+            blocked[stall.culprit] += stall.duration
+        return {
+            'threshold_ms': 1000 * self.threshold,
+            'offenders': [
+                {'culprit': culprit, 'blocked_ms': 1000 * t}
+                for (culprit, t) in sorted(blocked.items(), key=lambda kv: -kv[1])
+            ],
+            'stalls': [stall.to_json() for stall in reversed(self.stalls)],
+        }
+
+    async def profile(self, seconds: float, sort: str = 'cumulative', limit: int = 50) -> str:
+        '''Profile everything the event loop does for the next ``seconds`` seconds, and return a :mod:`pstats` report.'''
+        if self._profiling:
+            raise RuntimeError('already profiling')
+        self._profiling = True
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                profiler.disable()
+        finally:
+            self._profiling = False
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
@@ -0,0 +1,283 @@
+'''Spreading sessions across worker processes, to use more than one core.
+
+:func:`serve_workers` starts N worker processes, each serving sessions (see
+:mod:`._sessions`) on a Unix socket of its own, and, in front of them, a dispatcher
+that owns the public port. A worker's session ids start with its index, so the
+dispatcher can send every request carrying a session cookie to the worker that owns
+that session, without keeping any state of its own; page loads without one, which
+start new sessions, go to the workers in turn.
+
+The dispatcher only forwards bytes, so it's cheap next to the workers, which do all
+the rendering and run all the callbacks. It also watches the workers (see
+:class:`WorkerPool`): new sessions aren't sent to a dead one, and it's restarted.
+The sessions it owned are gone, so their pages get ``410 Gone`` and start afresh.
+'''
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import itertools
+import logging
+import multiprocessing
+import os
+import secrets
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import aiohttp
+from aiohttp import web
+from multidict import CIMultiDict
+
+from ..gui import AbstractGUI
+from . import _auth
+
+logger = logging.getLogger(__name__)
+
+# Headers that describe a single connection, not the message, so mustn't be forwarded.
+_HOP_BY_HOP_HEADERS = frozenset({
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailer', 'transfer-encoding', 'upgrade', 'content-length',
+})
+
+def session_id_prefix(worker: int) -> str:
+    return f'{worker}.'
+
+def worker_for_session(session_id: str, n_workers: int) -> Optional[int]:
+    '''Which worker owns the session with the given id, if it's a well-formed one.'''
+    (index, dot, _) = session_id.partition('.')
+    if not (dot and index.isdigit()):
+        return None
+    worker = int(index)
+    return worker if worker < n_workers else None
+
+def _forwardable(headers: Any) -> CIMultiDict:
+    return CIMultiDict((k, v) for (k, v) in headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS)
+
+class Dispatcher:
+    '''Forwards each request to the worker (listening on one of ``socket_paths``) that owns its session.
+
+    If given, ``is_alive(worker)`` says whether a worker can take requests.
+    '''
+    def __init__(self, socket_paths: Sequence[str], is_alive: Optional[Callable[[int], bool]] = None) -> None:
+        if not socket_paths:
+            raise ValueError('need at least one worker')
+        self.socket_paths = list(socket_paths)
+        self.is_alive = is_alive
+        self._next_worker = itertools.cycle(range(len(self.socket_paths)))
+        self._clients: List[aiohttp.ClientSession] = []
+
+    async def start(self, app: web.Application) -> None:
+        self._clients = [
+            aiohttp.ClientSession(
+                connector=aiohttp.UnixConnector(path=path, limit=0),
+                # Long polls can wait indefinitely.
+                timeout=aiohttp.ClientTimeout(total=None),
+                # Pass compressed responses straight through.
+                auto_decompress=False,
+                # The browser's cookies go along with each request; the workers' are passed back.
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+            for path in self.socket_paths
+        ]
+
+    async def stop(self, app: web.Application) -> None:
+        for client in self._clients:
+            await client.close()
+
+    def choose_worker(self, request: web.BaseRequest) -> int:
+        worker = worker_for_session(request.cookies.get(_auth.SESSION_COOKIE, ''), len(self.socket_paths))
+        if (worker is not None) and self._alive(worker):
+            return worker
+        # Requests without a (living) session either start one (page loads and
+        # /auth/TOKEN) or are refused as expired by whichever worker gets them.
+        for _ in self.socket_paths:
+            worker = next(self._next_worker)
+            if self._alive(worker):
+                return worker
+        raise web.HTTPServiceUnavailable(text='no workers available')
+
+    def _alive(self, worker: int) -> bool:
+        return (self.is_alive is None) or self.is_alive(worker)
+
+    async def forward(self, request: web.Request) -> web.StreamResponse:
+        client = self._clients[self.choose_worker(request)]
+        try:
+            async with client.request(
+                request.method,
+                # The host's ignored: the connector always connects to the worker's socket.
+                f'http://worker{request.rel_url}',
+                headers=_forwardable(request.headers),
+                data=await request.read(),
+                allow_redirects=False,
+            ) as upstream:
+                body = await upstream.read()
+                return web.Response(status=upstream.status, headers=_forwardable(upstream.headers), body=body)
+        except aiohttp.ClientConnectionError:
+            raise web.HTTPBadGateway(text='worker unavailable')
+
+    def build_routes(self) -> Sequence[web.RouteDef]:
+        return [web.route('*', '/{tail:.*}', self.forward)]
+
+def build_dispatcher_app(socket_paths: Sequence[str], pool: Optional[WorkerPool] = None) -> web.Application:
+    '''An app dispatching to the workers on ``socket_paths``; and, if given, supervising ``pool``.'''
+    dispatcher = Dispatcher(socket_paths, is_alive=None if pool is None else pool.is_alive)
+    app = web.Application()
+    app.on_startup.append(dispatcher.start)
+    app.on_cleanup.append(dispatcher.stop)
+    if pool is not None:
+        app.on_startup.append(pool.start_supervising)
+        app.on_cleanup.append(pool.stop_supervising)
+    app.add_routes(dispatcher.build_routes())
+    return app
+
+async def _serve_worker_async(gui_factory: Callable[[], AbstractGUI], socket_path: str, worker: int, token: str, options: Dict[str, Any]) -> None:
+    from . import build_session_app
+    app = build_session_app(gui_factory, token=token, session_id_prefix=session_id_prefix(worker), **options)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.UnixSite(runner, socket_path)
+    await site.start()
+    try:
+        await asyncio.sleep(1e10)
+    finally:
+        await runner.cleanup()
+
+def _serve_worker(gui_factory: Callable[[], AbstractGUI], socket_path: str, worker: int, token: str, options: Dict[str, Any]) -> None:
+    try:
+        asyncio.run(_serve_worker_async(gui_factory, socket_path, worker, token, options))
+    except KeyboardInterrupt:
+        pass
+
+def _start_worker(gui_factory: Callable[[], AbstractGUI], socket_path: str, worker: int, token: str, options: Dict[str, Any]) -> multiprocessing.Process:
+    # A dead worker's socket file outlives it; clear it away, so nobody mistakes it for a live one.
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    process = multiprocessing.Process(
+        target=_serve_worker,
+        args=(gui_factory, socket_path, worker, token, options),
+        name=f'braggle-worker-{worker}',
+        daemon=True,
+    )
+    process.start()
+    return process
+
+def start_workers(
+    gui_factory: Callable[[], AbstractGUI],
+    socket_dir: str,
+    *,
+    n_workers: int,
+    token: str,
+    timeout: float = 30,
+    **options: Any,
+) -> List[multiprocessing.Process]:
+    '''Start ``n_workers`` processes serving sessions on Unix sockets in ``socket_dir``, and wait until they're listening.
+
+    ``options`` are passed on to :func:`braggle.server.build_session_app`. Where new
+    processes are spawned rather than forked (e.g. on macOS and Windows), ``gui_factory``
+    must be picklable, e.g. a module-level function.
+    '''
+    from . import build_session_app
+    # Fail here, rather than in every worker.
+    inspect.signature(build_session_app).bind(gui_factory, token=token, **options)
+    paths = worker_socket_paths(socket_dir, n_workers)
+    processes = [_start_worker(gui_factory, path, i, token, options) for (i, path) in enumerate(paths)]
+    deadline = time.monotonic() + timeout
+    while not all(os.path.exists(path) for path in paths):
+        dead = [p for p in processes if not p.is_alive()]
+        if dead or time.monotonic() > deadline:
+            stop_workers(processes)
+            raise RuntimeError(f'workers failed to start: {[p.name for p in dead] or "timed out"}')
+        time.sleep(0.01)
+    return processes
+
+def stop_workers(processes: Sequence[multiprocessing.Process]) -> None:
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+def worker_socket_paths(socket_dir: str, n_workers: int) -> List[str]:
+    return [str(Path(socket_dir) / f'worker-{i}.sock') for i in range(n_workers)]
+
+class WorkerPool:
+    '''Worker processes (see :func:`start_workers`) that are restarted when they die.
+
+    While the dispatcher's running, the workers are checked every ``check_interval`` seconds.
+    '''
+    def __init__(
+        self,
+        gui_factory: Callable[[], AbstractGUI],
+        socket_dir: str,
+        *,
+        n_workers: int,
+        token: str,
+        check_interval: float = 1,
+        **options: Any,
+    ) -> None:
+        self.gui_factory = gui_factory
+        self.socket_paths = worker_socket_paths(socket_dir, n_workers)
+        self.token = token
+        self.check_interval = check_interval
+        self.options = options
+        self.processes = start_workers(gui_factory, socket_dir, n_workers=n_workers, token=token, **options)
+        self._supervisor: Optional[asyncio.Task] = None
+
+    def is_alive(self, worker: int) -> bool:
+        # A restarted worker isn't ready until it's listening.
+        return self.processes[worker].is_alive() and os.path.exists(self.socket_paths[worker])
+
+    def restart_dead(self) -> List[int]:
+        '''Restart any workers that have died; returns which.'''
+        dead = [i for (i, p) in enumerate(self.processes) if not p.is_alive()]
+        for i in dead:
+            logger.warning('worker %d died (exit code %s); restarting it', i, self.processes[i].exitcode)
+            self.processes[i].join()
+            self.processes[i] = _start_worker(self.gui_factory, self.socket_paths[i], i, self.token, self.options)
+        return dead
+
+    async def _supervise(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            self.restart_dead()
+
+    async def start_supervising(self, app: web.Application) -> None:
+        self._supervisor = asyncio.ensure_future(self._supervise())
+
+    async def stop_supervising(self, app: web.Application) -> None:
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+
+    def stop(self) -> None:
+        stop_workers(self.processes)
+
+def serve_workers(
+    gui_factory: Callable[[], AbstractGUI],
+    *,
+    workers: Optional[int] = None,
+    host: str = 'localhost',
+    port: Optional[int] = None,
+    token: Optional[str] = None,
+    open_browser: bool = True,
+    path: Optional[str] = None,
+    **options: Any,
+) -> None:
+    '''Like :func:`braggle.serve_sessions`, but spreading the sessions across ``workers`` processes (by default, one per core).
+
+    ``options`` are as for :func:`braggle.server.build_session_app`. Each worker has its
+    own ``max_sessions``, and its own traces and stats for its sessions. Workers that
+    die are restarted.
+    '''
+    from . import _run_app
+    if token is None:
+        token = secrets.token_urlsafe(32)
+    with tempfile.TemporaryDirectory(prefix='braggle-') as socket_dir:
+        pool = WorkerPool(gui_factory, socket_dir, n_workers=workers or os.cpu_count() or 1, token=token, **options)
+        try:
+            app = build_dispatcher_app(pool.socket_paths, pool=pool)
+            asyncio.run(_run_app(app, host=host, port=port, token=token, open_browser=open_browser, path=path))
+        finally:
+            pool.stop()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, Mapping, MutableMapping
+
+from . import protobuf_helpers
+from .element import Element
+from .protobuf import element_pb2
+
+DEFAULT_STYLES: Mapping[str, str] = {
+    '.braggle-grid': 'border-spacing: 0; border-collapse: collapse',
+    '.braggle-grid-cell': 'border: 1px solid black',
+    '.braggle-code-snippet': 'white-space: pre',
+}
+
+class _Rule(Element):
+    __slots__ = ('selector', 'declarations')
+    def __init__(self, selector: str, declarations: str) -> None:
+        super().__init__()
+        self.selector = selector
+        self.declarations = declarations
+
+    def __repr__(self) -> str:
+        return f'_Rule({self.selector!r}, {self.declarations!r})'
+
+    def to_protobuf(self) -> element_pb2.Element:
+        return protobuf_helpers.tag('style', children=[protobuf_helpers.text(f'{self.selector} {{ {self.declarations} }}')])
+
+class StyleSheet(Element, MutableMapping[str, str]):
+    """A set of CSS rules, mapping selectors to declarations, e.g.
+
+        >>> sheet = StyleSheet()
+        >>> sheet['.warning'] = 'color: red; font-weight: bold'
+
+    Every GUI has one (:attr:`braggle.GUI.stylesheet`), which clients load along with
+    the rest of the GUI; elements can then refer to its rules by class name, instead of
+    repeating inline styles. Each rule is sent separately, so changing one rule only
+    re-sends that rule. Rules apply in the order they were first added.
+    """
+    __slots__ = ('_rules',)
+    def __init__(self, rules: Mapping[str, str] = {}) -> None:
+        super().__init__()
+        self._rules: Dict[str, _Rule] = {}
+        for (selector, declarations) in rules.items():
+            self[selector] = declarations
+
+    def __repr__(self) -> str:
+        return f'StyleSheet({dict(self)!r})'
+
+    # Like other Elements, StyleSheets are equal only to themselves (not, as Mappings are, to anything with the same items).
+    __eq__ = Element.__eq__
+    __hash__ = Element.__hash__
+
+    def __getitem__(self, selector: str) -> str:
+        return self._rules[selector].declarations
+
+    def __setitem__(self, selector: str, declarations: str) -> None:
+        if not (isinstance(selector, str) and isinstance(declarations, str)):
+            raise TypeError('selectors and declarations must be strings')
+        rule = self._rules.get(selector)
+        if rule is not None:
+            rule.declarations = declarations
+            rule.mark_dirty()
+            return
+        rule = _Rule(selector, declarations)
+        rule.parent = self
+        self._rules[selector] = rule
+        rule.mark_dirty()
+        self.mark_dirty()
+
+    def __delitem__(self, selector: str) -> None:
+        rule = self._rules.pop(selector)
+        rule.parent = None
+        self.mark_dirty()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def to_protobuf(self) -> element_pb2.Element:
+        return protobuf_helpers.tag('div', attributes={'hidden': ''}, children=list(self._rules.values()))
@@ -1,4 +1,4 @@
 from typing import NewType
 
-ElementId = NewType('ElementId', str)
+ElementId = NewType('ElementId', int)
 TimeStep = NewType('TimeStep', int)
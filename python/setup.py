@@ -63,7 +63,7 @@ setup(
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[
-        'aiohttp',
+        'aiohttp>=3.13',
         'protobuf',
     ],
 
@@ -74,6 +74,9 @@ setup(
     extras_require={
         'dev': [],
         'test': ['pytest'],
+        'brotli': ['brotli'],
+        'markdown': ['markdown'],
+        'bench': ['pytest', 'pytest-benchmark'],
     },
 
     # If there are data files included in your packages that need to be
@@ -0,0 +1,70 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import raises # type: ignore
+
+from braggle import Button, Text
+from braggle._callbacks import CallbackRunner
+from braggle.protobuf import element_pb2
+
+def test_plain_callbacks_run_immediately():
+    xs = []
+    assert CallbackRunner().run(xs.append, 1) is None
+    assert xs == [1]
+
+def test_bad_policy():
+    with raises(ValueError):
+        CallbackRunner(policy='bogus')
+
+def _run_overlapping(policy):
+    log = []
+    async def callback(n):
+        log.append(('start', n))
+        await asyncio.sleep(0.01)
+        log.append(('end', n))
+
+    async def main():
+        runner = CallbackRunner(policy=policy)
+        first = asyncio.ensure_future(runner.run(callback, 1))
+        while not log:
+            await asyncio.sleep(0)
+        await asyncio.gather(first, runner.run(callback, 2))
+
+    asyncio.run(main())
+    return log
+
+def test_queue_policy():
+    assert _run_overlapping('queue') == [('start', 1), ('end', 1), ('start', 2), ('end', 2)]
+
+def test_drop_policy():
+    assert _run_overlapping('drop') == [('start', 1), ('end', 1)]
+
+def test_cancel_policy():
+    assert _run_overlapping('cancel') == [('start', 1), ('start', 2), ('end', 2)]
+
+def test_executor_result_is_applied_on_loop():
+    text = Text('')
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            def slow_computation():
+                result = str(sum(range(1000)))
+                def apply():
+                    text.text = result
+                return apply
+            button = Button('go', slow_computation, executor=executor)
+            pending = button.handle_click(element_pb2.ClickEvent(element_id=button.id))
+            assert pending is not None
+            await pending
+    asyncio.run(main())
+    assert text.text == str(sum(range(1000)))
+
+def test_async_button_callback():
+    clicks = []
+    async def callback():
+        await asyncio.sleep(0)
+        clicks.append(1)
+    button = Button('go', callback)
+    async def main():
+        await button.handle_click(element_pb2.ClickEvent(element_id=button.id))
+    asyncio.run(main())
+    assert clicks == [1]
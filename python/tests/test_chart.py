@@ -0,0 +1,72 @@
+import array
+
+import pytest  # type: ignore
+
+from braggle import Chart, GUI, Text
+
+def test_construction():
+    chart = Chart({'a': ([0, 1], [2, 3])})
+    assert chart['a'] == ([0.0, 1.0], [2.0, 3.0])
+
+    with pytest.raises(ValueError):
+        Chart({'a': ([0, 1], [2])})
+    with pytest.raises(ValueError):
+        Chart(retention=0)
+
+def test_accepts_array_likes():
+    chart = Chart()
+    chart.extend('a', array.array('d', [1, 2]), range(2))
+    assert chart['a'] == ([1.0, 2.0], [0.0, 1.0])
+
+def test_retention():
+    chart = Chart(retention=3)
+    chart.extend('a', range(5), range(5))
+    assert chart['a'] == ([2.0, 3.0, 4.0], [2.0, 3.0, 4.0])
+
+def test_appends_are_sent_as_deltas():
+    chart = Chart({'a': ([0], [0])})
+    gui = GUI(chart)
+
+    since = gui.time_step
+    chart.append('a', 1, 10)
+    chart.extend('a', [2, 3], [20, 30])
+
+    pb = gui.updates_since(since).elements[chart.id].chart
+    assert pb.is_delta
+    assert list(pb.series[0].x) == [1, 2, 3]
+    assert list(pb.series[0].y) == [10, 20, 30]
+
+    since = gui.time_step
+    chart.append('a', 4, 40)
+    pb = gui.updates_since(since).elements[chart.id].chart
+    assert list(pb.series[0].x) == [4]
+
+def test_new_clients_get_everything():
+    chart = Chart({'a': ([0], [0])})
+    gui = GUI(chart)
+    chart.append('a', 1, 10)
+
+    pb = gui.updates_since(0).elements[chart.id].chart
+    assert not pb.is_delta
+    assert list(pb.series[0].x) == [0, 1]
+
+def test_other_changes_resend_everything():
+    chart = Chart({'a': ([0], [0])})
+    gui = GUI(chart)
+
+    since = gui.time_step
+    chart.append('a', 1, 10)
+    chart['b'] = ([0], [5])
+    pb = gui.updates_since(since).elements[chart.id].chart
+    assert not pb.is_delta
+    assert {s.name: list(s.x) for s in pb.series} == {'a': [0, 1], 'b': [0]}
+
+def test_reattached_chart_is_resent():
+    chart = Chart({'a': ([0], [0])})
+    gui = GUI(Text('placeholder'))
+    since = gui.time_step
+    chart.append('a', 1, 10)
+    gui.root.append(chart)
+    pb = gui.updates_since(since).elements[chart.id].chart
+    assert not pb.is_delta
+    assert list(pb.series[0].x) == [0, 1]
@@ -0,0 +1,104 @@
+import asyncio
+
+from aiohttp.test_utils import TestServer  # type: ignore
+
+from braggle import GUI, Button, Chart, Grid, List, Text, TextField
+from braggle.client import Client
+from braggle._percentiles import percentile
+from braggle.loadgen import run_load
+from braggle.server import build_server_app, build_session_app
+
+def _serve(gui):
+    return TestServer(build_server_app(gui, token='tok'))
+
+def test_client_tracks_gui_and_interacts():
+    clicks = []
+    label = Text('before')
+    field = TextField()
+    gui = GUI(List([label]), Grid([[Button('go', callback=lambda: clicks.append(1))]]), field)
+
+    async def main():
+        async with _serve(gui) as server:
+            async with Client(str(server.make_url('/auth/tok'))) as client:
+                await client.poll()
+                assert 'before' in client.text()
+                assert 'go' in client.text()
+
+                [button] = client.find('button')
+                await client.click(button)
+                assert clicks == [1]
+
+                await client.text_input(client.find('input')[0], 'typed')
+                assert field.value == 'typed'
+
+                label.text = 'after'
+                await client.poll()
+                assert client.text(label.id) == 'after'
+
+    asyncio.run(main())
+
+def test_client_merges_chart_deltas():
+    chart = Chart({'s': ([0, 1], [0, 1])}, retention=3)
+    gui = GUI(chart)
+
+    async def main():
+        async with _serve(gui) as server:
+            async with Client(str(server.make_url('/auth/tok'))) as client:
+                await client.poll()
+                chart.extend('s', [2, 3], [4, 9])
+                await client.poll()
+                [series] = client.elements[chart.id].chart.series
+                assert (list(series.x), list(series.y)) == chart['s']
+
+    asyncio.run(main())
+
+def test_run_load():
+    text = Text('0')
+    gui = GUI(text, Button('b', callback=lambda: setattr(text, 'text', text.text + '!')))
+
+    async def main():
+        async with _serve(gui) as server:
+            return await run_load(str(server.make_url('/auth/tok')), viewers=3, interactors=2, duration=0.5, interval=0.05, seed=0)
+
+    report = asyncio.run(main())
+    assert report.errors == 0
+    assert report.interaction_latencies
+    assert len(report.poll_latencies) > 5
+    assert 'p99' in report.summary()
+
+def test_run_load_makes_a_session_per_client():
+    texts = []
+    repolled = set()
+    class RecordingGUI(GUI):
+        def write_updates_since(self, buf, since=0):
+            if since:
+                repolled.add(self)
+            super().write_updates_since(buf, since)
+    def gui_factory():
+        texts.append(Text('0'))
+        return RecordingGUI(texts[-1])
+
+    async def tick():
+        while True:
+            await asyncio.sleep(0.02)
+            for text in texts:
+                text.text += '!'
+
+    async def main():
+        ticker = asyncio.ensure_future(tick())
+        try:
+            async with TestServer(build_session_app(gui_factory, token='tok')) as server:
+                return await run_load(str(server.make_url('/auth/tok')), viewers=5, duration=0.5)
+        finally:
+            ticker.cancel()
+
+    report = asyncio.run(main())
+    assert report.errors == 0
+    # Every client kept polling its own GUI.
+    assert len(texts) == len(repolled) == 5
+
+def test_percentile():
+    assert percentile([], 50) == 0
+    assert percentile([3, 1, 2], 50) == 2
+    assert percentile(list(range(1, 101)), 99) == 99
+    assert percentile([5], 99) == 5
@@ -33,3 +33,48 @@ def test_child_parent_consistency_fuzzer():
             e.parent = None
             if old_parent is not None:
                 assert e not in old_parent.children
+
+def test_builtin_elements_have_no_instance_dict():
+    from braggle import Button, Grid, List, Text
+    for e in [Text('a'), Button('b'), List([Text('c')]), Grid([[Text('d')]])]:
+        assert not hasattr(e, '__dict__'), type(e)
+
+def test_children_are_ordered():
+    parent = SimpleElement()
+    children = [SimpleElement() for _ in range(20)]
+    for child in reversed(children):
+        child.parent = parent
+    assert list(parent.children) == children[::-1]
+
+    children[3].parent = None
+    assert list(parent.children) == [c for c in children[::-1] if c is not children[3]]
+
+def test_sequence_element_children_follow_sequence_order():
+    from braggle import List, Text
+    children = [Text(str(i)) for i in range(5)]
+    parent = List(children)
+    parent.insert(0, parent.pop())
+    assert list(parent.children) == list(parent)
+    assert list(parent.walk())[1:] == list(parent)
+
+def test_elements_can_be_built_on_several_threads():
+    import sys
+    import threading
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errors = []
+    def build():
+        try:
+            for _ in range(10000):
+                SimpleElement()
+        except Exception as e:
+            errors.append(e)
+    try:
+        threads = [threading.Thread(target=build) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+    assert errors == []
@@ -1,5 +1,6 @@
 import pytest  # type: ignore
 from braggle import Grid, Text
+from braggle.protobuf_helpers import expand_templates
 from braggle.protobuf import element_pb2
 from . import assert_marks_dirty
 
@@ -144,7 +145,7 @@ def test_set_dimensions__marks_dirty():
 
 def test_protobuf():
     a, b, c = Text('a'), Text('b'), Text('c')
-    pb = Grid([[a, b, None], [c, None, None]]).to_protobuf()
+    pb = expand_templates(Grid([[a, b, None], [c, None, None]]).to_protobuf())
     assert pb.tag.tagname == 'table'
     assert len(pb.tag.children) == 2
     for i, row in enumerate(pb.tag.children):
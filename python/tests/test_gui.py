@@ -0,0 +1,163 @@
+import asyncio
+import threading
+
+import pytest  # type: ignore
+
+from braggle import GUI, Element, Grid, List, Text, ThreadSafeGUI, protobuf_helpers
+
+def test_updates_since_includes_changed_elements():
+    text = Text('before')
+    gui = GUI(text)
+    since = gui.time_step
+    text.text = 'after'
+    state = gui.updates_since(since)
+    assert state.timestep == gui.time_step
+    assert set(state.elements) == {text.id}
+    assert state.elements[text.id].text == 'after'
+
+def test_updates_since_omits_detached_elements():
+    churned = [Text(str(i)) for i in range(10)]
+    kept = Text('kept')
+    container = List([kept])
+    gui = GUI(container)
+    since = gui.time_step
+
+    for t in churned:
+        container.append(t)
+        t.text += '!'
+    del container[1:]
+
+    state = gui.updates_since(since)
+    assert set(state.elements) == {container.id}
+
+def test_ids_are_scoped_per_gui():
+    (a, b) = (GUI(Text('a')), GUI(Text('b')))
+    assert a.root.id == b.root.id
+    assert a.root.id != 0
+
+def test_element_by_id():
+    text = Text('a')
+    container = List([text])
+    gui = GUI(container)
+    assert gui.element_by_id(text.id) is text
+
+    del container[0]
+    assert gui.element_by_id(text.id) is None
+
+def test_moving_an_element_between_guis_gives_it_a_new_id():
+    text = Text('a')
+    (first, second) = (List([text]), List([Text('b'), Text('c')]))
+    (gui1, gui2) = (GUI(first), GUI(second))
+    old_id = text.id
+
+    del first[0]
+    second.append(text)
+    assert gui2.element_by_id(text.id) is text
+    assert len({e.id for e in gui2.root.walk()}) == len(list(gui2.root.walk()))
+    assert gui1.element_by_id(old_id) is None
+
+def test_elements_attached_without_being_marked_dirty_get_gui_ids():
+    class Wrapper(Element):
+        def __init__(self, child: Element) -> None:
+            super().__init__()
+            self.child = child
+            child.parent = self
+        def to_protobuf(self):
+            return protobuf_helpers.tag('div', children=[self.child])
+
+    inner = Text('inner')
+    wrapper = Wrapper(Text('placeholder'))
+    gui = GUI(List([Text(str(i)) for i in range(10)]), wrapper)
+    wrapper.child.parent = None
+    wrapper.child = inner
+    inner.parent = wrapper
+    assert gui.element_by_id(inner.id) is inner
+    assert len({e.id for e in gui.root.walk()}) == len(list(gui.root.walk()))
+
+def test_stats():
+    big = Text('x' * 1000)
+    container = List([Text('a'), Text('b'), big])
+    gui = GUI(container)
+    churned = [Text(str(i)) for i in range(5)]
+    for t in churned:
+        container.append(t)
+    del container[3:]
+
+    stats = gui.stats(n_largest=2)
+    assert stats.n_elements == gui.n_elements()
+    assert (stats.elements_by_type['Text'], stats.elements_by_type['List']) == (3, 1)
+    assert stats.memory_bytes_by_type['Text'] > 1000
+    assert stats.encoded_bytes_by_type['Text'] == (1 + 2 + 1000) + 3 + 3
+    assert stats.dirty_log_length == gui.dirty_log_length
+    assert stats.n_retained_detached == len(churned)
+    buf = bytearray()
+    gui.write_updates_since(buf, 0)
+    assert stats.snapshot_bytes == len(buf)
+    assert [(s.id, s.type) for s in stats.largest][:1] == [(big.id, 'Text')]
+    assert len(stats.largest) == 2
+
+def test_thread_safe_gui_batches_off_loop_changes():
+    texts = [Text('') for _ in range(4)]
+    container = List()
+    gui = ThreadSafeGUI(container, *texts)
+    notifications = []
+    gui.add_listener(lambda: notifications.append(threading.get_ident()))
+
+    async def main():
+        gui.loop = asyncio.get_running_loop()
+        since = gui.time_step
+
+        def produce(text):
+            for i in range(100):
+                gui.set(text, text=str(i))
+            gui.call_soon(container.append, Text('from ' + text.text))
+        threads = [threading.Thread(target=produce, args=(t,)) for t in texts]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        await asyncio.sleep(0.01)
+
+        state = gui.updates_since(since)
+        assert all(state.elements[t.id].text == '99' for t in texts)
+        assert len(container) == 4
+        return since
+
+    since = asyncio.run(main())
+    assert gui.time_step - since > 400
+    assert 0 < len(notifications) < 400
+    assert set(notifications) == {threading.get_ident()}
+
+def test_thread_safe_gui_warns_about_direct_changes_off_loop():
+    text = Text('')
+    gui = ThreadSafeGUI(text)
+
+    async def main():
+        gui.loop = asyncio.get_running_loop()
+        since = gui.time_step
+        caught = []
+        def produce():
+            with pytest.warns(RuntimeWarning, match='off the event loop') as record:
+                text.text = 'direct'
+            caught.extend(record)
+        thread = threading.Thread(target=produce)
+        thread.start()
+        thread.join()
+        assert len(caught) == 1
+        await asyncio.sleep(0.01)
+        assert text.id in gui.updates_since(since).elements
+
+    asyncio.run(main())
+
+def test_guis_number_only_the_templates_they_use():
+    grid_gui = GUI(Grid([[Text('a'), None]]))
+    list_gui = GUI(List([Text('b')]))
+    for gui in (grid_gui, list_gui):
+        gui.updates_since(0)
+    [list_template] = list_gui.templates_since(0).values()
+    assert list_gui.templates_since(1) == {}
+    assert len(grid_gui.templates_since(0)) == 2
+    assert list_template not in grid_gui.templates_since(0).values()
+    state = list_gui.updates_since(0)
+    [item] = [pb for pb in state.elements.values() if pb.WhichOneof('element_kind') == 'tag' and pb.tag.tagname == 'ul']
+    assert protobuf_helpers.expand_templates(item, list_gui._templates).tag.children[0].tag.tagname == 'li'
@@ -0,0 +1,30 @@
+import pytest  # type: ignore
+
+from braggle import Markdown, RawHTML, sanitize_html
+
+from . import assert_marks_dirty
+
+def test_sanitize_keeps_formatting():
+    source = '<p class="x">some <b>bold</b> and <a href="https://example.com">a link</a><br></p>'
+    assert sanitize_html(source) == source
+
+def test_sanitize_strips_scripts_and_handlers():
+    assert sanitize_html('<p onclick="evil()">hi<script>evil()</script></p>') == '<p>hi</p>'
+    assert sanitize_html('<a href="javascript:evil()">x</a>') == '<a>x</a>'
+    assert sanitize_html('<a href=" JaVaScRiPt:evil()">x</a>') == '<a>x</a>'
+    assert sanitize_html('<blink>x</blink>') == 'x'
+
+def test_sanitize_escapes_text_and_closes_tags():
+    assert sanitize_html('<b>1 &lt; 2') == '<b>1 &lt; 2</b>'
+
+def test_raw_html():
+    block = RawHTML('<b>hi</b><script>x</script>')
+    assert block.to_protobuf().raw_html == '<b>hi</b>'
+    assert RawHTML('<script>x</script>', sanitize=False).to_protobuf().raw_html == '<script>x</script>'
+    with assert_marks_dirty(block):
+        block.html = '<i>bye</i>'
+    assert block.to_protobuf().raw_html == '<i>bye</i>'
+
+def test_markdown():
+    pytest.importorskip('markdown')
+    assert Markdown('*hi*').to_protobuf().raw_html == '<p><em>hi</em></p>'
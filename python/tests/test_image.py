@@ -0,0 +1,39 @@
+import io
+
+from braggle import GUI, MemoryImage
+from braggle._blobs import BlobStore
+
+from . import assert_marks_dirty
+
+def test_memory_image_accepts_file_like():
+    store = BlobStore()
+    image = MemoryImage(io.BytesIO(b'abc'), format='png', store=store)
+    assert image.data == b'abc'
+    assert image.to_protobuf().tag.attributes.misc['src'] == f'blob/{BlobStore.digest(b"abc")}.png'
+
+def test_memory_image_only_dirtied_by_new_bytes():
+    image = MemoryImage(b'abc', format='png', store=BlobStore())
+    gui = GUI(image)
+    with assert_marks_dirty(image):
+        image.data = b'def'
+    time_step = gui.time_step
+    image.data = b'def'
+    assert gui.time_step == time_step
+
+def test_memory_image_restores_evicted_bytes():
+    store = BlobStore(max_bytes=3)
+    image = MemoryImage(b'abc', format='png', store=store)
+    MemoryImage(b'xyz', format='png', store=store)
+    assert image.url.split('/')[1].split('.')[0] not in store
+    image.to_protobuf()
+    assert store.get(BlobStore.digest(b'abc')) == b'abc'
+
+def test_blob_store_evicts_least_recently_used():
+    store = BlobStore(max_bytes=6)
+    a = store.put(b'aaa')
+    b = store.put(b'bbb')
+    store.get(a)
+    store.put(b'ccc')
+    assert a in store
+    assert b not in store
+    assert store.total_bytes == 6
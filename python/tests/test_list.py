@@ -4,6 +4,7 @@ from unittest.mock import patch
 from pytest import raises  # type: ignore
 
 from braggle import Element, List, Text
+from braggle.protobuf_helpers import expand_templates
 from . import assert_marks_dirty
 
 def test_construction():
@@ -128,7 +129,7 @@ def test_to_protobuf():
     assert List([Text('a')], numbered=True).to_protobuf().tag.tagname == 'ol'
 
     l = List([Text('a')])
-    j = l.to_protobuf().tag
+    j = expand_templates(l.to_protobuf()).tag
     assert j.tagname == 'ul'
     assert j.children[0].tag.tagname == 'li'
     assert j.children[0].tag.children[0].ref == l[0].id
@@ -0,0 +1,14 @@
+from braggle.server._metrics import Histogram
+
+def test_histogram_buckets_are_cumulative_and_inclusive():
+    h = Histogram('h', 'help', buckets=[1, 2], label='kind')
+    for value in [0.5, 1, 1.5, 3]:
+        h.observe(value, 'a')
+    h.observe(1, 'b"')
+    lines = h.render()
+    assert 'h_bucket{kind="a",le="1"} 2' in lines
+    assert 'h_bucket{kind="a",le="2"} 3' in lines
+    assert 'h_bucket{kind="a",le="+Inf"} 4' in lines
+    assert 'h_sum{kind="a"} 6.0' in lines
+    assert 'h_count{kind="b\\""} 1' in lines
+    assert h.count('a') == 4
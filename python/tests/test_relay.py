@@ -0,0 +1,147 @@
+import asyncio
+import subprocess
+import sys
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from braggle import GUI, Button, List, Text
+from braggle.client import Client
+from braggle.protobuf import element_pb2
+from braggle.relay import Relay, build_relay_app
+from braggle.server import _get_open_port, build_server_app
+
+async def _serve_on_socket(app: web.Application, path: str) -> web.AppRunner:
+    # Don't wait for the relay's long poll to finish when shutting down.
+    runner = web.AppRunner(app, shutdown_timeout=0.1)
+    await runner.setup()
+    await web.UnixSite(runner, path).start()
+    return runner
+
+def test_relays_can_be_stacked(tmp_path):
+    text = Text('before')
+    gui = GUI(text)
+    socket = str(tmp_path / 'owner.sock')
+
+    async def main():
+        owner = await _serve_on_socket(build_server_app(gui, token='owner'), socket)
+        try:
+            async with TestServer(build_relay_app('http://owner/auth/owner', token='relay1', upstream_socket=socket)) as relay1:
+                async with TestServer(build_relay_app(str(relay1.make_url('/auth/relay1')), token='relay2')) as relay2:
+                    async with Client(str(relay2.make_url('/auth/relay2'))) as viewer:
+                        await viewer.poll()
+                        assert viewer.text() == 'before'
+                        text.text = 'after'
+                        await viewer.poll()
+                        assert viewer.text() == 'after'
+        finally:
+            await owner.cleanup()
+
+    asyncio.run(main())
+
+def test_relay_sends_what_changed():
+    (a, b) = (Text('a'), Text('b'))
+    gui = GUI(a, b, List([Text('c')]))
+
+    async def main():
+        async with TestServer(build_server_app(gui, token='owner')) as owner:
+            relay = Relay(Client(str(owner.make_url('/auth/owner'))))
+            await relay.upstream.connect()
+            await relay.upstream.poll()
+            relay._record(relay.timestep, list(relay.upstream.elements))
+            first = relay.timestep
+            b.text = 'b!'
+            state = await relay.upstream.poll()
+            relay._record(relay.timestep, list(state.elements))
+            await relay.upstream.close()
+
+            [full, delta] = [element_pb2.PollResponse.FromString(relay.encode_poll_response(since, 0)) for since in (0, first)]
+            assert full.state.timestep == delta.state.timestep == relay.timestep
+            assert set(full.state.elements) == {e.id for e in gui.root.walk()} | {e.id for e in gui.stylesheet.walk()}
+            assert set(delta.state.elements) == {b.id}
+            assert delta.state.elements[b.id].text == 'b!'
+            assert set(full.templates) == set(relay.upstream.templates) == {0}
+            assert not element_pb2.PollResponse.FromString(relay.encode_poll_response(first, 1)).templates
+            # Viewers polling from the same timestep share the encoded response.
+            assert relay.encode_poll_response(first, 0) is relay.encode_poll_response(first, 0)
+
+    asyncio.run(main())
+
+def test_interactions_are_refused_or_forwarded():
+    clicks = []
+    button = Button('click me', callback=lambda: clicks.append(1))
+    gui = GUI(button)
+
+    async def main():
+        async with TestServer(build_server_app(gui, token='owner')) as owner:
+            upstream = str(owner.make_url('/auth/owner'))
+            for forward in [False, True]:
+                async with TestServer(build_relay_app(upstream, token='relay', forward_interactions=forward)) as relay:
+                    async with Client(str(relay.make_url('/auth/relay'))) as viewer:
+                        await viewer.poll()
+                        [button_id] = viewer.find('button')
+                        try:
+                            await viewer.click(button_id)
+                        except aiohttp.ClientResponseError as e:
+                            assert (forward, e.status) == (False, 403)
+                        assert len(clicks) == int(forward)
+
+    asyncio.run(main())
+
+def test_relay_process():
+    gui = GUI(Text('hello from upstream'))
+    port = _get_open_port()
+
+    async def main():
+        async with TestServer(build_server_app(gui, token='owner')) as owner:
+            relay = await asyncio.create_subprocess_exec(
+                sys.executable, '-m', 'braggle.relay', str(owner.make_url('/auth/owner')), '--port', str(port), '--token', 'relay',
+                stdout=subprocess.DEVNULL,
+            )
+            try:
+                for _ in range(100):
+                    try:
+                        async with Client(f'http://localhost:{port}/auth/relay') as viewer:
+                            await viewer.poll()
+                            return viewer.text()
+                    except aiohttp.ClientConnectionError:
+                        await asyncio.sleep(0.1)
+            finally:
+                relay.terminate()
+                await relay.wait()
+
+    assert asyncio.run(main()) == 'hello from upstream'
+
+def test_relay_starts_over_when_upstream_restarts(tmp_path):
+    socket = str(tmp_path / 'owner.sock')
+
+    async def wait_for_update(relay: Relay, after: int) -> None:
+        async with relay.condition:
+            await asyncio.wait_for(relay.condition.wait_for(lambda: relay._update_timesteps and relay.timestep > after), 5)
+
+    async def main():
+        owner = await _serve_on_socket(build_server_app(GUI(Text('first')), token='owner'), socket)
+        relay = Relay(Client('http://owner/auth/owner', unix_socket=socket), retry_interval=0.05, max_cached_responses=3)
+        await relay.start(web.Application())
+        try:
+            await wait_for_update(relay, 0)
+            seen = relay.timestep
+            await owner.cleanup()
+            owner = await _serve_on_socket(build_server_app(GUI(Text('second')), token='owner'), socket)
+            await wait_for_update(relay, seen)
+
+            # Viewers from before the restart, or ahead of the relay, get the new GUI in full.
+            for since in [seen, 10**6]:
+                state = element_pb2.PollResponse.FromString(relay.encode_poll_response(since, 0)).state
+                assert state.timestep == relay.timestep
+                assert 'second' in {e.text for e in state.elements.values()}
+
+            for known_templates in range(10):
+                relay.encode_poll_response(relay.timestep - 1, known_templates)
+            assert len(relay._responses) <= 3
+        finally:
+            await relay.stop(web.Application())
+            await owner.cleanup()
+
+    asyncio.run(main())
@@ -80,3 +80,14 @@ def test_delitem_slice():
     assert list(parent) == [cont1, cont2]
     assert old1.parent is old2.parent is None
     assert cont1.parent is cont2.parent is parent
+
+
+def test_setting_parent_directly_keeps_children_in_sync():
+    (a, b) = (Text("a"), Text("b"))
+    parent = List([a])
+    b.parent = parent
+    assert list(parent) == [a, b]
+    assert list(parent.children) == [a, b]
+    a.parent = None
+    assert list(parent) == [b]
+    assert b.parent is parent
@@ -1,4 +1,375 @@
-from braggle.server import CLIENT_HTML
+import asyncio
+import re
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from braggle import GUI, Button, List, MemoryImage, Slider, Text
+from braggle._blobs import BlobStore
+from braggle.client import Client
+from braggle.protobuf import element_pb2
+from braggle.server import CLIENT_HTML, Server, build_server_app, serve_async
 
 def test_client_html_exists():
     assert CLIENT_HTML.is_file()
+
+def _slide_request(slider: Slider, value: float) -> bytes:
+    return element_pb2.InteractionRequest(
+        interaction=element_pb2.Interaction(slide=element_pb2.SlideEvent(element_id=slider.id, value=value)),
+    ).SerializeToString()
+
+def test_superseded_slides_are_dropped():
+    values = []
+    slider = Slider(min=0, max=10, callback=values.append)
+    gui = GUI(slider)
+
+    async def main():
+        condition = asyncio.Condition()
+        server = Server(gui, condition)
+        app = web.Application()
+        app.add_routes(server.build_routes())
+        async with TestClient(TestServer(app)) as client:
+            async with condition:
+                first = asyncio.ensure_future(client.post('/interaction', data=_slide_request(slider, 1)))
+                while not server._latest_interactions:
+                    await asyncio.sleep(0.01)
+                for value in [2, 3]:
+                    resp = await client.post('/interaction', data=_slide_request(slider, value))
+                    assert resp.status == 200
+            assert (await first).status == 200
+
+    asyncio.run(main())
+    assert values == [3]
+    assert slider.value == 3
+
+def test_slides_cancelled_while_waiting_dont_block_later_ones():
+    values = []
+    slider = Slider(min=0, max=10, callback=values.append)
+    gui = GUI(slider)
+
+    async def main():
+        condition = asyncio.Condition()
+        server = Server(gui, condition)
+        app = web.Application()
+        app.add_routes(server.build_routes())
+        async with TestClient(TestServer(app, handler_cancellation=True)) as client:
+            async with condition:
+                first = asyncio.ensure_future(client.post('/interaction', data=_slide_request(slider, 1)))
+                while not server._latest_interactions:
+                    await asyncio.sleep(0.01)
+                # The client hangs up, which cancels the handler waiting for the lock.
+                first.cancel()
+                for _ in range(100):
+                    if not server._latest_interactions:
+                        break
+                    await asyncio.sleep(0.01)
+                assert not server._latest_interactions
+            resp = await client.post('/interaction', data=_slide_request(slider, 2))
+            assert resp.status == 200
+
+    asyncio.run(main())
+    assert values == [2]
+
+def _poll_request(since: int, known_templates: int = 0) -> bytes:
+    return element_pb2.PollRequest(since_timestep=since, known_templates=known_templates).SerializeToString()
+
+def test_max_update_rate_merges_rapid_changes():
+    text = Text('0')
+    gui = GUI(text)
+
+    async def main():
+        app = build_server_app(gui, token='tok', max_update_rate=5)
+        async with TestClient(TestServer(app)) as client:
+            await client.get('/auth/tok')
+            since = gui.time_step
+
+            async def produce():
+                for i in range(1, 11):
+                    text.text = str(i)
+                    await asyncio.sleep(0.001)
+            producer = asyncio.ensure_future(produce())
+
+            started = time.monotonic()
+            resp = await client.post('/poll', data=_poll_request(since))
+            elapsed = time.monotonic() - started
+            await producer
+
+            state = element_pb2.PollResponse.FromString(await resp.read()).state
+            assert elapsed >= 0.15
+            assert state.timestep == gui.time_step
+            assert state.elements[text.id].text == '10'
+
+    asyncio.run(main())
+
+def test_poll_sends_only_unknown_templates():
+    gui = GUI(List([Text('a'), Text('b')]))
+
+    async def main():
+        app = build_server_app(gui, token='tok')
+        async with TestClient(TestServer(app)) as client:
+            await client.get('/auth/tok')
+
+            resp = await client.post('/poll', data=_poll_request(0))
+            templates = element_pb2.PollResponse.FromString(await resp.read()).templates
+            assert len(templates) >= 1
+            assert sorted(templates) == list(range(len(templates)))
+
+            resp = await client.post('/poll', data=_poll_request(0, known_templates=len(templates)))
+            assert not element_pb2.PollResponse.FromString(await resp.read()).templates
+
+    asyncio.run(main())
+
+def test_index_is_compressed_and_revalidatable():
+    async def main():
+        app = build_server_app(GUI(), token='tok')
+        async with TestClient(TestServer(app)) as client:
+            await client.get('/auth/tok')
+            resp = await client.get('/', headers={'Accept-Encoding': 'gzip'})
+            assert resp.status == 200
+            assert resp.headers['Content-Encoding'] == 'gzip'
+            assert (await resp.read()) == CLIENT_HTML.read_bytes()
+            etag = resp.headers['ETag']
+
+            resp = await client.get('/', headers={'If-None-Match': etag})
+            assert resp.status == 304
+            for header in ['W/' + etag, f'"other", {etag}', '*']:
+                assert (await client.get('/', headers={'If-None-Match': header})).status == 304
+            for header in ['"x' + etag[1:], '"x"']:
+                assert (await client.get('/', headers={'If-None-Match': header})).status == 200
+
+    asyncio.run(main())
+
+def test_large_poll_responses_are_compressed():
+    small, big = Text('x'), Text('x' * 5000)
+    async def main():
+        for (text, expect_compressed) in [(small, False), (big, True)]:
+            app = build_server_app(GUI(text), token='tok')
+            async with TestClient(TestServer(app)) as client:
+                await client.get('/auth/tok')
+                resp = await client.post('/poll', data=_poll_request(0), headers={'Accept-Encoding': 'gzip'})
+                assert ('Content-Encoding' in resp.headers) == expect_compressed
+                state = element_pb2.PollResponse.FromString(await resp.read()).state
+                assert state.elements[text.id].text == text.text
+
+    asyncio.run(main())
+
+def test_static_files(tmp_path):
+    (tmp_path / 'data.bin').write_bytes(bytes(range(256)))
+    async def main():
+        app = build_server_app(GUI(), token='tok', static_dir=tmp_path)
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get('/static/data.bin')
+            assert resp.status == 403
+
+            await client.get('/auth/tok')
+            resp = await client.get('/static/data.bin')
+            assert resp.status == 200
+            assert (await resp.read()) == bytes(range(256))
+            etag = resp.headers['ETag']
+
+            resp = await client.get('/static/data.bin', headers={'If-None-Match': etag})
+            assert resp.status == 304
+
+            resp = await client.get('/static/data.bin', headers={'Range': 'bytes=10-19'})
+            assert resp.status == 206
+            assert (await resp.read()) == bytes(range(10, 20))
+
+            resp = await client.get('/static/../../etc/passwd')
+            assert resp.status in (403, 404)
+
+    asyncio.run(main())
+
+def test_memory_image_blobs():
+    store = BlobStore()
+    image = MemoryImage(b'\x89PNG fake', format='png', store=store)
+    async def main():
+        app = web.Application(middlewares=[])
+        app.add_routes(Server(GUI(image), asyncio.Condition(), blob_store=store).build_routes())
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get('/' + image.url)
+            assert resp.status == 200
+            assert (await resp.read()) == b'\x89PNG fake'
+            assert resp.headers['Content-Type'] == 'image/png'
+            assert 'immutable' in resp.headers['Cache-Control']
+
+            resp = await client.get('/' + image.url, headers={'If-None-Match': resp.headers['ETag']})
+            assert resp.status == 304
+
+            for name in ['0123.png', 'a.png', '.png']:
+                resp = await client.get('/blob/' + name, headers={'If-None-Match': f'"{image.url[5:-4]}", *'})
+                assert resp.status == 404
+
+    asyncio.run(main())
+
+def test_metrics():
+    slider = Slider()
+    gui = GUI(slider)
+
+    async def main():
+        async with TestClient(TestServer(build_server_app(gui, token='tok', metrics=True))) as client:
+            await client.get('/auth/tok')
+            await client.post('/poll', data=_poll_request(0))
+            await client.post('/interaction', data=_slide_request(slider, 0.5))
+
+            client.session.cookie_jar.clear()
+            assert (await client.get('/metrics')).status == 403
+            resp = await client.get('/metrics', headers={'Authorization': 'Bearer tok'})
+            assert resp.status == 200
+            return await resp.text()
+
+    text = asyncio.run(main())
+    assert 'braggle_waiting_pollers 0\n' in text
+    assert f'braggle_timestep {gui.time_step}\n' in text
+    assert 'braggle_poll_response_bytes_count 1\n' in text
+    assert 'braggle_callback_seconds_count{element_type="Slider"} 1\n' in text
+
+def test_metrics_are_off_by_default():
+    async def main():
+        async with TestClient(TestServer(build_server_app(GUI(), token='tok'))) as client:
+            await client.get('/auth/tok')
+            assert (await client.get('/metrics')).status == 404
+
+    asyncio.run(main())
+
+def test_tracing():
+    slider = Slider()
+    gui = GUI(slider)
+
+    async def main():
+        async with TestClient(TestServer(build_server_app(gui, token='tok', tracing=True))) as client:
+            await client.get('/auth/tok')
+            since = gui.time_step
+            resp = await client.post('/interaction', data=_slide_request(slider, 0.5))
+            trace_id = element_pb2.InteractionResponse.FromString(await resp.read()).trace_id
+            assert trace_id != 0
+
+            resp = await client.post('/poll', data=_poll_request(since))
+            assert list(element_pb2.PollResponse.FromString(await resp.read()).trace_ids) == [trace_id]
+            resp = await client.post('/poll', data=_poll_request(0))
+            assert list(element_pb2.PollResponse.FromString(await resp.read()).trace_ids) == [trace_id]
+
+            resp = await client.post('/trace', data=element_pb2.PaintReportRequest(reports=[
+                element_pb2.PaintReport(trace_id=trace_id, end_to_end_ms=1000, round_trip_ms=500, render_ms=10),
+            ]).SerializeToString())
+            assert resp.status == 204
+            # Once painted, a trace no longer rides along with polls.
+            resp = await client.post('/poll', data=_poll_request(0))
+            assert not element_pb2.PollResponse.FromString(await resp.read()).trace_ids
+
+            summary = await (await client.get('/debug/traces')).json()
+            chrome = await (await client.get('/debug/traces?format=chrome')).json()
+            return (trace_id, summary, chrome)
+
+    (trace_id, summary, chrome) = asyncio.run(main())
+    assert summary['stages_ms']['end_to_end'] == {'count': 1, 'p50': 1000, 'p90': 1000, 'p99': 1000, 'max': 1000}
+    assert summary['stages_ms']['render']['max'] == 10
+    assert summary['stages_ms']['serialize']['count'] == 1
+    assert 0 < summary['stages_ms']['network']['max'] < 990
+    [trace] = summary['recent']
+    assert (trace['id'], trace['kind'], trace['element_type']) == (trace_id, 'slide', 'Slider')
+    assert {e['name'] for e in chrome['traceEvents']} == {'lock_wait', 'dispatch', 'callback', 'poll_wait', 'serialize', 'network', 'render'}
+    assert all(e['ts'] >= 0 for e in chrome['traceEvents'])
+
+def test_interactions_that_change_nothing_are_not_delivered():
+    button = Button('do nothing', callback=lambda: None)
+    gui = GUI(button)
+
+    async def main():
+        async with TestClient(TestServer(build_server_app(gui, token='tok', tracing=True))) as client:
+            await client.get('/auth/tok')
+            resp = await client.post('/interaction', data=element_pb2.InteractionRequest(
+                interaction=element_pb2.Interaction(click=element_pb2.ClickEvent(element_id=button.id)),
+            ).SerializeToString())
+            assert element_pb2.InteractionResponse.FromString(await resp.read()).trace_id != 0
+            resp = await client.post('/poll', data=_poll_request(0))
+            assert not element_pb2.PollResponse.FromString(await resp.read()).trace_ids
+
+    asyncio.run(main())
+
+def test_tracing_is_off_by_default():
+    slider = Slider()
+    gui = GUI(slider)
+
+    async def main():
+        async with TestClient(TestServer(build_server_app(gui, token='tok'))) as client:
+            await client.get('/auth/tok')
+            resp = await client.post('/interaction', data=_slide_request(slider, 0.5))
+            assert element_pb2.InteractionResponse.FromString(await resp.read()).trace_id == 0
+            assert (await client.get('/debug/traces')).status == 404
+
+    asyncio.run(main())
+
+def test_stats():
+    gui = GUI(Text('x' * 1000), Slider())
+
+    async def main():
+        async with TestClient(TestServer(build_server_app(gui, token='tok'))) as client:
+            await client.get('/auth/tok')
+            assert (await client.get('/debug/stats')).status == 404
+        async with TestClient(TestServer(build_server_app(gui, token='tok', stats=True))) as client:
+            await client.get('/auth/tok')
+            for top in ['lots', '-1', '1.5']:
+                assert (await client.get(f'/debug/stats?top={top}')).status == 400
+            return await (await client.get('/debug/stats?top=1')).json()
+
+    stats = asyncio.run(main())
+    assert stats['elements_by_type']['Slider'] == 1
+    assert [s['type'] for s in stats['largest']] == ['Text']
+
+def test_mounted_as_subapp():
+    text = Text('a')
+    gui = GUI(text)
+
+    async def main():
+        async def hello(request):
+            return web.Response(text='hello')
+        parent = web.Application()
+        parent.add_routes([web.get('/', hello)])
+        parent.add_subapp('/braggle/', build_server_app(gui, token='tok'))
+        async with TestClient(TestServer(parent)) as client:
+            resp = await client.get('/braggle/auth/tok', allow_redirects=False)
+            assert resp.headers['Location'] == '/braggle/'
+            assert {c['path'] for c in resp.cookies.values()} == {'/braggle/'}
+            assert (await client.get('/braggle/')).status == 200
+            assert await (await client.get('/')).text() == 'hello'
+
+            resp = await client.post('/braggle/poll', data=_poll_request(0))
+            timestep = element_pb2.PollResponse.FromString(await resp.read()).state.timestep
+            poll = asyncio.ensure_future(client.post('/braggle/poll', data=_poll_request(timestep)))
+            await asyncio.sleep(0.05)
+            text.text = 'b'
+            assert (await poll).status == 200
+
+    asyncio.run(main())
+
+def test_client_request_urls_are_relative():
+    # ...so that a client served from under a mount prefix talks to its own app.
+    async def main():
+        parent = web.Application()
+        parent.add_subapp('/braggle/', build_server_app(GUI(), token='tok'))
+        async with TestClient(TestServer(parent)) as client:
+            await client.get('/braggle/auth/tok')
+            html = await (await client.get('/braggle/')).text()
+            for endpoint in ['poll', 'interaction', 'trace']:
+                assert re.search(rf'''url:\s*['"]{endpoint}['"]''', html), endpoint
+                assert not re.search(rf'''['"]/{endpoint}['"]''', html), endpoint
+
+    asyncio.run(main())
+
+def test_serve_over_unix_socket(tmp_path):
+    path = str(tmp_path / 'braggle.sock')
+
+    async def main():
+        serving = asyncio.ensure_future(serve_async(GUI(Text('hi')), token='tok', path=path))
+        try:
+            while not (tmp_path / 'braggle.sock').exists():
+                await asyncio.sleep(0.01)
+            async with Client('http://localhost/auth/tok', unix_socket=path) as client:
+                await client.poll()
+                assert client.text() == 'hi'
+        finally:
+            serving.cancel()
+            await asyncio.gather(serving, return_exceptions=True)
+
+    asyncio.run(main())
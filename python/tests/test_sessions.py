@@ -0,0 +1,156 @@
+import asyncio
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from braggle import GUI, Button, Text
+from braggle.client import Client
+from braggle.protobuf import element_pb2
+from braggle.server import build_session_app
+
+def _poll_request(since: int) -> bytes:
+    return element_pb2.PollRequest(since_timestep=since).SerializeToString()
+
+def _click_request(button: Button) -> bytes:
+    return element_pb2.InteractionRequest(
+        interaction=element_pb2.Interaction(click=element_pb2.ClickEvent(element_id=button.id)),
+    ).SerializeToString()
+
+class _Counter:
+    '''A GUI factory whose GUIs each count their button's clicks.'''
+    def __init__(self):
+        self.guis = []
+
+    def __call__(self) -> GUI:
+        text = Text('0')
+        def click():
+            text.text = str(int(text.text) + 1)
+        button = Button('+1', callback=click)
+        self.guis.append((GUI(text, button), text, button))
+        return self.guis[-1][0]
+
+async def _connect(server: TestServer) -> TestClient:
+    client = TestClient(server)
+    await client.start_server()
+    await client.get('/auth/tok')
+    return client
+
+def test_each_session_gets_its_own_gui():
+    factory = _Counter()
+
+    async def main():
+        server = TestServer(build_session_app(factory, token='tok'))
+        (alice, bob) = (await _connect(server), await _connect(server))
+        try:
+            assert len(factory.guis) == 2
+            [(_, alice_text, alice_button), (_, bob_text, _)] = factory.guis
+            assert (await alice.post('/interaction', data=_click_request(alice_button))).status == 200
+            assert (alice_text.text, bob_text.text) == ('1', '0')
+
+            # Revisiting keeps the session.
+            await alice.get('/')
+            assert len(factory.guis) == 2
+        finally:
+            await alice.close()
+            await bob.close()
+
+    asyncio.run(main())
+
+def test_headless_clients_get_sessions():
+    factory = _Counter()
+
+    async def main():
+        async with TestServer(build_session_app(factory, token='tok')) as server:
+            async with Client(str(server.make_url('/auth/tok'))) as client:
+                await client.poll()
+                [button_id] = client.find('button')
+                await client.click(button_id)
+                await client.poll()
+                assert client.text() == '1+1'
+            assert len(factory.guis) == 1
+
+    asyncio.run(main())
+
+def test_requests_without_a_session_are_gone():
+    async def main():
+        async with TestClient(TestServer(build_session_app(_Counter(), token='tok'))) as client:
+            await client.get('/auth/tok')
+            client.session.cookie_jar.clear(lambda cookie: cookie.key == 'session')
+            assert (await client.post('/poll', data=_poll_request(0))).status == 410
+
+    asyncio.run(main())
+
+def test_idle_sessions_are_evicted():
+    factory = _Counter()
+
+    async def main():
+        async with TestClient(TestServer(build_session_app(factory, token='tok', idle_timeout=0.1))) as client:
+            await client.get('/auth/tok')
+            await asyncio.sleep(0.3)
+            assert (await client.post('/poll', data=_poll_request(0))).status == 410
+            # A page load starts afresh.
+            assert (await client.get('/')).status == 200
+            assert (await client.post('/poll', data=_poll_request(0))).status == 200
+            assert len(factory.guis) == 2
+
+    asyncio.run(main())
+
+def test_polling_keeps_sessions_alive():
+    async def main():
+        async with TestClient(TestServer(build_session_app(_Counter(), token='tok', idle_timeout=0.1))) as client:
+            await client.get('/auth/tok')
+            resp = await client.post('/poll', data=_poll_request(0))
+            timestep = element_pb2.PollResponse.FromString(await resp.read()).state.timestep
+            waiting = asyncio.ensure_future(client.post('/poll', data=_poll_request(timestep)))
+            await asyncio.sleep(0.3)
+            assert not waiting.done()
+            waiting.cancel()
+
+    asyncio.run(main())
+
+def test_max_sessions_evicts_the_least_recently_active_idle_session():
+    factory = _Counter()
+
+    async def main():
+        server = TestServer(build_session_app(factory, token='tok', max_sessions=2))
+        [first, second] = [await _connect(server) for _ in range(2)]
+        third = await _connect(server)
+        try:
+            assert (await first.post('/poll', data=_poll_request(0))).status == 410
+            assert (await second.post('/poll', data=_poll_request(0))).status == 200
+            assert (await third.post('/poll', data=_poll_request(0))).status == 200
+        finally:
+            for client in (first, second, third):
+                await client.close()
+
+    asyncio.run(main())
+
+def test_max_sessions_refuses_new_sessions_rather_than_evict_open_ones():
+    factory = _Counter()
+
+    async def main():
+        server = TestServer(build_session_app(factory, token='tok', max_sessions=1))
+        first = await _connect(server)
+        second = TestClient(server)
+        try:
+            resp = await first.post('/poll', data=_poll_request(0))
+            timestep = element_pb2.PollResponse.FromString(await resp.read()).state.timestep
+            waiting = asyncio.ensure_future(first.post('/poll', data=_poll_request(timestep)))
+            await asyncio.sleep(0.05)
+            assert (await second.get('/auth/tok')).status == 503
+            assert not waiting.done()
+            waiting.cancel()
+        finally:
+            await second.close()
+            await first.close()
+
+    asyncio.run(main())
+
+def test_sessions_can_be_traced():
+    async def main():
+        async with TestClient(TestServer(build_session_app(_Counter(), token='tok', tracing=True))) as client:
+            await client.get('/auth/tok')
+            resp = await client.get('/debug/traces')
+            assert resp.status == 200
+            assert (await resp.json())['recent'] == []
+
+    asyncio.run(main())
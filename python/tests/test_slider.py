@@ -0,0 +1,34 @@
+from pytest import raises # type: ignore
+
+from braggle import PointerPad, Slider
+from braggle.protobuf import element_pb2
+
+from . import assert_marks_dirty
+
+def test_construction():
+    Slider()
+    Slider(min=-1, max=1, value=0, step=0.5)
+
+    with raises(ValueError):
+        Slider(min=1, max=0)
+    with raises(ValueError):
+        Slider(max_rate=0)
+
+def test_handle_slide():
+    values = []
+    s = Slider(min=0, max=10, callback=values.append)
+    with assert_marks_dirty(s):
+        s.handle_slide(element_pb2.SlideEvent(element_id=s.id, value=4))
+    assert s.value == 4
+    assert values == [4]
+
+def test_protobuf_advertises_rate_limit():
+    attributes = Slider(max_rate=10).to_protobuf().tag.attributes.misc
+    assert attributes['type'] == 'range'
+    assert float(attributes['data-braggle-max-rate']) == 10
+
+def test_pointer_pad_callback():
+    moves = []
+    p = PointerPad(100, 100, callback=lambda x, y, pressed: moves.append((x, y, pressed)))
+    p.handle_pointer_move(element_pb2.PointerMoveEvent(element_id=p.id, x=3, y=4, pressed=True))
+    assert moves == [(3, 4, True)]
@@ -0,0 +1,39 @@
+from braggle import GUI, StyleSheet
+
+def test_mapping():
+    sheet = StyleSheet({'.a': 'color: red'})
+    sheet['.b'] = 'color: blue'
+    assert dict(sheet) == {'.a': 'color: red', '.b': 'color: blue'}
+    del sheet['.a']
+    assert list(sheet) == ['.b']
+
+def test_rules_render_in_order():
+    sheet = StyleSheet({'.b': 'color: blue', '.a': 'color: red'})
+    sheet['.b'] = 'color: green'
+    gui = GUI()
+    gui.stylesheet.clear()
+    gui.stylesheet.update(sheet)
+    state = gui.updates_since(0)
+    children = state.elements[gui.stylesheet.id].tag.children
+    assert [state.elements[c.ref].tag.children[0].text for c in children] == ['.b { color: green }', '.a { color: red }']
+
+def test_gui_sends_stylesheet():
+    gui = GUI()
+    state = gui.updates_since(0)
+    assert state.stylesheet_id == gui.stylesheet.id
+    assert state.elements[gui.stylesheet.id].tag.tagname == 'div'
+
+def test_changing_a_rule_resends_only_that_rule():
+    gui = GUI()
+    since = gui.time_step
+    gui.stylesheet['.braggle-grid-cell'] = 'border: none'
+    state = gui.updates_since(since)
+    assert len(state.elements) == 1
+    [rule] = state.elements.values()
+    assert rule.tag.children[0].text == '.braggle-grid-cell { border: none }'
+
+def test_adding_a_rule_resends_the_sheet():
+    gui = GUI()
+    since = gui.time_step
+    gui.stylesheet['.new'] = 'color: red'
+    assert gui.stylesheet.id in gui.updates_since(since).elements
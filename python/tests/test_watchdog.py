@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from braggle import GUI, Button
+from braggle.protobuf import element_pb2
+from braggle.server import build_server_app
+from braggle.server._watchdog import Watchdog
+
+def slow_callback():
+    time.sleep(0.3)
+
+def test_blames_slow_callbacks():
+    button = Button('slow', callback=slow_callback)
+    gui = GUI(button)
+    watchdog = Watchdog(threshold=0.1)
+
+    async def main():
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            button.handle_click(element_pb2.ClickEvent(element_id=button.id))
+            await asyncio.sleep(0.1)
+        finally:
+            watchdog.stop()
+
+    asyncio.run(main())
+    [stall] = watchdog.stalls
+    assert 0.2 < stall.duration < 0.4
+    assert stall.culprit == f'Button#{button.id}.handle_click -> slow_callback'
+    assert 'time.sleep(0.3)' in stall.to_json()['stack']
+    assert watchdog.summary()['offenders'][0]['culprit'] == stall.culprit
+
+def test_ignores_short_stalls():
+    watchdog = Watchdog(threshold=0.2)
+
+    async def main():
+        watchdog.start()
+        try:
+            await asyncio.sleep(0.05)
+            time.sleep(0.1)
+            await asyncio.sleep(0.1)
+        finally:
+            watchdog.stop()
+
+    asyncio.run(main())
+    assert not watchdog.stalls
+
+def test_debug_endpoints():
+    async def main():
+        async with TestClient(TestServer(build_server_app(GUI(), token='tok', watchdog=0.1))) as client:
+            await client.get('/auth/tok')
+            assert (await (await client.get('/debug/stalls')).json())['stalls'] == []
+
+            profile = asyncio.ensure_future(client.get('/debug/profile?seconds=0.2'))
+            await asyncio.sleep(0.05)
+            assert (await client.get('/debug/profile?seconds=0.1')).status == 409
+            resp = await profile
+            assert resp.status == 200
+            assert 'function calls' in await resp.text()
+
+            assert (await client.get('/debug/profile?seconds=-1')).status == 400
+
+    asyncio.run(main())
+
+def test_watchdog_is_off_by_default():
+    async def main():
+        async with TestClient(TestServer(build_server_app(GUI(), token='tok'))) as client:
+            await client.get('/auth/tok')
+            assert (await client.get('/debug/stalls')).status == 404
+            assert (await client.get('/debug/profile')).status == 404
+
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+import pytest  # type: ignore
+
+from braggle import (
+    Bold, Button, Chart, CodeBlock, CodeSnippet, Container, Element, Grid, GUI, LineBreak,
+    Link, List, Slider, Text, TextField,
+)
+from braggle.protobuf import element_pb2
+
+def _written(element, since=0):
+    buf = bytearray()
+    element.write_to(buf, since)
+    return bytes(buf)
+
+@pytest.mark.parametrize('make_element', [
+    lambda: Text('hello, ☃'),
+    lambda: Text(''),
+    lambda: Bold('b'),
+    lambda: CodeSnippet('x = 1'),
+    lambda: CodeBlock('x = 1\ny = 2'),
+    lambda: Link(text='here', url='https://example.com'),
+    lambda: Button('go'),
+    lambda: LineBreak(),
+    lambda: TextField(),
+    lambda: Slider(),
+    lambda: Container([Text('a'), Text('b')]),
+    lambda: List([Text(str(i)) for i in range(200)], numbered=True),
+    lambda: Grid([[Text('a'), None], [None, Text('d')]]),
+    lambda: Chart({'s': ([1, 2], [3, 4])}),
+])
+def test_write_to_matches_serialized_protobuf(make_element):
+    element = make_element()
+    GUI(element)
+    assert _written(element) == element.to_protobuf().SerializeToString()
+
+def test_subclasses_that_render_differently_fall_back_to_serializing():
+    class Shouty(Text):
+        def to_protobuf(self):
+            return element_pb2.Element(text=self.text.upper())
+    assert _written(Shouty('hi')) == element_pb2.Element(text='HI').SerializeToString()
+
+def test_subclasses_that_override_properties_write_what_they_render():
+    class Upper(Link):
+        @property
+        def text(self):
+            return super().text.upper()
+        @property
+        def url(self):
+            return 'https://example.com/' + super().url
+    class Shy(Button):
+        @property
+        def text(self):
+            return '...'
+    for element in [Upper(text='hi', url='there'), Shy('go')]:
+        assert _written(element) == element.to_protobuf().SerializeToString()
+
+def test_write_updates_since_matches_updates_since():
+    texts = [Text(str(i)) for i in range(300)]
+    gui = GUI(List(texts), Grid([[Text('a'), None]]), Chart({'s': ([1], [2])}))
+    since = gui.time_step
+    texts[5].text = 'changed'
+
+    for t in (0, since):
+        buf = bytearray()
+        gui.write_updates_since(buf, t)
+        assert element_pb2.PartialServerState.FromString(bytes(buf)) == gui.updates_since(t)
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import time
+
+import pytest  # type: ignore
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from braggle import GUI, Text
+from braggle.protobuf import element_pb2
+from braggle.server._workers import WorkerPool, build_dispatcher_app, start_workers, stop_workers, worker_for_session, worker_socket_paths
+
+def make_gui() -> GUI:
+    return GUI(Text(f'served by {os.getpid()}'))
+
+def test_worker_for_session():
+    assert worker_for_session('1.abc', n_workers=2) == 1
+    assert worker_for_session('2.abc', n_workers=2) is None
+    assert worker_for_session('abc', n_workers=2) is None
+    assert worker_for_session('', n_workers=2) is None
+
+def test_sessions_stick_to_their_workers(tmp_path):
+    processes = start_workers(make_gui, str(tmp_path), n_workers=2, token='tok')
+    try:
+        async def main():
+            pids = []
+            async with TestClient(TestServer(build_dispatcher_app(worker_socket_paths(str(tmp_path), 2)))) as client:
+                for _ in range(4):
+                    client.session.cookie_jar.clear()
+                    assert (await client.get('/auth/tok')).status == 200
+                    session = client.session.cookie_jar.filter_cookies(client.make_url('/'))['session'].value
+                    texts = set()
+                    for _ in range(3):
+                        resp = await client.post('/poll', data=element_pb2.PollRequest().SerializeToString())
+                        assert resp.status == 200
+                        state = element_pb2.PollResponse.FromString(await resp.read()).state
+                        texts |= {e.text for e in state.elements.values() if e.WhichOneof('element_kind') == 'text'}
+                    [text] = texts
+                    pids.append((session.split('.')[0], text))
+            return pids
+
+        pids = asyncio.run(main())
+    finally:
+        stop_workers(processes)
+    # New sessions alternate between the workers, and each session's polls all went to the worker that owns it.
+    assert [worker for (worker, _) in pids] == ['0', '1', '0', '1']
+    assert len({text for (_, text) in pids}) == 2
+    assert dict(pids)['0'] == pids[0][1]
+
+def test_unsupported_options_fail_up_front(tmp_path):
+    with pytest.raises(TypeError):
+        start_workers(make_gui, str(tmp_path), n_workers=1, token='tok', metrics=True)
+
+def test_dead_workers_are_avoided_and_restarted(tmp_path):
+    pool = WorkerPool(make_gui, str(tmp_path), n_workers=2, token='tok', check_interval=0.05)
+    try:
+        async def main():
+            async with TestClient(TestServer(build_dispatcher_app(pool.socket_paths, pool=pool))) as client:
+                assert (await client.get('/auth/tok')).status == 200
+                session = client.session.cookie_jar.filter_cookies(client.make_url('/'))['session'].value
+                worker = int(session.split('.')[0])
+                old_pid = pool.processes[worker].pid
+
+                pool.processes[worker].kill()
+                pool.processes[worker].join()
+                # The session died with its worker, so it's expired, not a bad gateway...
+                resp = await client.post('/poll', data=element_pb2.PollRequest().SerializeToString())
+                assert resp.status == 410
+                # ... and reloading starts a new session on a living worker.
+                assert (await client.get('/')).status == 200
+                assert client.session.cookie_jar.filter_cookies(client.make_url('/'))['session'].value != session
+
+                deadline = time.monotonic() + 30
+                while not pool.is_alive(worker):
+                    assert time.monotonic() < deadline
+                    await asyncio.sleep(0.05)
+                assert pool.processes[worker].pid != old_pid
+
+        asyncio.run(main())
+    finally:
+        pool.stop()